@@ -1,37 +1,90 @@
-from .endpoints import (
-    LineClient,
-    OccupancyClient,
-    VehicleClient,
-    ModeClient,
-    CrowdingClient,
-    PlaceClient,
-    AirQualityClient,
-    SearchClient,
-    StopPointClient,
-    JourneyClient,
-    BikePointClient,
-    AccidentStatsClient,
-    LiftDisruptionsClient,
-    RoadClient
-)
+from typing import TYPE_CHECKING
+from .lazy import lazy_package
+
+if TYPE_CHECKING:
+    from .endpoints import LineClient, OccupancyClient, VehicleClient, ModeClient, CrowdingClient, PlaceClient, AirQualityClient, SearchClient, StopPointClient, JourneyClient, BikePointClient, AccidentStatsClient, LiftDisruptionsClient, RoadClient, AsyncLineClient, AsyncOccupancyClient, AsyncVehicleClient, AsyncModeClient, AsyncCrowdingClient, AsyncPlaceClient, AsyncAirQualityClient, AsyncSearchClient, AsyncStopPointClient, AsyncJourneyClient, AsyncBikePointClient, AsyncAccidentStatsClient, AsyncLiftDisruptionsClient, AsyncRoadClient
+    from .rest_client import RestClient, AsyncRestClient
+    from .package_models import ApiError
+    from .response_cache import ResponseCache, SharedResponseCache
+    from .columnar import Column, to_columns
+    from . import endpoints, models
+
+__getattr__, __dir__ = lazy_package(__name__, {
+    'LineClient': ('.endpoints', 'LineClient'),
+    'OccupancyClient': ('.endpoints', 'OccupancyClient'),
+    'VehicleClient': ('.endpoints', 'VehicleClient'),
+    'ModeClient': ('.endpoints', 'ModeClient'),
+    'CrowdingClient': ('.endpoints', 'CrowdingClient'),
+    'PlaceClient': ('.endpoints', 'PlaceClient'),
+    'AirQualityClient': ('.endpoints', 'AirQualityClient'),
+    'SearchClient': ('.endpoints', 'SearchClient'),
+    'StopPointClient': ('.endpoints', 'StopPointClient'),
+    'JourneyClient': ('.endpoints', 'JourneyClient'),
+    'BikePointClient': ('.endpoints', 'BikePointClient'),
+    'AccidentStatsClient': ('.endpoints', 'AccidentStatsClient'),
+    'LiftDisruptionsClient': ('.endpoints', 'LiftDisruptionsClient'),
+    'RoadClient': ('.endpoints', 'RoadClient'),
+    'AsyncLineClient': ('.endpoints', 'AsyncLineClient'),
+    'AsyncOccupancyClient': ('.endpoints', 'AsyncOccupancyClient'),
+    'AsyncVehicleClient': ('.endpoints', 'AsyncVehicleClient'),
+    'AsyncModeClient': ('.endpoints', 'AsyncModeClient'),
+    'AsyncCrowdingClient': ('.endpoints', 'AsyncCrowdingClient'),
+    'AsyncPlaceClient': ('.endpoints', 'AsyncPlaceClient'),
+    'AsyncAirQualityClient': ('.endpoints', 'AsyncAirQualityClient'),
+    'AsyncSearchClient': ('.endpoints', 'AsyncSearchClient'),
+    'AsyncStopPointClient': ('.endpoints', 'AsyncStopPointClient'),
+    'AsyncJourneyClient': ('.endpoints', 'AsyncJourneyClient'),
+    'AsyncBikePointClient': ('.endpoints', 'AsyncBikePointClient'),
+    'AsyncAccidentStatsClient': ('.endpoints', 'AsyncAccidentStatsClient'),
+    'AsyncLiftDisruptionsClient': ('.endpoints', 'AsyncLiftDisruptionsClient'),
+    'AsyncRoadClient': ('.endpoints', 'AsyncRoadClient'),
+    'RestClient': ('.rest_client', 'RestClient'),
+    'AsyncRestClient': ('.rest_client', 'AsyncRestClient'),
+    'ApiError': ('.package_models', 'ApiError'),
+    'ResponseCache': ('.response_cache', 'ResponseCache'),
+    'SharedResponseCache': ('.response_cache', 'SharedResponseCache'),
+    'Column': ('.columnar', 'Column'),
+    'to_columns': ('.columnar', 'to_columns'),
+    'endpoints': ('.endpoints', None),
+    'models': ('.models', None),
+})
 
-from .rest_client import RestClient
-from .package_models import ApiError
 __all__ = [
-    'LineClient',
-    'OccupancyClient',
-    'VehicleClient',
-    'ModeClient',
-    'CrowdingClient',
-    'PlaceClient',
-    'AirQualityClient',
-    'SearchClient',
-    'StopPointClient',
-    'JourneyClient',
-    'BikePointClient',
-    'AccidentStatsClient',
-    'LiftDisruptionsClient',
-    'RoadClient',
-    'RestClient',
-    'ApiError'
+    "LineClient",
+    "OccupancyClient",
+    "VehicleClient",
+    "ModeClient",
+    "CrowdingClient",
+    "PlaceClient",
+    "AirQualityClient",
+    "SearchClient",
+    "StopPointClient",
+    "JourneyClient",
+    "BikePointClient",
+    "AccidentStatsClient",
+    "LiftDisruptionsClient",
+    "RoadClient",
+    "AsyncLineClient",
+    "AsyncOccupancyClient",
+    "AsyncVehicleClient",
+    "AsyncModeClient",
+    "AsyncCrowdingClient",
+    "AsyncPlaceClient",
+    "AsyncAirQualityClient",
+    "AsyncSearchClient",
+    "AsyncStopPointClient",
+    "AsyncJourneyClient",
+    "AsyncBikePointClient",
+    "AsyncAccidentStatsClient",
+    "AsyncLiftDisruptionsClient",
+    "AsyncRoadClient",
+    "RestClient",
+    "AsyncRestClient",
+    "ApiError",
+    "ResponseCache",
+    "SharedResponseCache",
+    "Column",
+    "to_columns",
+    "endpoints",
+    "models"
 ]
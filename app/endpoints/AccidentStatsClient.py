@@ -1,15 +1,43 @@
-from ..Client import Client
+from ..Client import Client, AsyncClient
 from .AccidentStatsClient_config import endpoints
 from .. import models
-from ..package_models import ApiError
+from ..package_models import ApiError, ResponseModel
 
 class AccidentStatsClient(Client):
-    def get(self, year: int) -> models.AccidentDetailArray | ApiError:
+    def get(self, year: int, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.AccidentDetailArray | ApiError:
         '''
         Gets all accident details for accidents occuring in the specified year
 
         Parameters:
         year: int - Format - int32. The year for which to filter the accidents on.. Example: 2017
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['AccidentStats_Get'], params=[year], endpoint_args=None)
+        return self._send_request_and_deserialize(endpoints['AccidentStats_Get'], params=[year], endpoint_args=None, raw=raw, fields=fields)
 
+    def getstream(self, year: int, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `get`: `ResponseModel.content` is an iterator over the items
+        of `models.AccidentDetailArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['AccidentStats_Get'], params=[year], endpoint_args=None, fields=fields)
+
+
+class AsyncAccidentStatsClient(AsyncClient):
+    async def get(self, year: int, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.AccidentDetailArray | ApiError:
+        '''
+        Gets all accident details for accidents occuring in the specified year
+
+        Parameters:
+        year: int - Format - int32. The year for which to filter the accidents on.. Example: 2017
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['AccidentStats_Get'], params=[year], endpoint_args=None, raw=raw, fields=fields)
+
+    async def getstream(self, year: int, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `get`: `ResponseModel.content` is an async iterator over the items
+        of `models.AccidentDetailArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['AccidentStats_Get'], params=[year], endpoint_args=None, fields=fields)
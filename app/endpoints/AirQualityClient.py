@@ -1,15 +1,27 @@
-from ..Client import Client
+from ..Client import Client, AsyncClient
 from .AirQualityClient_config import endpoints
 from .. import models
-from ..package_models import ApiError
+from ..package_models import ApiError, ResponseModel
 
 class AirQualityClient(Client):
-    def get(self, ) -> models.LondonAirForecast | ApiError:
+    def get(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.LondonAirForecast | ApiError:
         '''
         Gets air quality data feed
 
         Parameters:
-        No parameters required.
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['AirQuality_Get'], endpoint_args=None)
+        return self._send_request_and_deserialize(endpoints['AirQuality_Get'], endpoint_args=None, raw=raw, fields=fields)
 
+
+class AsyncAirQualityClient(AsyncClient):
+    async def get(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.LondonAirForecast | ApiError:
+        '''
+        Gets air quality data feed
+
+        Parameters:
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['AirQuality_Get'], endpoint_args=None, raw=raw, fields=fields)
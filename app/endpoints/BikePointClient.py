@@ -1,29 +1,39 @@
-from ..Client import Client
+from ..Client import Client, AsyncClient
 from .BikePointClient_config import endpoints
 from .. import models
-from ..package_models import ApiError
+from ..package_models import ApiError, ResponseModel
 
 class BikePointClient(Client):
-    def getall(self, ) -> models.PlaceArray | ApiError:
+    def getall(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.PlaceArray | ApiError:
         '''
         Gets all bike point locations. The Place object has an addtionalProperties array which contains the nbBikes, nbDocks and nbSpaces
             numbers which give the status of the BikePoint. A mismatch in these numbers i.e. nbDocks - (nbBikes + nbSpaces) != 0 indicates broken docks.
 
         Parameters:
-        No parameters required.
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['BikePoint_GetAll'], endpoint_args=None)
+        return self._send_request_and_deserialize(endpoints['BikePoint_GetAll'], endpoint_args=None, raw=raw, fields=fields)
 
-    def get(self, id: str) -> models.Place | ApiError:
+    def getallstream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `getall`: `ResponseModel.content` is an iterator over the items
+        of `models.PlaceArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['BikePoint_GetAll'], endpoint_args=None, fields=fields)
+
+    def get(self, id: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.Place | ApiError:
         '''
         Gets the bike point with the given id.
 
         Parameters:
         id: str - A bike point id (a list of ids can be obtained from the above BikePoint call). Example: BikePoints_583
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['BikePoint_Get'], params=[id], endpoint_args=None)
+        return self._send_request_and_deserialize(endpoints['BikePoint_Get'], params=[id], endpoint_args=None, raw=raw, fields=fields)
 
-    def search(self, query: str) -> models.PlaceArray | ApiError:
+    def search(self, query: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.PlaceArray | ApiError:
         '''
         Search for bike stations by their name, a bike point's name often contains information about the name of the street
             or nearby landmarks, for example. Note that the search result does not contain the PlaceProperties i.e. the status
@@ -31,6 +41,65 @@ class BikePointClient(Client):
 
         Parameters:
         query: str - The search term e.g. "St. James". Example: London
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return self._send_request_and_deserialize(endpoints['BikePoint_Search'], endpoint_args={ 'query': query }, raw=raw, fields=fields)
+
+    def searchstream(self, query: str, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `search`: `ResponseModel.content` is an iterator over the items
+        of `models.PlaceArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['BikePoint_Search'], endpoint_args={ 'query': query }, fields=fields)
+
+
+class AsyncBikePointClient(AsyncClient):
+    async def getall(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.PlaceArray | ApiError:
         '''
-        return self._send_request_and_deserialize(endpoints['BikePoint_Search'], endpoint_args={ 'query': query })
+        Gets all bike point locations. The Place object has an addtionalProperties array which contains the nbBikes, nbDocks and nbSpaces
+            numbers which give the status of the BikePoint. A mismatch in these numbers i.e. nbDocks - (nbBikes + nbSpaces) != 0 indicates broken docks.
+
+        Parameters:
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['BikePoint_GetAll'], endpoint_args=None, raw=raw, fields=fields)
 
+    async def getallstream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `getall`: `ResponseModel.content` is an async iterator over the items
+        of `models.PlaceArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['BikePoint_GetAll'], endpoint_args=None, fields=fields)
+
+    async def get(self, id: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.Place | ApiError:
+        '''
+        Gets the bike point with the given id.
+
+        Parameters:
+        id: str - A bike point id (a list of ids can be obtained from the above BikePoint call). Example: BikePoints_583
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['BikePoint_Get'], params=[id], endpoint_args=None, raw=raw, fields=fields)
+
+    async def search(self, query: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.PlaceArray | ApiError:
+        '''
+        Search for bike stations by their name, a bike point's name often contains information about the name of the street
+            or nearby landmarks, for example. Note that the search result does not contain the PlaceProperties i.e. the status
+            or occupancy of the BikePoint, to get that information you should retrieve the BikePoint by its id on /BikePoint/id.
+
+        Parameters:
+        query: str - The search term e.g. "St. James". Example: London
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['BikePoint_Search'], endpoint_args={ 'query': query }, raw=raw, fields=fields)
+
+    async def searchstream(self, query: str, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `search`: `ResponseModel.content` is an async iterator over the items
+        of `models.PlaceArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['BikePoint_Search'], endpoint_args={ 'query': query }, fields=fields)
@@ -1,34 +1,75 @@
-from ..Client import Client
+from ..Client import Client, AsyncClient
 from .CrowdingClient_config import endpoints
 from .. import models
-from ..package_models import ApiError
+from ..package_models import ApiError, ResponseModel
 
 class CrowdingClient(Client):
-    def naptan(self, Naptan: str) -> models.GenericResponseModel | ApiError:
+    def naptan(self, Naptan: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.GenericResponseModel | ApiError:
         '''
         Returns crowding information for Naptan
 
         Parameters:
         Naptan: str - Naptan code. Example: 940GZZLUBND
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['naptan'], params=[Naptan], endpoint_args=None)
+        return self._send_request_and_deserialize(endpoints['naptan'], params=[Naptan], endpoint_args=None, raw=raw, fields=fields)
 
-    def dayofweek(self, Naptan: str, DayOfWeek: str) -> models.GenericResponseModel | ApiError:
+    def dayofweek(self, Naptan: str, DayOfWeek: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.GenericResponseModel | ApiError:
         '''
         Returns crowding information for Naptan for Day of Week
 
         Parameters:
         Naptan: str - Naptan code. Example: 940GZZLUBND
         DayOfWeek: str - Day of week. Example: Wed
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['dayofweek'], params=[Naptan, DayOfWeek], endpoint_args=None)
+        return self._send_request_and_deserialize(endpoints['dayofweek'], params=[Naptan, DayOfWeek], endpoint_args=None, raw=raw, fields=fields)
 
-    def live(self, Naptan: str) -> models.GenericResponseModel | ApiError:
+    def live(self, Naptan: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.GenericResponseModel | ApiError:
         '''
         Returns live crowding information for Naptan
 
         Parameters:
         Naptan: str - Naptan code. Example: 940GZZLUBND
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['live'], params=[Naptan], endpoint_args=None)
+        return self._send_request_and_deserialize(endpoints['live'], params=[Naptan], endpoint_args=None, raw=raw, fields=fields)
 
+
+class AsyncCrowdingClient(AsyncClient):
+    async def naptan(self, Naptan: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.GenericResponseModel | ApiError:
+        '''
+        Returns crowding information for Naptan
+
+        Parameters:
+        Naptan: str - Naptan code. Example: 940GZZLUBND
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['naptan'], params=[Naptan], endpoint_args=None, raw=raw, fields=fields)
+
+    async def dayofweek(self, Naptan: str, DayOfWeek: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.GenericResponseModel | ApiError:
+        '''
+        Returns crowding information for Naptan for Day of Week
+
+        Parameters:
+        Naptan: str - Naptan code. Example: 940GZZLUBND
+        DayOfWeek: str - Day of week. Example: Wed
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['dayofweek'], params=[Naptan, DayOfWeek], endpoint_args=None, raw=raw, fields=fields)
+
+    async def live(self, Naptan: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.GenericResponseModel | ApiError:
+        '''
+        Returns live crowding information for Naptan
+
+        Parameters:
+        Naptan: str - Naptan code. Example: 940GZZLUBND
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['live'], params=[Naptan], endpoint_args=None, raw=raw, fields=fields)
@@ -1,15 +1,41 @@
-from ..Client import Client
+from ..Client import Client, AsyncClient
 from .LiftDisruptionsClient_config import endpoints
 from .. import models
-from ..package_models import ApiError
+from ..package_models import ApiError, ResponseModel
 
 class LiftDisruptionsClient(Client):
-    def get(self, ) -> models.LiftDisruptionsArray | ApiError:
+    def get(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.LiftDisruptionsArray | ApiError:
         '''
         List of all currently disrupted lift routes
 
         Parameters:
-        No parameters required.
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['get'], endpoint_args=None)
+        return self._send_request_and_deserialize(endpoints['get'], endpoint_args=None, raw=raw, fields=fields)
 
+    def getstream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `get`: `ResponseModel.content` is an iterator over the items
+        of `models.LiftDisruptionsArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['get'], endpoint_args=None, fields=fields)
+
+
+class AsyncLiftDisruptionsClient(AsyncClient):
+    async def get(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.LiftDisruptionsArray | ApiError:
+        '''
+        List of all currently disrupted lift routes
+
+        Parameters:
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['get'], endpoint_args=None, raw=raw, fields=fields)
+
+    async def getstream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `get`: `ResponseModel.content` is an async iterator over the items
+        of `models.LiftDisruptionsArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['get'], endpoint_args=None, fields=fields)
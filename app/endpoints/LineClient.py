@@ -1,93 +1,187 @@
-from ..Client import Client
+from ..Client import Client, AsyncClient
 from .LineClient_config import endpoints
 from .. import models
-from ..package_models import ApiError
+from ..package_models import ApiError, ResponseModel, BatchResponseModel
+from typing import List
 
 class LineClient(Client):
-    def metamodes(self, ) -> models.ModeArray | ApiError:
+    def metamodes(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.ModeArray | ApiError:
         '''
         Gets a list of valid modes
 
         Parameters:
-        No parameters required.
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Line_MetaModes'], endpoint_args=None)
+        return self._send_request_and_deserialize(endpoints['Line_MetaModes'], endpoint_args=None, raw=raw, fields=fields)
 
-    def metaseverity(self, ) -> models.StatusSeveritiesArray | ApiError:
+    def metamodesstream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `metamodes`: `ResponseModel.content` is an iterator over the items
+        of `models.ModeArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['Line_MetaModes'], endpoint_args=None, fields=fields)
+
+    def metaseverity(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.StatusSeveritiesArray | ApiError:
         '''
         Gets a list of valid severity codes
 
         Parameters:
-        No parameters required.
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return self._send_request_and_deserialize(endpoints['Line_MetaSeverity'], endpoint_args=None, raw=raw, fields=fields)
+
+    def metaseveritystream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `metaseverity`: `ResponseModel.content` is an iterator over the items
+        of `models.StatusSeveritiesArray`, each validated as soon as it has been received. Responses are not cached.
         '''
-        return self._send_request_and_deserialize(endpoints['Line_MetaSeverity'], endpoint_args=None)
+        return self._stream_request_and_deserialize(endpoints['Line_MetaSeverity'], endpoint_args=None, fields=fields)
 
-    def metadisruptioncategories(self, ) -> models.StringsArray | ApiError:
+    def metadisruptioncategories(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.StringsArray | ApiError:
         '''
         Gets a list of valid disruption categories
 
         Parameters:
-        No parameters required.
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Line_MetaDisruptionCategories'], endpoint_args=None)
+        return self._send_request_and_deserialize(endpoints['Line_MetaDisruptionCategories'], endpoint_args=None, raw=raw, fields=fields)
 
-    def metaservicetypes(self, ) -> models.StringsArray | ApiError:
+    def metadisruptioncategoriesstream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `metadisruptioncategories`: `ResponseModel.content` is an iterator over the items
+        of `models.StringsArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['Line_MetaDisruptionCategories'], endpoint_args=None, fields=fields)
+
+    def metaservicetypes(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.StringsArray | ApiError:
         '''
         Gets a list of valid ServiceTypes to filter on
 
         Parameters:
-        No parameters required.
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Line_MetaServiceTypes'], endpoint_args=None)
+        return self._send_request_and_deserialize(endpoints['Line_MetaServiceTypes'], endpoint_args=None, raw=raw, fields=fields)
 
-    def getbypathids(self, ids: str) -> models.LineArray | ApiError:
+    def metaservicetypesstream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `metaservicetypes`: `ResponseModel.content` is an iterator over the items
+        of `models.StringsArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['Line_MetaServiceTypes'], endpoint_args=None, fields=fields)
+
+    def getbypathids(self, ids: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.LineArray | ApiError:
         '''
         Gets lines that match the specified line ids.
 
         Parameters:
         ids: str - A comma-separated list of line ids e.g. victoria,circle,N133. Max. approx. 20 ids.. Example: victoria
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return self._send_request_and_deserialize(endpoints['Line_GetByPathIds'], params=[ids], endpoint_args=None, raw=raw, fields=fields)
+
+    def getbypathidsstream(self, ids: str, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `getbypathids`: `ResponseModel.content` is an iterator over the items
+        of `models.LineArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['Line_GetByPathIds'], params=[ids], endpoint_args=None, fields=fields)
+
+    def getbypathidsbatch(self, ids: List[str], chunk_size: int = 20) -> BatchResponseModel:
+        '''
+        Batch variant of `getbypathids`: splits `ids` into chunks of at most `chunk_size` ids,
+        requests the chunks concurrently and merges them into one `models.LineArray`.
+        Chunks that fail are reported in `BatchResponseModel.errors`.
         '''
-        return self._send_request_and_deserialize(endpoints['Line_GetByPathIds'], params=[ids], endpoint_args=None)
+        return self._send_batched_request_and_deserialize(endpoints['Line_GetByPathIds'], ids, chunk_size, params=[ids], ids_index=0, endpoint_args=None)
 
-    def getbymodebypathmodes(self, modes: str) -> models.LineArray | ApiError:
+    def getbymodebypathmodes(self, modes: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.LineArray | ApiError:
         '''
         Gets lines that serve the given modes.
 
         Parameters:
         modes: str - A comma-separated list of modes e.g. tube,dlr. Example: tube
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return self._send_request_and_deserialize(endpoints['Line_GetByModeByPathModes'], params=[modes], endpoint_args=None, raw=raw, fields=fields)
+
+    def getbymodebypathmodesstream(self, modes: str, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `getbymodebypathmodes`: `ResponseModel.content` is an iterator over the items
+        of `models.LineArray`, each validated as soon as it has been received. Responses are not cached.
         '''
-        return self._send_request_and_deserialize(endpoints['Line_GetByModeByPathModes'], params=[modes], endpoint_args=None)
+        return self._stream_request_and_deserialize(endpoints['Line_GetByModeByPathModes'], params=[modes], endpoint_args=None, fields=fields)
 
-    def routebyqueryservicetypes(self, serviceTypes: str | None = None) -> models.LineArray | ApiError:
+    def routebyqueryservicetypes(self, serviceTypes: str | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.LineArray | ApiError:
         '''
         Get all valid routes for all lines, including the name and id of the originating and terminating stops for each route.
 
         Parameters:
         serviceTypes: str - A comma seperated list of service types to filter on. Supported values: Regular, Night. Defaulted to 'Regular' if not specified. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Line_RouteByQueryServiceTypes'], endpoint_args={ 'serviceTypes': serviceTypes })
+        return self._send_request_and_deserialize(endpoints['Line_RouteByQueryServiceTypes'], endpoint_args={ 'serviceTypes': serviceTypes }, raw=raw, fields=fields)
 
-    def lineroutesbyidsbypathidsqueryservicetypes(self, ids: str, serviceTypes: str | None = None) -> models.LineArray | ApiError:
+    def routebyqueryservicetypesstream(self, serviceTypes: str | None = None, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `routebyqueryservicetypes`: `ResponseModel.content` is an iterator over the items
+        of `models.LineArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['Line_RouteByQueryServiceTypes'], endpoint_args={ 'serviceTypes': serviceTypes }, fields=fields)
+
+    def lineroutesbyidsbypathidsqueryservicetypes(self, ids: str, serviceTypes: str | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.LineArray | ApiError:
         '''
         Get all valid routes for given line ids, including the name and id of the originating and terminating stops for each route.
 
         Parameters:
         ids: str - A comma-separated list of line ids e.g. victoria,circle,N133. Max. approx. 20 ids.. Example: victoria
         serviceTypes: str - A comma seperated list of service types to filter on. Supported values: Regular, Night. Defaulted to 'Regular' if not specified. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return self._send_request_and_deserialize(endpoints['Line_LineRoutesByIdsByPathIdsQueryServiceTypes'], params=[ids], endpoint_args={ 'serviceTypes': serviceTypes }, raw=raw, fields=fields)
+
+    def lineroutesbyidsbypathidsqueryservicetypesstream(self, ids: str, serviceTypes: str | None = None, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
         '''
-        return self._send_request_and_deserialize(endpoints['Line_LineRoutesByIdsByPathIdsQueryServiceTypes'], params=[ids], endpoint_args={ 'serviceTypes': serviceTypes })
+        Streaming variant of `lineroutesbyidsbypathidsqueryservicetypes`: `ResponseModel.content` is an iterator over the items
+        of `models.LineArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['Line_LineRoutesByIdsByPathIdsQueryServiceTypes'], params=[ids], endpoint_args={ 'serviceTypes': serviceTypes }, fields=fields)
 
-    def routebymodebypathmodesqueryservicetypes(self, modes: str, serviceTypes: str | None = None) -> models.LineArray | ApiError:
+    def lineroutesbyidsbypathidsqueryservicetypesbatch(self, ids: List[str], serviceTypes: str | None = None, chunk_size: int = 20) -> BatchResponseModel:
+        '''
+        Batch variant of `lineroutesbyidsbypathidsqueryservicetypes`: splits `ids` into chunks of at most `chunk_size` ids,
+        requests the chunks concurrently and merges them into one `models.LineArray`.
+        Chunks that fail are reported in `BatchResponseModel.errors`.
+        '''
+        return self._send_batched_request_and_deserialize(endpoints['Line_LineRoutesByIdsByPathIdsQueryServiceTypes'], ids, chunk_size, params=[ids], ids_index=0, endpoint_args={ 'serviceTypes': serviceTypes })
+
+    def routebymodebypathmodesqueryservicetypes(self, modes: str, serviceTypes: str | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.LineArray | ApiError:
         '''
         Gets all lines and their valid routes for given modes, including the name and id of the originating and terminating stops for each route
 
         Parameters:
         modes: str - A comma-separated list of modes e.g. tube,dlr. Example: tube
         serviceTypes: str - A comma seperated list of service types to filter on. Supported values: Regular, Night. Defaulted to 'Regular' if not specified. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return self._send_request_and_deserialize(endpoints['Line_RouteByModeByPathModesQueryServiceTypes'], params=[modes], endpoint_args={ 'serviceTypes': serviceTypes }, raw=raw, fields=fields)
+
+    def routebymodebypathmodesqueryservicetypesstream(self, modes: str, serviceTypes: str | None = None, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `routebymodebypathmodesqueryservicetypes`: `ResponseModel.content` is an iterator over the items
+        of `models.LineArray`, each validated as soon as it has been received. Responses are not cached.
         '''
-        return self._send_request_and_deserialize(endpoints['Line_RouteByModeByPathModesQueryServiceTypes'], params=[modes], endpoint_args={ 'serviceTypes': serviceTypes })
+        return self._stream_request_and_deserialize(endpoints['Line_RouteByModeByPathModesQueryServiceTypes'], params=[modes], endpoint_args={ 'serviceTypes': serviceTypes }, fields=fields)
 
-    def routesequencebypathidpathdirectionqueryservicetypesqueryexcludecrowding(self, id: str, direction: str, serviceTypes: str | None = None, excludeCrowding: bool | None = None) -> models.RouteSequence | ApiError:
+    def routesequencebypathidpathdirectionqueryservicetypesqueryexcludecrowding(self, id: str, direction: str, serviceTypes: str | None = None, excludeCrowding: bool | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.RouteSequence | ApiError:
         '''
         Gets all valid routes for given line id, including the sequence of stops on each route.
 
@@ -96,10 +190,12 @@ class LineClient(Client):
         direction: str - The direction of travel. Can be inbound or outbound.. Example: inbound
         serviceTypes: str - A comma seperated list of service types to filter on. Supported values: Regular, Night. Defaulted to 'Regular' if not specified. Example: None given
         excludeCrowding: bool - That excludes crowding from line disruptions. Can be true or false.. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Line_RouteSequenceByPathIdPathDirectionQueryServiceTypesQueryExcludeCrowding'], params=[id, direction], endpoint_args={ 'serviceTypes': serviceTypes, 'excludeCrowding': excludeCrowding })
+        return self._send_request_and_deserialize(endpoints['Line_RouteSequenceByPathIdPathDirectionQueryServiceTypesQueryExcludeCrowding'], params=[id, direction], endpoint_args={ 'serviceTypes': serviceTypes, 'excludeCrowding': excludeCrowding }, raw=raw, fields=fields)
 
-    def statusbypathidspathstartdatepathenddatequerydetail(self, ids: str, startDate: str, endDate: str, detail: bool | None = None) -> models.LineArray | ApiError:
+    def statusbypathidspathstartdatepathenddatequerydetail(self, ids: str, startDate: str, endDate: str, detail: bool | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.LineArray | ApiError:
         '''
         Gets the line status for given line ids during the provided dates e.g Minor Delays
 
@@ -108,20 +204,54 @@ class LineClient(Client):
         startDate: str - Format - date-time (as date-time in RFC3339). Start date for start of the period. Example: 2024-03-01
         endDate: str - Format - date-time (as date-time in RFC3339). End date for the period that the disruption will fall within to be included in the results. Example: 2024-03-31
         detail: bool - Include details of the disruptions that are causing the line status including the affected stops and routes. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return self._send_request_and_deserialize(endpoints['Line_StatusByPathIdsPathStartDatePathEndDateQueryDetail'], params=[ids, startDate, endDate], endpoint_args={ 'detail': detail }, raw=raw, fields=fields)
+
+    def statusbypathidspathstartdatepathenddatequerydetailstream(self, ids: str, startDate: str, endDate: str, detail: bool | None = None, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `statusbypathidspathstartdatepathenddatequerydetail`: `ResponseModel.content` is an iterator over the items
+        of `models.LineArray`, each validated as soon as it has been received. Responses are not cached.
         '''
-        return self._send_request_and_deserialize(endpoints['Line_StatusByPathIdsPathStartDatePathEndDateQueryDetail'], params=[ids, startDate, endDate], endpoint_args={ 'detail': detail })
+        return self._stream_request_and_deserialize(endpoints['Line_StatusByPathIdsPathStartDatePathEndDateQueryDetail'], params=[ids, startDate, endDate], endpoint_args={ 'detail': detail }, fields=fields)
 
-    def statusbyidsbypathidsquerydetail(self, ids: str, detail: bool | None = None) -> models.LineArray | ApiError:
+    def statusbypathidspathstartdatepathenddatequerydetailbatch(self, ids: List[str], startDate: str, endDate: str, detail: bool | None = None, chunk_size: int = 20) -> BatchResponseModel:
+        '''
+        Batch variant of `statusbypathidspathstartdatepathenddatequerydetail`: splits `ids` into chunks of at most `chunk_size` ids,
+        requests the chunks concurrently and merges them into one `models.LineArray`.
+        Chunks that fail are reported in `BatchResponseModel.errors`.
+        '''
+        return self._send_batched_request_and_deserialize(endpoints['Line_StatusByPathIdsPathStartDatePathEndDateQueryDetail'], ids, chunk_size, params=[ids, startDate, endDate], ids_index=0, endpoint_args={ 'detail': detail })
+
+    def statusbyidsbypathidsquerydetail(self, ids: str, detail: bool | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.LineArray | ApiError:
         '''
         Gets the line status of for given line ids e.g Minor Delays
 
         Parameters:
         ids: str - A comma-separated list of line ids e.g. victoria,circle,N133. Max. approx. 20 ids.. Example: victoria
         detail: bool - Include details of the disruptions that are causing the line status including the affected stops and routes. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return self._send_request_and_deserialize(endpoints['Line_StatusByIdsByPathIdsQueryDetail'], params=[ids], endpoint_args={ 'detail': detail }, raw=raw, fields=fields)
+
+    def statusbyidsbypathidsquerydetailstream(self, ids: str, detail: bool | None = None, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
         '''
-        return self._send_request_and_deserialize(endpoints['Line_StatusByIdsByPathIdsQueryDetail'], params=[ids], endpoint_args={ 'detail': detail })
+        Streaming variant of `statusbyidsbypathidsquerydetail`: `ResponseModel.content` is an iterator over the items
+        of `models.LineArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['Line_StatusByIdsByPathIdsQueryDetail'], params=[ids], endpoint_args={ 'detail': detail }, fields=fields)
+
+    def statusbyidsbypathidsquerydetailbatch(self, ids: List[str], detail: bool | None = None, chunk_size: int = 20) -> BatchResponseModel:
+        '''
+        Batch variant of `statusbyidsbypathidsquerydetail`: splits `ids` into chunks of at most `chunk_size` ids,
+        requests the chunks concurrently and merges them into one `models.LineArray`.
+        Chunks that fail are reported in `BatchResponseModel.errors`.
+        '''
+        return self._send_batched_request_and_deserialize(endpoints['Line_StatusByIdsByPathIdsQueryDetail'], ids, chunk_size, params=[ids], ids_index=0, endpoint_args={ 'detail': detail })
 
-    def searchbypathqueryquerymodesqueryservicetypes(self, query: str, modes: list | None = None, serviceTypes: str | None = None) -> models.RouteSearchResponse | ApiError:
+    def searchbypathqueryquerymodesqueryservicetypes(self, query: str, modes: list | None = None, serviceTypes: str | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.RouteSearchResponse | ApiError:
         '''
         Search for lines or routes matching the query string
 
@@ -129,19 +259,30 @@ class LineClient(Client):
         query: str - Search term e.g victoria. Example: victoria
         modes: list - Optionally filter by the specified modes. Example: None given
         serviceTypes: str - A comma seperated list of service types to filter on. Supported values: Regular, Night. Defaulted to 'Regular' if not specified. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Line_SearchByPathQueryQueryModesQueryServiceTypes'], params=[query], endpoint_args={ 'modes': modes, 'serviceTypes': serviceTypes })
+        return self._send_request_and_deserialize(endpoints['Line_SearchByPathQueryQueryModesQueryServiceTypes'], params=[query], endpoint_args={ 'modes': modes, 'serviceTypes': serviceTypes }, raw=raw, fields=fields)
 
-    def statusbyseveritybypathseverity(self, severity: int) -> models.LineArray | ApiError:
+    def statusbyseveritybypathseverity(self, severity: int, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.LineArray | ApiError:
         '''
         Gets the line status for all lines with a given severity A list of valid severity codes can be obtained from a call to Line/Meta/Severity
 
         Parameters:
         severity: int - Format - int32. The level of severity (eg: a number from 0 to 14). Example: 2
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Line_StatusBySeverityByPathSeverity'], params=[severity], endpoint_args=None)
+        return self._send_request_and_deserialize(endpoints['Line_StatusBySeverityByPathSeverity'], params=[severity], endpoint_args=None, raw=raw, fields=fields)
 
-    def statusbymodebypathmodesquerydetailqueryseveritylevel(self, modes: str, detail: bool | None = None, severityLevel: str | None = None) -> models.LineArray | ApiError:
+    def statusbyseveritybypathseveritystream(self, severity: int, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `statusbyseveritybypathseverity`: `ResponseModel.content` is an iterator over the items
+        of `models.LineArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['Line_StatusBySeverityByPathSeverity'], params=[severity], endpoint_args=None, fields=fields)
+
+    def statusbymodebypathmodesquerydetailqueryseveritylevel(self, modes: str, detail: bool | None = None, severityLevel: str | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.LineArray | ApiError:
         '''
         Gets the line status of for all lines for the given modes
 
@@ -149,30 +290,50 @@ class LineClient(Client):
         modes: str - A comma-separated list of modes to filter by. e.g. tube,dlr. Example: tube
         detail: bool - Include details of the disruptions that are causing the line status including the affected stops and routes. Example: None given
         severityLevel: str - If specified, ensures that only those line status(es) are returned within the lines that have disruptions with the matching severity level.. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Line_StatusByModeByPathModesQueryDetailQuerySeverityLevel'], params=[modes], endpoint_args={ 'detail': detail, 'severityLevel': severityLevel })
+        return self._send_request_and_deserialize(endpoints['Line_StatusByModeByPathModesQueryDetailQuerySeverityLevel'], params=[modes], endpoint_args={ 'detail': detail, 'severityLevel': severityLevel }, raw=raw, fields=fields)
 
-    def stoppointsbypathidquerytfloperatednationalrailstationsonly(self, id: str, tflOperatedNationalRailStationsOnly: bool | None = None) -> models.StopPointArray | ApiError:
+    def statusbymodebypathmodesquerydetailqueryseveritylevelstream(self, modes: str, detail: bool | None = None, severityLevel: str | None = None, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `statusbymodebypathmodesquerydetailqueryseveritylevel`: `ResponseModel.content` is an iterator over the items
+        of `models.LineArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['Line_StatusByModeByPathModesQueryDetailQuerySeverityLevel'], params=[modes], endpoint_args={ 'detail': detail, 'severityLevel': severityLevel }, fields=fields)
+
+    def stoppointsbypathidquerytfloperatednationalrailstationsonly(self, id: str, tflOperatedNationalRailStationsOnly: bool | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.StopPointArray | ApiError:
         '''
         Gets a list of the stations that serve the given line id
 
         Parameters:
         id: str - A single line id e.g. victoria. Example: victoria
         tflOperatedNationalRailStationsOnly: bool - If the national-rail line is requested, this flag will filter the national rail stations so that only those operated by TfL are returned. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Line_StopPointsByPathIdQueryTflOperatedNationalRailStationsOnly'], params=[id], endpoint_args={ 'tflOperatedNationalRailStationsOnly': tflOperatedNationalRailStationsOnly })
+        return self._send_request_and_deserialize(endpoints['Line_StopPointsByPathIdQueryTflOperatedNationalRailStationsOnly'], params=[id], endpoint_args={ 'tflOperatedNationalRailStationsOnly': tflOperatedNationalRailStationsOnly }, raw=raw, fields=fields)
 
-    def timetablebypathfromstoppointidpathid(self, fromStopPointId: str, id: str) -> models.TimetableResponse | ApiError:
+    def stoppointsbypathidquerytfloperatednationalrailstationsonlystream(self, id: str, tflOperatedNationalRailStationsOnly: bool | None = None, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `stoppointsbypathidquerytfloperatednationalrailstationsonly`: `ResponseModel.content` is an iterator over the items
+        of `models.StopPointArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['Line_StopPointsByPathIdQueryTflOperatedNationalRailStationsOnly'], params=[id], endpoint_args={ 'tflOperatedNationalRailStationsOnly': tflOperatedNationalRailStationsOnly }, fields=fields)
+
+    def timetablebypathfromstoppointidpathid(self, fromStopPointId: str, id: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.TimetableResponse | ApiError:
         '''
         Gets the timetable for a specified station on the give line
 
         Parameters:
         fromStopPointId: str - The originating station's stop point id (station naptan code e.g. 940GZZLUASL, you can use /StopPoint/Search/{query} endpoint to find a stop point id from a station name). Example: 940GZZLUVIC
         id: str - A single line id e.g. victoria. Example: victoria
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Line_TimetableByPathFromStopPointIdPathId'], params=[fromStopPointId, id], endpoint_args=None)
+        return self._send_request_and_deserialize(endpoints['Line_TimetableByPathFromStopPointIdPathId'], params=[fromStopPointId, id], endpoint_args=None, raw=raw, fields=fields)
 
-    def timetabletobypathfromstoppointidpathidpathtostoppointid(self, fromStopPointId: str, id: str, toStopPointId: str) -> models.TimetableResponse | ApiError:
+    def timetabletobypathfromstoppointidpathidpathtostoppointid(self, fromStopPointId: str, id: str, toStopPointId: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.TimetableResponse | ApiError:
         '''
         Gets the timetable for a specified station on the give line with specified destination
 
@@ -180,28 +341,56 @@ class LineClient(Client):
         fromStopPointId: str - The originating station's stop point id (station naptan code e.g. 940GZZLUASL, you can use /StopPoint/Search/{query} endpoint to find a stop point id from a station name). Example: 940GZZLUVIC
         id: str - A single line id e.g. victoria. Example: victoria
         toStopPointId: str - The destination stations's Naptan code. Example: 940GZZLUGPK
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Line_TimetableToByPathFromStopPointIdPathIdPathToStopPointId'], params=[fromStopPointId, id, toStopPointId], endpoint_args=None)
+        return self._send_request_and_deserialize(endpoints['Line_TimetableToByPathFromStopPointIdPathIdPathToStopPointId'], params=[fromStopPointId, id, toStopPointId], endpoint_args=None, raw=raw, fields=fields)
 
-    def disruptionbypathids(self, ids: str) -> models.DisruptionsArray | ApiError:
+    def disruptionbypathids(self, ids: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.DisruptionsArray | ApiError:
         '''
         Get disruptions for the given line ids
 
         Parameters:
         ids: str - A comma-separated list of line ids e.g. victoria,circle,N133. Max. approx. 20 ids.. Example: victoria
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return self._send_request_and_deserialize(endpoints['Line_DisruptionByPathIds'], params=[ids], endpoint_args=None, raw=raw, fields=fields)
+
+    def disruptionbypathidsstream(self, ids: str, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `disruptionbypathids`: `ResponseModel.content` is an iterator over the items
+        of `models.DisruptionsArray`, each validated as soon as it has been received. Responses are not cached.
         '''
-        return self._send_request_and_deserialize(endpoints['Line_DisruptionByPathIds'], params=[ids], endpoint_args=None)
+        return self._stream_request_and_deserialize(endpoints['Line_DisruptionByPathIds'], params=[ids], endpoint_args=None, fields=fields)
 
-    def disruptionbymodebypathmodes(self, modes: str) -> models.DisruptionsArray | ApiError:
+    def disruptionbypathidsbatch(self, ids: List[str], chunk_size: int = 20) -> BatchResponseModel:
+        '''
+        Batch variant of `disruptionbypathids`: splits `ids` into chunks of at most `chunk_size` ids,
+        requests the chunks concurrently and merges them into one `models.DisruptionsArray`.
+        Chunks that fail are reported in `BatchResponseModel.errors`.
+        '''
+        return self._send_batched_request_and_deserialize(endpoints['Line_DisruptionByPathIds'], ids, chunk_size, params=[ids], ids_index=0, endpoint_args=None)
+
+    def disruptionbymodebypathmodes(self, modes: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.DisruptionsArray | ApiError:
         '''
         Get disruptions for all lines of the given modes.
 
         Parameters:
         modes: str - A comma-separated list of modes e.g. tube,dlr. Example: tube
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Line_DisruptionByModeByPathModes'], params=[modes], endpoint_args=None)
+        return self._send_request_and_deserialize(endpoints['Line_DisruptionByModeByPathModes'], params=[modes], endpoint_args=None, raw=raw, fields=fields)
 
-    def arrivalswithstoppointbypathidspathstoppointidquerydirectionquerydestina(self, ids: str, stopPointId: str, direction: str | None = None, destinationStationId: str | None = None) -> models.PredictionArray | ApiError:
+    def disruptionbymodebypathmodesstream(self, modes: str, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `disruptionbymodebypathmodes`: `ResponseModel.content` is an iterator over the items
+        of `models.DisruptionsArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['Line_DisruptionByModeByPathModes'], params=[modes], endpoint_args=None, fields=fields)
+
+    def arrivalswithstoppointbypathidspathstoppointidquerydirectionquerydestina(self, ids: str, stopPointId: str, direction: str | None = None, destinationStationId: str | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.PredictionArray | ApiError:
         '''
         Get the list of arrival predictions for given line ids based at the given stop
 
@@ -210,24 +399,510 @@ class LineClient(Client):
         stopPointId: str - Optional. Id of stop to get arrival predictions for (station naptan code e.g. 940GZZLUASL, you can use /StopPoint/Search/{query} endpoint to find a stop point id from a station name). Example: 940GZZLUVIC
         direction: str - Optional. The direction of travel. Can be inbound or outbound or all. If left blank, and destinationStopId is set, will default to all. Example: None given
         destinationStationId: str - Optional. Id of destination stop. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return self._send_request_and_deserialize(endpoints['Line_ArrivalsWithStopPointByPathIdsPathStopPointIdQueryDirectionQueryDestina'], params=[ids, stopPointId], endpoint_args={ 'direction': direction, 'destinationStationId': destinationStationId }, raw=raw, fields=fields)
+
+    def arrivalswithstoppointbypathidspathstoppointidquerydirectionquerydestinastream(self, ids: str, stopPointId: str, direction: str | None = None, destinationStationId: str | None = None, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `arrivalswithstoppointbypathidspathstoppointidquerydirectionquerydestina`: `ResponseModel.content` is an iterator over the items
+        of `models.PredictionArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['Line_ArrivalsWithStopPointByPathIdsPathStopPointIdQueryDirectionQueryDestina'], params=[ids, stopPointId], endpoint_args={ 'direction': direction, 'destinationStationId': destinationStationId }, fields=fields)
+
+    def arrivalswithstoppointbypathidspathstoppointidquerydirectionquerydestinabatch(self, ids: List[str], stopPointId: str, direction: str | None = None, destinationStationId: str | None = None, chunk_size: int = 20) -> BatchResponseModel:
+        '''
+        Batch variant of `arrivalswithstoppointbypathidspathstoppointidquerydirectionquerydestina`: splits `ids` into chunks of at most `chunk_size` ids,
+        requests the chunks concurrently and merges them into one `models.PredictionArray`.
+        Chunks that fail are reported in `BatchResponseModel.errors`.
         '''
-        return self._send_request_and_deserialize(endpoints['Line_ArrivalsWithStopPointByPathIdsPathStopPointIdQueryDirectionQueryDestina'], params=[ids, stopPointId], endpoint_args={ 'direction': direction, 'destinationStationId': destinationStationId })
+        return self._send_batched_request_and_deserialize(endpoints['Line_ArrivalsWithStopPointByPathIdsPathStopPointIdQueryDirectionQueryDestina'], ids, chunk_size, params=[ids, stopPointId], ids_index=0, endpoint_args={ 'direction': direction, 'destinationStationId': destinationStationId })
 
-    def arrivalsbypathids(self, ids: str) -> models.PredictionArray | ApiError:
+    def arrivalsbypathids(self, ids: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.PredictionArray | ApiError:
         '''
         Get the list of arrival predictions for given line ids based at the given stop
 
         Parameters:
         ids: str - A comma-separated list of line ids e.g. victoria,circle,N133. Max. approx. 20 ids.. Example: victoria
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return self._send_request_and_deserialize(endpoints['Line_ArrivalsByPathIds'], params=[ids], endpoint_args=None, raw=raw, fields=fields)
+
+    def arrivalsbypathidsstream(self, ids: str, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `arrivalsbypathids`: `ResponseModel.content` is an iterator over the items
+        of `models.PredictionArray`, each validated as soon as it has been received. Responses are not cached.
         '''
-        return self._send_request_and_deserialize(endpoints['Line_ArrivalsByPathIds'], params=[ids], endpoint_args=None)
+        return self._stream_request_and_deserialize(endpoints['Line_ArrivalsByPathIds'], params=[ids], endpoint_args=None, fields=fields)
 
-    def proxy(self, ) -> models.ObjectResponse | ApiError:
+    def arrivalsbypathidsbatch(self, ids: List[str], chunk_size: int = 20) -> BatchResponseModel:
+        '''
+        Batch variant of `arrivalsbypathids`: splits `ids` into chunks of at most `chunk_size` ids,
+        requests the chunks concurrently and merges them into one `models.PredictionArray`.
+        Chunks that fail are reported in `BatchResponseModel.errors`.
+        '''
+        return self._send_batched_request_and_deserialize(endpoints['Line_ArrivalsByPathIds'], ids, chunk_size, params=[ids], ids_index=0, endpoint_args=None)
+
+    def proxy(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.ObjectResponse | ApiError:
         '''
         Forwards any remaining requests to the back-end
 
         Parameters:
-        No parameters required.
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return self._send_request_and_deserialize(endpoints['Forward_Proxy'], endpoint_args=None, raw=raw, fields=fields)
+
+
+class AsyncLineClient(AsyncClient):
+    async def metamodes(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.ModeArray | ApiError:
+        '''
+        Gets a list of valid modes
+
+        Parameters:
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Line_MetaModes'], endpoint_args=None, raw=raw, fields=fields)
+
+    async def metamodesstream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `metamodes`: `ResponseModel.content` is an async iterator over the items
+        of `models.ModeArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Line_MetaModes'], endpoint_args=None, fields=fields)
+
+    async def metaseverity(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.StatusSeveritiesArray | ApiError:
+        '''
+        Gets a list of valid severity codes
+
+        Parameters:
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Line_MetaSeverity'], endpoint_args=None, raw=raw, fields=fields)
+
+    async def metaseveritystream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `metaseverity`: `ResponseModel.content` is an async iterator over the items
+        of `models.StatusSeveritiesArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Line_MetaSeverity'], endpoint_args=None, fields=fields)
+
+    async def metadisruptioncategories(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.StringsArray | ApiError:
+        '''
+        Gets a list of valid disruption categories
+
+        Parameters:
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Line_MetaDisruptionCategories'], endpoint_args=None, raw=raw, fields=fields)
+
+    async def metadisruptioncategoriesstream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `metadisruptioncategories`: `ResponseModel.content` is an async iterator over the items
+        of `models.StringsArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Line_MetaDisruptionCategories'], endpoint_args=None, fields=fields)
+
+    async def metaservicetypes(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.StringsArray | ApiError:
+        '''
+        Gets a list of valid ServiceTypes to filter on
+
+        Parameters:
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Line_MetaServiceTypes'], endpoint_args=None, raw=raw, fields=fields)
+
+    async def metaservicetypesstream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `metaservicetypes`: `ResponseModel.content` is an async iterator over the items
+        of `models.StringsArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Line_MetaServiceTypes'], endpoint_args=None, fields=fields)
+
+    async def getbypathids(self, ids: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.LineArray | ApiError:
+        '''
+        Gets lines that match the specified line ids.
+
+        Parameters:
+        ids: str - A comma-separated list of line ids e.g. victoria,circle,N133. Max. approx. 20 ids.. Example: victoria
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Line_GetByPathIds'], params=[ids], endpoint_args=None, raw=raw, fields=fields)
+
+    async def getbypathidsstream(self, ids: str, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `getbypathids`: `ResponseModel.content` is an async iterator over the items
+        of `models.LineArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Line_GetByPathIds'], params=[ids], endpoint_args=None, fields=fields)
+
+    async def getbypathidsbatch(self, ids: List[str], chunk_size: int = 20) -> BatchResponseModel:
+        '''
+        Batch variant of `getbypathids`: splits `ids` into chunks of at most `chunk_size` ids,
+        requests the chunks concurrently and merges them into one `models.LineArray`.
+        Chunks that fail are reported in `BatchResponseModel.errors`.
+        '''
+        return await self._send_batched_request_and_deserialize(endpoints['Line_GetByPathIds'], ids, chunk_size, params=[ids], ids_index=0, endpoint_args=None)
+
+    async def getbymodebypathmodes(self, modes: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.LineArray | ApiError:
+        '''
+        Gets lines that serve the given modes.
+
+        Parameters:
+        modes: str - A comma-separated list of modes e.g. tube,dlr. Example: tube
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Line_GetByModeByPathModes'], params=[modes], endpoint_args=None, raw=raw, fields=fields)
+
+    async def getbymodebypathmodesstream(self, modes: str, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `getbymodebypathmodes`: `ResponseModel.content` is an async iterator over the items
+        of `models.LineArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Line_GetByModeByPathModes'], params=[modes], endpoint_args=None, fields=fields)
+
+    async def routebyqueryservicetypes(self, serviceTypes: str | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.LineArray | ApiError:
+        '''
+        Get all valid routes for all lines, including the name and id of the originating and terminating stops for each route.
+
+        Parameters:
+        serviceTypes: str - A comma seperated list of service types to filter on. Supported values: Regular, Night. Defaulted to 'Regular' if not specified. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Line_RouteByQueryServiceTypes'], endpoint_args={ 'serviceTypes': serviceTypes }, raw=raw, fields=fields)
+
+    async def routebyqueryservicetypesstream(self, serviceTypes: str | None = None, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `routebyqueryservicetypes`: `ResponseModel.content` is an async iterator over the items
+        of `models.LineArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Line_RouteByQueryServiceTypes'], endpoint_args={ 'serviceTypes': serviceTypes }, fields=fields)
+
+    async def lineroutesbyidsbypathidsqueryservicetypes(self, ids: str, serviceTypes: str | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.LineArray | ApiError:
+        '''
+        Get all valid routes for given line ids, including the name and id of the originating and terminating stops for each route.
+
+        Parameters:
+        ids: str - A comma-separated list of line ids e.g. victoria,circle,N133. Max. approx. 20 ids.. Example: victoria
+        serviceTypes: str - A comma seperated list of service types to filter on. Supported values: Regular, Night. Defaulted to 'Regular' if not specified. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Line_LineRoutesByIdsByPathIdsQueryServiceTypes'], params=[ids], endpoint_args={ 'serviceTypes': serviceTypes }, raw=raw, fields=fields)
+
+    async def lineroutesbyidsbypathidsqueryservicetypesstream(self, ids: str, serviceTypes: str | None = None, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `lineroutesbyidsbypathidsqueryservicetypes`: `ResponseModel.content` is an async iterator over the items
+        of `models.LineArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Line_LineRoutesByIdsByPathIdsQueryServiceTypes'], params=[ids], endpoint_args={ 'serviceTypes': serviceTypes }, fields=fields)
+
+    async def lineroutesbyidsbypathidsqueryservicetypesbatch(self, ids: List[str], serviceTypes: str | None = None, chunk_size: int = 20) -> BatchResponseModel:
+        '''
+        Batch variant of `lineroutesbyidsbypathidsqueryservicetypes`: splits `ids` into chunks of at most `chunk_size` ids,
+        requests the chunks concurrently and merges them into one `models.LineArray`.
+        Chunks that fail are reported in `BatchResponseModel.errors`.
+        '''
+        return await self._send_batched_request_and_deserialize(endpoints['Line_LineRoutesByIdsByPathIdsQueryServiceTypes'], ids, chunk_size, params=[ids], ids_index=0, endpoint_args={ 'serviceTypes': serviceTypes })
+
+    async def routebymodebypathmodesqueryservicetypes(self, modes: str, serviceTypes: str | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.LineArray | ApiError:
+        '''
+        Gets all lines and their valid routes for given modes, including the name and id of the originating and terminating stops for each route
+
+        Parameters:
+        modes: str - A comma-separated list of modes e.g. tube,dlr. Example: tube
+        serviceTypes: str - A comma seperated list of service types to filter on. Supported values: Regular, Night. Defaulted to 'Regular' if not specified. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Line_RouteByModeByPathModesQueryServiceTypes'], params=[modes], endpoint_args={ 'serviceTypes': serviceTypes }, raw=raw, fields=fields)
+
+    async def routebymodebypathmodesqueryservicetypesstream(self, modes: str, serviceTypes: str | None = None, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `routebymodebypathmodesqueryservicetypes`: `ResponseModel.content` is an async iterator over the items
+        of `models.LineArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Line_RouteByModeByPathModesQueryServiceTypes'], params=[modes], endpoint_args={ 'serviceTypes': serviceTypes }, fields=fields)
+
+    async def routesequencebypathidpathdirectionqueryservicetypesqueryexcludecrowding(self, id: str, direction: str, serviceTypes: str | None = None, excludeCrowding: bool | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.RouteSequence | ApiError:
+        '''
+        Gets all valid routes for given line id, including the sequence of stops on each route.
+
+        Parameters:
+        id: str - A single line id e.g. victoria. Example: victoria
+        direction: str - The direction of travel. Can be inbound or outbound.. Example: inbound
+        serviceTypes: str - A comma seperated list of service types to filter on. Supported values: Regular, Night. Defaulted to 'Regular' if not specified. Example: None given
+        excludeCrowding: bool - That excludes crowding from line disruptions. Can be true or false.. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Line_RouteSequenceByPathIdPathDirectionQueryServiceTypesQueryExcludeCrowding'], params=[id, direction], endpoint_args={ 'serviceTypes': serviceTypes, 'excludeCrowding': excludeCrowding }, raw=raw, fields=fields)
+
+    async def statusbypathidspathstartdatepathenddatequerydetail(self, ids: str, startDate: str, endDate: str, detail: bool | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.LineArray | ApiError:
+        '''
+        Gets the line status for given line ids during the provided dates e.g Minor Delays
+
+        Parameters:
+        ids: str - A comma-separated list of line ids e.g. victoria,circle,N133. Max. approx. 20 ids.. Example: victoria
+        startDate: str - Format - date-time (as date-time in RFC3339). Start date for start of the period. Example: 2024-03-01
+        endDate: str - Format - date-time (as date-time in RFC3339). End date for the period that the disruption will fall within to be included in the results. Example: 2024-03-31
+        detail: bool - Include details of the disruptions that are causing the line status including the affected stops and routes. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Line_StatusByPathIdsPathStartDatePathEndDateQueryDetail'], params=[ids, startDate, endDate], endpoint_args={ 'detail': detail }, raw=raw, fields=fields)
+
+    async def statusbypathidspathstartdatepathenddatequerydetailstream(self, ids: str, startDate: str, endDate: str, detail: bool | None = None, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `statusbypathidspathstartdatepathenddatequerydetail`: `ResponseModel.content` is an async iterator over the items
+        of `models.LineArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Line_StatusByPathIdsPathStartDatePathEndDateQueryDetail'], params=[ids, startDate, endDate], endpoint_args={ 'detail': detail }, fields=fields)
+
+    async def statusbypathidspathstartdatepathenddatequerydetailbatch(self, ids: List[str], startDate: str, endDate: str, detail: bool | None = None, chunk_size: int = 20) -> BatchResponseModel:
+        '''
+        Batch variant of `statusbypathidspathstartdatepathenddatequerydetail`: splits `ids` into chunks of at most `chunk_size` ids,
+        requests the chunks concurrently and merges them into one `models.LineArray`.
+        Chunks that fail are reported in `BatchResponseModel.errors`.
+        '''
+        return await self._send_batched_request_and_deserialize(endpoints['Line_StatusByPathIdsPathStartDatePathEndDateQueryDetail'], ids, chunk_size, params=[ids, startDate, endDate], ids_index=0, endpoint_args={ 'detail': detail })
+
+    async def statusbyidsbypathidsquerydetail(self, ids: str, detail: bool | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.LineArray | ApiError:
+        '''
+        Gets the line status of for given line ids e.g Minor Delays
+
+        Parameters:
+        ids: str - A comma-separated list of line ids e.g. victoria,circle,N133. Max. approx. 20 ids.. Example: victoria
+        detail: bool - Include details of the disruptions that are causing the line status including the affected stops and routes. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Line_StatusByIdsByPathIdsQueryDetail'], params=[ids], endpoint_args={ 'detail': detail }, raw=raw, fields=fields)
+
+    async def statusbyidsbypathidsquerydetailstream(self, ids: str, detail: bool | None = None, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `statusbyidsbypathidsquerydetail`: `ResponseModel.content` is an async iterator over the items
+        of `models.LineArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Line_StatusByIdsByPathIdsQueryDetail'], params=[ids], endpoint_args={ 'detail': detail }, fields=fields)
+
+    async def statusbyidsbypathidsquerydetailbatch(self, ids: List[str], detail: bool | None = None, chunk_size: int = 20) -> BatchResponseModel:
+        '''
+        Batch variant of `statusbyidsbypathidsquerydetail`: splits `ids` into chunks of at most `chunk_size` ids,
+        requests the chunks concurrently and merges them into one `models.LineArray`.
+        Chunks that fail are reported in `BatchResponseModel.errors`.
+        '''
+        return await self._send_batched_request_and_deserialize(endpoints['Line_StatusByIdsByPathIdsQueryDetail'], ids, chunk_size, params=[ids], ids_index=0, endpoint_args={ 'detail': detail })
+
+    async def searchbypathqueryquerymodesqueryservicetypes(self, query: str, modes: list | None = None, serviceTypes: str | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.RouteSearchResponse | ApiError:
+        '''
+        Search for lines or routes matching the query string
+
+        Parameters:
+        query: str - Search term e.g victoria. Example: victoria
+        modes: list - Optionally filter by the specified modes. Example: None given
+        serviceTypes: str - A comma seperated list of service types to filter on. Supported values: Regular, Night. Defaulted to 'Regular' if not specified. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Line_SearchByPathQueryQueryModesQueryServiceTypes'], params=[query], endpoint_args={ 'modes': modes, 'serviceTypes': serviceTypes }, raw=raw, fields=fields)
+
+    async def statusbyseveritybypathseverity(self, severity: int, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.LineArray | ApiError:
         '''
-        return self._send_request_and_deserialize(endpoints['Forward_Proxy'], endpoint_args=None)
+        Gets the line status for all lines with a given severity A list of valid severity codes can be obtained from a call to Line/Meta/Severity
 
+        Parameters:
+        severity: int - Format - int32. The level of severity (eg: a number from 0 to 14). Example: 2
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Line_StatusBySeverityByPathSeverity'], params=[severity], endpoint_args=None, raw=raw, fields=fields)
+
+    async def statusbyseveritybypathseveritystream(self, severity: int, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `statusbyseveritybypathseverity`: `ResponseModel.content` is an async iterator over the items
+        of `models.LineArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Line_StatusBySeverityByPathSeverity'], params=[severity], endpoint_args=None, fields=fields)
+
+    async def statusbymodebypathmodesquerydetailqueryseveritylevel(self, modes: str, detail: bool | None = None, severityLevel: str | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.LineArray | ApiError:
+        '''
+        Gets the line status of for all lines for the given modes
+
+        Parameters:
+        modes: str - A comma-separated list of modes to filter by. e.g. tube,dlr. Example: tube
+        detail: bool - Include details of the disruptions that are causing the line status including the affected stops and routes. Example: None given
+        severityLevel: str - If specified, ensures that only those line status(es) are returned within the lines that have disruptions with the matching severity level.. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Line_StatusByModeByPathModesQueryDetailQuerySeverityLevel'], params=[modes], endpoint_args={ 'detail': detail, 'severityLevel': severityLevel }, raw=raw, fields=fields)
+
+    async def statusbymodebypathmodesquerydetailqueryseveritylevelstream(self, modes: str, detail: bool | None = None, severityLevel: str | None = None, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `statusbymodebypathmodesquerydetailqueryseveritylevel`: `ResponseModel.content` is an async iterator over the items
+        of `models.LineArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Line_StatusByModeByPathModesQueryDetailQuerySeverityLevel'], params=[modes], endpoint_args={ 'detail': detail, 'severityLevel': severityLevel }, fields=fields)
+
+    async def stoppointsbypathidquerytfloperatednationalrailstationsonly(self, id: str, tflOperatedNationalRailStationsOnly: bool | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.StopPointArray | ApiError:
+        '''
+        Gets a list of the stations that serve the given line id
+
+        Parameters:
+        id: str - A single line id e.g. victoria. Example: victoria
+        tflOperatedNationalRailStationsOnly: bool - If the national-rail line is requested, this flag will filter the national rail stations so that only those operated by TfL are returned. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Line_StopPointsByPathIdQueryTflOperatedNationalRailStationsOnly'], params=[id], endpoint_args={ 'tflOperatedNationalRailStationsOnly': tflOperatedNationalRailStationsOnly }, raw=raw, fields=fields)
+
+    async def stoppointsbypathidquerytfloperatednationalrailstationsonlystream(self, id: str, tflOperatedNationalRailStationsOnly: bool | None = None, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `stoppointsbypathidquerytfloperatednationalrailstationsonly`: `ResponseModel.content` is an async iterator over the items
+        of `models.StopPointArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Line_StopPointsByPathIdQueryTflOperatedNationalRailStationsOnly'], params=[id], endpoint_args={ 'tflOperatedNationalRailStationsOnly': tflOperatedNationalRailStationsOnly }, fields=fields)
+
+    async def timetablebypathfromstoppointidpathid(self, fromStopPointId: str, id: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.TimetableResponse | ApiError:
+        '''
+        Gets the timetable for a specified station on the give line
+
+        Parameters:
+        fromStopPointId: str - The originating station's stop point id (station naptan code e.g. 940GZZLUASL, you can use /StopPoint/Search/{query} endpoint to find a stop point id from a station name). Example: 940GZZLUVIC
+        id: str - A single line id e.g. victoria. Example: victoria
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Line_TimetableByPathFromStopPointIdPathId'], params=[fromStopPointId, id], endpoint_args=None, raw=raw, fields=fields)
+
+    async def timetabletobypathfromstoppointidpathidpathtostoppointid(self, fromStopPointId: str, id: str, toStopPointId: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.TimetableResponse | ApiError:
+        '''
+        Gets the timetable for a specified station on the give line with specified destination
+
+        Parameters:
+        fromStopPointId: str - The originating station's stop point id (station naptan code e.g. 940GZZLUASL, you can use /StopPoint/Search/{query} endpoint to find a stop point id from a station name). Example: 940GZZLUVIC
+        id: str - A single line id e.g. victoria. Example: victoria
+        toStopPointId: str - The destination stations's Naptan code. Example: 940GZZLUGPK
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Line_TimetableToByPathFromStopPointIdPathIdPathToStopPointId'], params=[fromStopPointId, id, toStopPointId], endpoint_args=None, raw=raw, fields=fields)
+
+    async def disruptionbypathids(self, ids: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.DisruptionsArray | ApiError:
+        '''
+        Get disruptions for the given line ids
+
+        Parameters:
+        ids: str - A comma-separated list of line ids e.g. victoria,circle,N133. Max. approx. 20 ids.. Example: victoria
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Line_DisruptionByPathIds'], params=[ids], endpoint_args=None, raw=raw, fields=fields)
+
+    async def disruptionbypathidsstream(self, ids: str, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `disruptionbypathids`: `ResponseModel.content` is an async iterator over the items
+        of `models.DisruptionsArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Line_DisruptionByPathIds'], params=[ids], endpoint_args=None, fields=fields)
+
+    async def disruptionbypathidsbatch(self, ids: List[str], chunk_size: int = 20) -> BatchResponseModel:
+        '''
+        Batch variant of `disruptionbypathids`: splits `ids` into chunks of at most `chunk_size` ids,
+        requests the chunks concurrently and merges them into one `models.DisruptionsArray`.
+        Chunks that fail are reported in `BatchResponseModel.errors`.
+        '''
+        return await self._send_batched_request_and_deserialize(endpoints['Line_DisruptionByPathIds'], ids, chunk_size, params=[ids], ids_index=0, endpoint_args=None)
+
+    async def disruptionbymodebypathmodes(self, modes: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.DisruptionsArray | ApiError:
+        '''
+        Get disruptions for all lines of the given modes.
+
+        Parameters:
+        modes: str - A comma-separated list of modes e.g. tube,dlr. Example: tube
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Line_DisruptionByModeByPathModes'], params=[modes], endpoint_args=None, raw=raw, fields=fields)
+
+    async def disruptionbymodebypathmodesstream(self, modes: str, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `disruptionbymodebypathmodes`: `ResponseModel.content` is an async iterator over the items
+        of `models.DisruptionsArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Line_DisruptionByModeByPathModes'], params=[modes], endpoint_args=None, fields=fields)
+
+    async def arrivalswithstoppointbypathidspathstoppointidquerydirectionquerydestina(self, ids: str, stopPointId: str, direction: str | None = None, destinationStationId: str | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.PredictionArray | ApiError:
+        '''
+        Get the list of arrival predictions for given line ids based at the given stop
+
+        Parameters:
+        ids: str - A comma-separated list of line ids e.g. victoria,circle,N133. Max. approx. 20 ids.. Example: victoria
+        stopPointId: str - Optional. Id of stop to get arrival predictions for (station naptan code e.g. 940GZZLUASL, you can use /StopPoint/Search/{query} endpoint to find a stop point id from a station name). Example: 940GZZLUVIC
+        direction: str - Optional. The direction of travel. Can be inbound or outbound or all. If left blank, and destinationStopId is set, will default to all. Example: None given
+        destinationStationId: str - Optional. Id of destination stop. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Line_ArrivalsWithStopPointByPathIdsPathStopPointIdQueryDirectionQueryDestina'], params=[ids, stopPointId], endpoint_args={ 'direction': direction, 'destinationStationId': destinationStationId }, raw=raw, fields=fields)
+
+    async def arrivalswithstoppointbypathidspathstoppointidquerydirectionquerydestinastream(self, ids: str, stopPointId: str, direction: str | None = None, destinationStationId: str | None = None, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `arrivalswithstoppointbypathidspathstoppointidquerydirectionquerydestina`: `ResponseModel.content` is an async iterator over the items
+        of `models.PredictionArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Line_ArrivalsWithStopPointByPathIdsPathStopPointIdQueryDirectionQueryDestina'], params=[ids, stopPointId], endpoint_args={ 'direction': direction, 'destinationStationId': destinationStationId }, fields=fields)
+
+    async def arrivalswithstoppointbypathidspathstoppointidquerydirectionquerydestinabatch(self, ids: List[str], stopPointId: str, direction: str | None = None, destinationStationId: str | None = None, chunk_size: int = 20) -> BatchResponseModel:
+        '''
+        Batch variant of `arrivalswithstoppointbypathidspathstoppointidquerydirectionquerydestina`: splits `ids` into chunks of at most `chunk_size` ids,
+        requests the chunks concurrently and merges them into one `models.PredictionArray`.
+        Chunks that fail are reported in `BatchResponseModel.errors`.
+        '''
+        return await self._send_batched_request_and_deserialize(endpoints['Line_ArrivalsWithStopPointByPathIdsPathStopPointIdQueryDirectionQueryDestina'], ids, chunk_size, params=[ids, stopPointId], ids_index=0, endpoint_args={ 'direction': direction, 'destinationStationId': destinationStationId })
+
+    async def arrivalsbypathids(self, ids: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.PredictionArray | ApiError:
+        '''
+        Get the list of arrival predictions for given line ids based at the given stop
+
+        Parameters:
+        ids: str - A comma-separated list of line ids e.g. victoria,circle,N133. Max. approx. 20 ids.. Example: victoria
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Line_ArrivalsByPathIds'], params=[ids], endpoint_args=None, raw=raw, fields=fields)
+
+    async def arrivalsbypathidsstream(self, ids: str, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `arrivalsbypathids`: `ResponseModel.content` is an async iterator over the items
+        of `models.PredictionArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Line_ArrivalsByPathIds'], params=[ids], endpoint_args=None, fields=fields)
+
+    async def arrivalsbypathidsbatch(self, ids: List[str], chunk_size: int = 20) -> BatchResponseModel:
+        '''
+        Batch variant of `arrivalsbypathids`: splits `ids` into chunks of at most `chunk_size` ids,
+        requests the chunks concurrently and merges them into one `models.PredictionArray`.
+        Chunks that fail are reported in `BatchResponseModel.errors`.
+        '''
+        return await self._send_batched_request_and_deserialize(endpoints['Line_ArrivalsByPathIds'], ids, chunk_size, params=[ids], ids_index=0, endpoint_args=None)
+
+    async def proxy(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.ObjectResponse | ApiError:
+        '''
+        Forwards any remaining requests to the back-end
+
+        Parameters:
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Forward_Proxy'], endpoint_args=None, raw=raw, fields=fields)
@@ -1,26 +1,81 @@
-from ..Client import Client
+from ..Client import Client, AsyncClient
 from .ModeClient_config import endpoints
 from .. import models
-from ..package_models import ApiError
+from ..package_models import ApiError, ResponseModel
 
 class ModeClient(Client):
-    def getactiveservicetypes(self, ) -> models.ActiveServiceTypesArray | ApiError:
+    def getactiveservicetypes(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.ActiveServiceTypesArray | ApiError:
         '''
         Returns the service type active for a mode.
             Currently only supports tube
 
         Parameters:
-        No parameters required.
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Mode_GetActiveServiceTypes'], endpoint_args=None)
+        return self._send_request_and_deserialize(endpoints['Mode_GetActiveServiceTypes'], endpoint_args=None, raw=raw, fields=fields)
 
-    def arrivals(self, mode: str, count: int | None = None) -> models.PredictionArray | ApiError:
+    def getactiveservicetypesstream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `getactiveservicetypes`: `ResponseModel.content` is an iterator over the items
+        of `models.ActiveServiceTypesArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['Mode_GetActiveServiceTypes'], endpoint_args=None, fields=fields)
+
+    def arrivals(self, mode: str, count: int | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.PredictionArray | ApiError:
         '''
         Gets the next arrival predictions for all stops of a given mode
 
         Parameters:
         mode: str - A mode name e.g. tube, dlr. Example: Tube
         count: int - Format - int32. A number of arrivals to return for each stop, -1 to return all available.. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return self._send_request_and_deserialize(endpoints['Mode_Arrivals'], params=[mode], endpoint_args={ 'count': count }, raw=raw, fields=fields)
+
+    def arrivalsstream(self, mode: str, count: int | None = None, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `arrivals`: `ResponseModel.content` is an iterator over the items
+        of `models.PredictionArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['Mode_Arrivals'], params=[mode], endpoint_args={ 'count': count }, fields=fields)
+
+
+class AsyncModeClient(AsyncClient):
+    async def getactiveservicetypes(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.ActiveServiceTypesArray | ApiError:
+        '''
+        Returns the service type active for a mode.
+            Currently only supports tube
+
+        Parameters:
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Mode_Arrivals'], params=[mode], endpoint_args={ 'count': count })
+        return await self._send_request_and_deserialize(endpoints['Mode_GetActiveServiceTypes'], endpoint_args=None, raw=raw, fields=fields)
 
+    async def getactiveservicetypesstream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `getactiveservicetypes`: `ResponseModel.content` is an async iterator over the items
+        of `models.ActiveServiceTypesArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Mode_GetActiveServiceTypes'], endpoint_args=None, fields=fields)
+
+    async def arrivals(self, mode: str, count: int | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.PredictionArray | ApiError:
+        '''
+        Gets the next arrival predictions for all stops of a given mode
+
+        Parameters:
+        mode: str - A mode name e.g. tube, dlr. Example: Tube
+        count: int - Format - int32. A number of arrivals to return for each stop, -1 to return all available.. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Mode_Arrivals'], params=[mode], endpoint_args={ 'count': count }, raw=raw, fields=fields)
+
+    async def arrivalsstream(self, mode: str, count: int | None = None, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `arrivals`: `ResponseModel.content` is an async iterator over the items
+        of `models.PredictionArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Mode_Arrivals'], params=[mode], endpoint_args={ 'count': count }, fields=fields)
@@ -1,42 +1,133 @@
-from ..Client import Client
+from ..Client import Client, AsyncClient
 from .OccupancyClient_config import endpoints
 from .. import models
-from ..package_models import ApiError
+from ..package_models import ApiError, ResponseModel
 
 class OccupancyClient(Client):
-    def getallchargeconnectorstatus(self, ) -> models.ChargeConnectorOccupancyArray | ApiError:
+    def getallchargeconnectorstatus(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.ChargeConnectorOccupancyArray | ApiError:
         '''
         Gets the occupancy for all charge connectors
 
         Parameters:
-        No parameters required.
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Occupancy_GetAllChargeConnectorStatus'], endpoint_args=None)
+        return self._send_request_and_deserialize(endpoints['Occupancy_GetAllChargeConnectorStatus'], endpoint_args=None, raw=raw, fields=fields)
 
-    def getchargeconnectorstatusbypathids(self, ids: str) -> models.ChargeConnectorOccupancyArray | ApiError:
+    def getallchargeconnectorstatusstream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `getallchargeconnectorstatus`: `ResponseModel.content` is an iterator over the items
+        of `models.ChargeConnectorOccupancyArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['Occupancy_GetAllChargeConnectorStatus'], endpoint_args=None, fields=fields)
+
+    def getchargeconnectorstatusbypathids(self, ids: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.ChargeConnectorOccupancyArray | ApiError:
         '''
         Gets the occupancy for a charge connectors with a given id (sourceSystemPlaceId)
 
         Parameters:
         ids: str - . Example: ChargePointCM-24473-67148
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return self._send_request_and_deserialize(endpoints['Occupancy_GetChargeConnectorStatusByPathIds'], params=[ids], endpoint_args=None, raw=raw, fields=fields)
+
+    def getchargeconnectorstatusbypathidsstream(self, ids: str, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `getchargeconnectorstatusbypathids`: `ResponseModel.content` is an iterator over the items
+        of `models.ChargeConnectorOccupancyArray`, each validated as soon as it has been received. Responses are not cached.
         '''
-        return self._send_request_and_deserialize(endpoints['Occupancy_GetChargeConnectorStatusByPathIds'], params=[ids], endpoint_args=None)
+        return self._stream_request_and_deserialize(endpoints['Occupancy_GetChargeConnectorStatusByPathIds'], params=[ids], endpoint_args=None, fields=fields)
 
-    def getbikepointsoccupanciesbypathids(self, ids: str) -> models.BikePointOccupancyArray | ApiError:
+    def getbikepointsoccupanciesbypathids(self, ids: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.BikePointOccupancyArray | ApiError:
         '''
         Get the occupancy for bike points.
 
         Parameters:
         ids: str - . Example: BikePoints_805
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Occupancy_GetBikePointsOccupanciesByPathIds'], params=[ids], endpoint_args=None)
+        return self._send_request_and_deserialize(endpoints['Occupancy_GetBikePointsOccupanciesByPathIds'], params=[ids], endpoint_args=None, raw=raw, fields=fields)
 
-    def proxy(self, ) -> models.GenericResponseModel | ApiError:
+    def getbikepointsoccupanciesbypathidsstream(self, ids: str, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `getbikepointsoccupanciesbypathids`: `ResponseModel.content` is an iterator over the items
+        of `models.BikePointOccupancyArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['Occupancy_GetBikePointsOccupanciesByPathIds'], params=[ids], endpoint_args=None, fields=fields)
+
+    def proxy(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.GenericResponseModel | ApiError:
         '''
         Forwards any remaining requests to the back-end
 
         Parameters:
-        No parameters required.
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return self._send_request_and_deserialize(endpoints['Forward_Proxy'], endpoint_args=None, raw=raw, fields=fields)
+
+
+class AsyncOccupancyClient(AsyncClient):
+    async def getallchargeconnectorstatus(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.ChargeConnectorOccupancyArray | ApiError:
+        '''
+        Gets the occupancy for all charge connectors
+
+        Parameters:
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Occupancy_GetAllChargeConnectorStatus'], endpoint_args=None, raw=raw, fields=fields)
+
+    async def getallchargeconnectorstatusstream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `getallchargeconnectorstatus`: `ResponseModel.content` is an async iterator over the items
+        of `models.ChargeConnectorOccupancyArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Occupancy_GetAllChargeConnectorStatus'], endpoint_args=None, fields=fields)
+
+    async def getchargeconnectorstatusbypathids(self, ids: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.ChargeConnectorOccupancyArray | ApiError:
+        '''
+        Gets the occupancy for a charge connectors with a given id (sourceSystemPlaceId)
+
+        Parameters:
+        ids: str - . Example: ChargePointCM-24473-67148
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Occupancy_GetChargeConnectorStatusByPathIds'], params=[ids], endpoint_args=None, raw=raw, fields=fields)
+
+    async def getchargeconnectorstatusbypathidsstream(self, ids: str, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `getchargeconnectorstatusbypathids`: `ResponseModel.content` is an async iterator over the items
+        of `models.ChargeConnectorOccupancyArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Occupancy_GetChargeConnectorStatusByPathIds'], params=[ids], endpoint_args=None, fields=fields)
+
+    async def getbikepointsoccupanciesbypathids(self, ids: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.BikePointOccupancyArray | ApiError:
+        '''
+        Get the occupancy for bike points.
+
+        Parameters:
+        ids: str - . Example: BikePoints_805
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Occupancy_GetBikePointsOccupanciesByPathIds'], params=[ids], endpoint_args=None, raw=raw, fields=fields)
+
+    async def getbikepointsoccupanciesbypathidsstream(self, ids: str, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `getbikepointsoccupanciesbypathids`: `ResponseModel.content` is an async iterator over the items
+        of `models.BikePointOccupancyArray`, each validated as soon as it has been received. Responses are not cached.
         '''
-        return self._send_request_and_deserialize(endpoints['Forward_Proxy'], endpoint_args=None)
+        return await self._stream_request_and_deserialize(endpoints['Occupancy_GetBikePointsOccupanciesByPathIds'], params=[ids], endpoint_args=None, fields=fields)
 
+    async def proxy(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.GenericResponseModel | ApiError:
+        '''
+        Forwards any remaining requests to the back-end
+
+        Parameters:
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Forward_Proxy'], endpoint_args=None, raw=raw, fields=fields)
@@ -1,28 +1,45 @@
-from ..Client import Client
+from ..Client import Client, AsyncClient
 from .RoadClient_config import endpoints
 from .. import models
-from ..package_models import ApiError
+from ..package_models import ApiError, ResponseModel
 
 class RoadClient(Client):
-    def get(self, ) -> models.RoadCorridorsArray | ApiError:
+    def get(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.RoadCorridorsArray | ApiError:
         '''
         Gets all roads managed by TfL
 
         Parameters:
-        No parameters required.
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Road_Get'], endpoint_args=None)
+        return self._send_request_and_deserialize(endpoints['Road_Get'], endpoint_args=None, raw=raw, fields=fields)
 
-    def getbypathids(self, ids: str) -> models.RoadCorridorsArray | ApiError:
+    def getstream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `get`: `ResponseModel.content` is an iterator over the items
+        of `models.RoadCorridorsArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['Road_Get'], endpoint_args=None, fields=fields)
+
+    def getbypathids(self, ids: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.RoadCorridorsArray | ApiError:
         '''
         Gets the road with the specified id (e.g. A1)
 
         Parameters:
         ids: str - Comma-separated list of road identifiers e.g. "A406, A2" (a full list of supported road identifiers can be found at the /Road/ endpoint). Example: A1
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Road_GetByPathIds'], params=[ids], endpoint_args=None)
+        return self._send_request_and_deserialize(endpoints['Road_GetByPathIds'], params=[ids], endpoint_args=None, raw=raw, fields=fields)
 
-    def statusbypathidsquerystartdatequeryenddate(self, ids: str, startDate: str | None = None, endDate: str | None = None) -> models.RoadCorridorsArray | ApiError:
+    def getbypathidsstream(self, ids: str, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `getbypathids`: `ResponseModel.content` is an iterator over the items
+        of `models.RoadCorridorsArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['Road_GetByPathIds'], params=[ids], endpoint_args=None, fields=fields)
+
+    def statusbypathidsquerystartdatequeryenddate(self, ids: str, startDate: str | None = None, endDate: str | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.RoadCorridorsArray | ApiError:
         '''
         Gets the specified roads with the status aggregated over the date range specified, or now until the end of today if no dates are passed.
 
@@ -30,10 +47,19 @@ class RoadClient(Client):
         ids: str - Comma-separated list of road identifiers e.g. "A406, A2" or use "all" to ignore id filter (a full list of supported road identifiers can be found at the /Road/ endpoint). Example: A2
         startDate: str - Format - date-time (as date-time in RFC3339). The start date to aggregate status from. Example: None given
         endDate: str - Format - date-time (as date-time in RFC3339). The end date to aggregate status up to. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Road_StatusByPathIdsQueryStartDateQueryEndDate'], params=[ids], endpoint_args={ 'startDate': startDate, 'endDate': endDate })
+        return self._send_request_and_deserialize(endpoints['Road_StatusByPathIdsQueryStartDateQueryEndDate'], params=[ids], endpoint_args={ 'startDate': startDate, 'endDate': endDate }, raw=raw, fields=fields)
 
-    def disruptionbypathidsquerystripcontentqueryseveritiesquerycategoriesquery(self, ids: str, stripContent: bool | None = None, severities: list | None = None, categories: list | None = None, closures: bool | None = None) -> models.RoadDisruptionsArray | ApiError:
+    def statusbypathidsquerystartdatequeryenddatestream(self, ids: str, startDate: str | None = None, endDate: str | None = None, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `statusbypathidsquerystartdatequeryenddate`: `ResponseModel.content` is an iterator over the items
+        of `models.RoadCorridorsArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['Road_StatusByPathIdsQueryStartDateQueryEndDate'], params=[ids], endpoint_args={ 'startDate': startDate, 'endDate': endDate }, fields=fields)
+
+    def disruptionbypathidsquerystripcontentqueryseveritiesquerycategoriesquery(self, ids: str, stripContent: bool | None = None, severities: list | None = None, categories: list | None = None, closures: bool | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.RoadDisruptionsArray | ApiError:
         '''
         Get active disruptions, filtered by road ids
 
@@ -43,44 +69,209 @@ class RoadClient(Client):
         severities: list - an optional list of Severity names to filter on (a valid list of severities can be obtained from the /Road/Meta/severities endpoint). Example: None given
         categories: list - an optional list of category names to filter on (a valid list of categories can be obtained from the /Road/Meta/categories endpoint). Example: None given
         closures: bool - Optional, defaults to true. When true, always includes disruptions that have road closures, regardless of the severity filter. When false, the severity filter works as normal.. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return self._send_request_and_deserialize(endpoints['Road_DisruptionByPathIdsQueryStripContentQuerySeveritiesQueryCategoriesQuery'], params=[ids], endpoint_args={ 'stripContent': stripContent, 'severities': severities, 'categories': categories, 'closures': closures }, raw=raw, fields=fields)
+
+    def disruptionbypathidsquerystripcontentqueryseveritiesquerycategoriesquerystream(self, ids: str, stripContent: bool | None = None, severities: list | None = None, categories: list | None = None, closures: bool | None = None, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `disruptionbypathidsquerystripcontentqueryseveritiesquerycategoriesquery`: `ResponseModel.content` is an iterator over the items
+        of `models.RoadDisruptionsArray`, each validated as soon as it has been received. Responses are not cached.
         '''
-        return self._send_request_and_deserialize(endpoints['Road_DisruptionByPathIdsQueryStripContentQuerySeveritiesQueryCategoriesQuery'], params=[ids], endpoint_args={ 'stripContent': stripContent, 'severities': severities, 'categories': categories, 'closures': closures })
+        return self._stream_request_and_deserialize(endpoints['Road_DisruptionByPathIdsQueryStripContentQuerySeveritiesQueryCategoriesQuery'], params=[ids], endpoint_args={ 'stripContent': stripContent, 'severities': severities, 'categories': categories, 'closures': closures }, fields=fields)
 
-    def disruptedstreetsbyquerystartdatequeryenddate(self, startDate: str | None = None, endDate: str | None = None) -> models.Object | ApiError:
+    def disruptedstreetsbyquerystartdatequeryenddate(self, startDate: str | None = None, endDate: str | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.Object | ApiError:
         '''
         Gets a list of disrupted streets. If no date filters are provided, current disruptions are returned.
 
         Parameters:
         startDate: str - Format - date-time (as date-time in RFC3339). Optional, the start time to filter on.. Example: 2024-03-01
         endDate: str - Format - date-time (as date-time in RFC3339). Optional, The end time to filter on.. Example: 2024-03-31
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Road_DisruptedStreetsByQueryStartDateQueryEndDate'], endpoint_args={ 'startDate': startDate, 'endDate': endDate })
+        return self._send_request_and_deserialize(endpoints['Road_DisruptedStreetsByQueryStartDateQueryEndDate'], endpoint_args={ 'startDate': startDate, 'endDate': endDate }, raw=raw, fields=fields)
 
-    def disruptionbyidbypathdisruptionidsquerystripcontent(self, disruptionIds: str, stripContent: bool | None = None) -> models.RoadDisruption | ApiError:
+    def disruptionbyidbypathdisruptionidsquerystripcontent(self, disruptionIds: str, stripContent: bool | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.RoadDisruption | ApiError:
         '''
         Gets a list of active disruptions filtered by disruption Ids.
 
         Parameters:
         disruptionIds: str - Comma-separated list of disruption identifiers to filter by.. Example: TIMS-89632
         stripContent: bool - Optional, defaults to false. When true, removes every property/node except for id, point, severity, severityDescription, startDate, endDate, corridor details, location and comments.. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Road_DisruptionByIdByPathDisruptionIdsQueryStripContent'], params=[disruptionIds], endpoint_args={ 'stripContent': stripContent })
+        return self._send_request_and_deserialize(endpoints['Road_DisruptionByIdByPathDisruptionIdsQueryStripContent'], params=[disruptionIds], endpoint_args={ 'stripContent': stripContent }, raw=raw, fields=fields)
 
-    def metacategories(self, ) -> models.StringsArray | ApiError:
+    def metacategories(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.StringsArray | ApiError:
         '''
         Gets a list of valid RoadDisruption categories
 
         Parameters:
-        No parameters required.
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Road_MetaCategories'], endpoint_args=None)
+        return self._send_request_and_deserialize(endpoints['Road_MetaCategories'], endpoint_args=None, raw=raw, fields=fields)
 
-    def metaseverities(self, ) -> models.StatusSeveritiesArray | ApiError:
+    def metacategoriesstream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `metacategories`: `ResponseModel.content` is an iterator over the items
+        of `models.StringsArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['Road_MetaCategories'], endpoint_args=None, fields=fields)
+
+    def metaseverities(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.StatusSeveritiesArray | ApiError:
         '''
         Gets a list of valid RoadDisruption severity codes
 
         Parameters:
-        No parameters required.
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return self._send_request_and_deserialize(endpoints['Road_MetaSeverities'], endpoint_args=None, raw=raw, fields=fields)
+
+    def metaseveritiesstream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `metaseverities`: `ResponseModel.content` is an iterator over the items
+        of `models.StatusSeveritiesArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['Road_MetaSeverities'], endpoint_args=None, fields=fields)
+
+
+class AsyncRoadClient(AsyncClient):
+    async def get(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.RoadCorridorsArray | ApiError:
+        '''
+        Gets all roads managed by TfL
+
+        Parameters:
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Road_MetaSeverities'], endpoint_args=None)
+        return await self._send_request_and_deserialize(endpoints['Road_Get'], endpoint_args=None, raw=raw, fields=fields)
 
+    async def getstream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `get`: `ResponseModel.content` is an async iterator over the items
+        of `models.RoadCorridorsArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Road_Get'], endpoint_args=None, fields=fields)
+
+    async def getbypathids(self, ids: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.RoadCorridorsArray | ApiError:
+        '''
+        Gets the road with the specified id (e.g. A1)
+
+        Parameters:
+        ids: str - Comma-separated list of road identifiers e.g. "A406, A2" (a full list of supported road identifiers can be found at the /Road/ endpoint). Example: A1
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Road_GetByPathIds'], params=[ids], endpoint_args=None, raw=raw, fields=fields)
+
+    async def getbypathidsstream(self, ids: str, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `getbypathids`: `ResponseModel.content` is an async iterator over the items
+        of `models.RoadCorridorsArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Road_GetByPathIds'], params=[ids], endpoint_args=None, fields=fields)
+
+    async def statusbypathidsquerystartdatequeryenddate(self, ids: str, startDate: str | None = None, endDate: str | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.RoadCorridorsArray | ApiError:
+        '''
+        Gets the specified roads with the status aggregated over the date range specified, or now until the end of today if no dates are passed.
+
+        Parameters:
+        ids: str - Comma-separated list of road identifiers e.g. "A406, A2" or use "all" to ignore id filter (a full list of supported road identifiers can be found at the /Road/ endpoint). Example: A2
+        startDate: str - Format - date-time (as date-time in RFC3339). The start date to aggregate status from. Example: None given
+        endDate: str - Format - date-time (as date-time in RFC3339). The end date to aggregate status up to. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Road_StatusByPathIdsQueryStartDateQueryEndDate'], params=[ids], endpoint_args={ 'startDate': startDate, 'endDate': endDate }, raw=raw, fields=fields)
+
+    async def statusbypathidsquerystartdatequeryenddatestream(self, ids: str, startDate: str | None = None, endDate: str | None = None, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `statusbypathidsquerystartdatequeryenddate`: `ResponseModel.content` is an async iterator over the items
+        of `models.RoadCorridorsArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Road_StatusByPathIdsQueryStartDateQueryEndDate'], params=[ids], endpoint_args={ 'startDate': startDate, 'endDate': endDate }, fields=fields)
+
+    async def disruptionbypathidsquerystripcontentqueryseveritiesquerycategoriesquery(self, ids: str, stripContent: bool | None = None, severities: list | None = None, categories: list | None = None, closures: bool | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.RoadDisruptionsArray | ApiError:
+        '''
+        Get active disruptions, filtered by road ids
+
+        Parameters:
+        ids: str - Comma-separated list of road identifiers e.g. "A406, A2" use all for all to ignore id filter (a full list of supported road identifiers can be found at the /Road/ endpoint). Example: A406
+        stripContent: bool - Optional, defaults to false. When true, removes every property/node except for id, point, severity, severityDescription, startDate, endDate, corridor details, location, comments and streets. Example: None given
+        severities: list - an optional list of Severity names to filter on (a valid list of severities can be obtained from the /Road/Meta/severities endpoint). Example: None given
+        categories: list - an optional list of category names to filter on (a valid list of categories can be obtained from the /Road/Meta/categories endpoint). Example: None given
+        closures: bool - Optional, defaults to true. When true, always includes disruptions that have road closures, regardless of the severity filter. When false, the severity filter works as normal.. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Road_DisruptionByPathIdsQueryStripContentQuerySeveritiesQueryCategoriesQuery'], params=[ids], endpoint_args={ 'stripContent': stripContent, 'severities': severities, 'categories': categories, 'closures': closures }, raw=raw, fields=fields)
+
+    async def disruptionbypathidsquerystripcontentqueryseveritiesquerycategoriesquerystream(self, ids: str, stripContent: bool | None = None, severities: list | None = None, categories: list | None = None, closures: bool | None = None, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `disruptionbypathidsquerystripcontentqueryseveritiesquerycategoriesquery`: `ResponseModel.content` is an async iterator over the items
+        of `models.RoadDisruptionsArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Road_DisruptionByPathIdsQueryStripContentQuerySeveritiesQueryCategoriesQuery'], params=[ids], endpoint_args={ 'stripContent': stripContent, 'severities': severities, 'categories': categories, 'closures': closures }, fields=fields)
+
+    async def disruptedstreetsbyquerystartdatequeryenddate(self, startDate: str | None = None, endDate: str | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.Object | ApiError:
+        '''
+        Gets a list of disrupted streets. If no date filters are provided, current disruptions are returned.
+
+        Parameters:
+        startDate: str - Format - date-time (as date-time in RFC3339). Optional, the start time to filter on.. Example: 2024-03-01
+        endDate: str - Format - date-time (as date-time in RFC3339). Optional, The end time to filter on.. Example: 2024-03-31
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Road_DisruptedStreetsByQueryStartDateQueryEndDate'], endpoint_args={ 'startDate': startDate, 'endDate': endDate }, raw=raw, fields=fields)
+
+    async def disruptionbyidbypathdisruptionidsquerystripcontent(self, disruptionIds: str, stripContent: bool | None = None, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.RoadDisruption | ApiError:
+        '''
+        Gets a list of active disruptions filtered by disruption Ids.
+
+        Parameters:
+        disruptionIds: str - Comma-separated list of disruption identifiers to filter by.. Example: TIMS-89632
+        stripContent: bool - Optional, defaults to false. When true, removes every property/node except for id, point, severity, severityDescription, startDate, endDate, corridor details, location and comments.. Example: None given
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Road_DisruptionByIdByPathDisruptionIdsQueryStripContent'], params=[disruptionIds], endpoint_args={ 'stripContent': stripContent }, raw=raw, fields=fields)
+
+    async def metacategories(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.StringsArray | ApiError:
+        '''
+        Gets a list of valid RoadDisruption categories
+
+        Parameters:
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Road_MetaCategories'], endpoint_args=None, raw=raw, fields=fields)
+
+    async def metacategoriesstream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `metacategories`: `ResponseModel.content` is an async iterator over the items
+        of `models.StringsArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Road_MetaCategories'], endpoint_args=None, fields=fields)
+
+    async def metaseverities(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.StatusSeveritiesArray | ApiError:
+        '''
+        Gets a list of valid RoadDisruption severity codes
+
+        Parameters:
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Road_MetaSeverities'], endpoint_args=None, raw=raw, fields=fields)
+
+    async def metaseveritiesstream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `metaseverities`: `ResponseModel.content` is an async iterator over the items
+        of `models.StatusSeveritiesArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Road_MetaSeverities'], endpoint_args=None, fields=fields)
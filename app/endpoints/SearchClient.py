@@ -1,51 +1,153 @@
-from ..Client import Client
+from ..Client import Client, AsyncClient
 from .SearchClient_config import endpoints
 from .. import models
-from ..package_models import ApiError
+from ..package_models import ApiError, ResponseModel
 
 class SearchClient(Client):
-    def getbyqueryquery(self, query: str) -> models.SearchResponse | ApiError:
+    def getbyqueryquery(self, query: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.SearchResponse | ApiError:
         '''
         Search the site for occurrences of the query string. The maximum number of results returned is equal to the maximum page size of 100. To return subsequent pages, use the paginated overload.
 
         Parameters:
         query: str - The search query. Example: Southwark
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Search_GetByQueryQuery'], endpoint_args={ 'query': query })
+        return self._send_request_and_deserialize(endpoints['Search_GetByQueryQuery'], endpoint_args={ 'query': query }, raw=raw, fields=fields)
 
-    def busschedulesbyqueryquery(self, query: str) -> models.SearchResponse | ApiError:
+    def busschedulesbyqueryquery(self, query: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.SearchResponse | ApiError:
         '''
         Searches the bus schedules folder on S3 for a given bus number.
 
         Parameters:
         query: str - The search query. Example: Southwark
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Search_BusSchedulesByQueryQuery'], endpoint_args={ 'query': query })
+        return self._send_request_and_deserialize(endpoints['Search_BusSchedulesByQueryQuery'], endpoint_args={ 'query': query }, raw=raw, fields=fields)
 
-    def metasearchproviders(self, ) -> models.StringsArray | ApiError:
+    def metasearchproviders(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.StringsArray | ApiError:
         '''
         Gets the available searchProvider names.
 
         Parameters:
-        No parameters required.
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Search_MetaSearchProviders'], endpoint_args=None)
+        return self._send_request_and_deserialize(endpoints['Search_MetaSearchProviders'], endpoint_args=None, raw=raw, fields=fields)
 
-    def metacategories(self, ) -> models.StringsArray | ApiError:
+    def metasearchprovidersstream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `metasearchproviders`: `ResponseModel.content` is an iterator over the items
+        of `models.StringsArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['Search_MetaSearchProviders'], endpoint_args=None, fields=fields)
+
+    def metacategories(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.StringsArray | ApiError:
+        '''
+        Gets the available search categories.
+
+        Parameters:
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return self._send_request_and_deserialize(endpoints['Search_MetaCategories'], endpoint_args=None, raw=raw, fields=fields)
+
+    def metacategoriesstream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `metacategories`: `ResponseModel.content` is an iterator over the items
+        of `models.StringsArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['Search_MetaCategories'], endpoint_args=None, fields=fields)
+
+    def metasorts(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.StringsArray | ApiError:
+        '''
+        Gets the available sorting options.
+
+        Parameters:
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return self._send_request_and_deserialize(endpoints['Search_MetaSorts'], endpoint_args=None, raw=raw, fields=fields)
+
+    def metasortsstream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `metasorts`: `ResponseModel.content` is an iterator over the items
+        of `models.StringsArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['Search_MetaSorts'], endpoint_args=None, fields=fields)
+
+
+class AsyncSearchClient(AsyncClient):
+    async def getbyqueryquery(self, query: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.SearchResponse | ApiError:
+        '''
+        Search the site for occurrences of the query string. The maximum number of results returned is equal to the maximum page size of 100. To return subsequent pages, use the paginated overload.
+
+        Parameters:
+        query: str - The search query. Example: Southwark
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Search_GetByQueryQuery'], endpoint_args={ 'query': query }, raw=raw, fields=fields)
+
+    async def busschedulesbyqueryquery(self, query: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.SearchResponse | ApiError:
+        '''
+        Searches the bus schedules folder on S3 for a given bus number.
+
+        Parameters:
+        query: str - The search query. Example: Southwark
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Search_BusSchedulesByQueryQuery'], endpoint_args={ 'query': query }, raw=raw, fields=fields)
+
+    async def metasearchproviders(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.StringsArray | ApiError:
+        '''
+        Gets the available searchProvider names.
+
+        Parameters:
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Search_MetaSearchProviders'], endpoint_args=None, raw=raw, fields=fields)
+
+    async def metasearchprovidersstream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `metasearchproviders`: `ResponseModel.content` is an async iterator over the items
+        of `models.StringsArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Search_MetaSearchProviders'], endpoint_args=None, fields=fields)
+
+    async def metacategories(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.StringsArray | ApiError:
         '''
         Gets the available search categories.
 
         Parameters:
-        No parameters required.
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Search_MetaCategories'], endpoint_args=None, raw=raw, fields=fields)
+
+    async def metacategoriesstream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
         '''
-        return self._send_request_and_deserialize(endpoints['Search_MetaCategories'], endpoint_args=None)
+        Streaming variant of `metacategories`: `ResponseModel.content` is an async iterator over the items
+        of `models.StringsArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Search_MetaCategories'], endpoint_args=None, fields=fields)
 
-    def metasorts(self, ) -> models.StringsArray | ApiError:
+    async def metasorts(self, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.StringsArray | ApiError:
         '''
         Gets the available sorting options.
 
         Parameters:
-        No parameters required.
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Search_MetaSorts'], endpoint_args=None)
+        return await self._send_request_and_deserialize(endpoints['Search_MetaSorts'], endpoint_args=None, raw=raw, fields=fields)
 
+    async def metasortsstream(self, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `metasorts`: `ResponseModel.content` is an async iterator over the items
+        of `models.StringsArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Search_MetaSorts'], endpoint_args=None, fields=fields)
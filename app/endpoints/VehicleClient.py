@@ -1,15 +1,60 @@
-from ..Client import Client
+from ..Client import Client, AsyncClient
 from .VehicleClient_config import endpoints
 from .. import models
-from ..package_models import ApiError
+from ..package_models import ApiError, ResponseModel, BatchResponseModel
+from typing import List
 
 class VehicleClient(Client):
-    def getbypathids(self, ids: str) -> models.PredictionArray | ApiError:
+    def getbypathids(self, ids: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.PredictionArray | ApiError:
         '''
         Gets the predictions for a given list of vehicle Id's.
 
         Parameters:
         ids: str - A comma-separated list of vehicle ids e.g. LX58CFV,LX11AZB,LX58CFE. Max approx. 25 ids.. Example: LX11AZB
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
         '''
-        return self._send_request_and_deserialize(endpoints['Vehicle_GetByPathIds'], params=[ids], endpoint_args=None)
+        return self._send_request_and_deserialize(endpoints['Vehicle_GetByPathIds'], params=[ids], endpoint_args=None, raw=raw, fields=fields)
 
+    def getbypathidsstream(self, ids: str, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `getbypathids`: `ResponseModel.content` is an iterator over the items
+        of `models.PredictionArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return self._stream_request_and_deserialize(endpoints['Vehicle_GetByPathIds'], params=[ids], endpoint_args=None, fields=fields)
+
+    def getbypathidsbatch(self, ids: List[str], chunk_size: int = 25) -> BatchResponseModel:
+        '''
+        Batch variant of `getbypathids`: splits `ids` into chunks of at most `chunk_size` ids,
+        requests the chunks concurrently and merges them into one `models.PredictionArray`.
+        Chunks that fail are reported in `BatchResponseModel.errors`.
+        '''
+        return self._send_batched_request_and_deserialize(endpoints['Vehicle_GetByPathIds'], ids, chunk_size, params=[ids], ids_index=0, endpoint_args=None)
+
+
+class AsyncVehicleClient(AsyncClient):
+    async def getbypathids(self, ids: str, raw: bool | None = None, fields: tuple[str, ...] | None = None) -> models.PredictionArray | ApiError:
+        '''
+        Gets the predictions for a given list of vehicle Id's.
+
+        Parameters:
+        ids: str - A comma-separated list of vehicle ids e.g. LX58CFV,LX11AZB,LX58CFE. Max approx. 25 ids.. Example: LX11AZB
+        raw: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.
+        fields: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays).
+        '''
+        return await self._send_request_and_deserialize(endpoints['Vehicle_GetByPathIds'], params=[ids], endpoint_args=None, raw=raw, fields=fields)
+
+    async def getbypathidsstream(self, ids: str, fields: tuple[str, ...] | None = None) -> ResponseModel | ApiError:
+        '''
+        Streaming variant of `getbypathids`: `ResponseModel.content` is an async iterator over the items
+        of `models.PredictionArray`, each validated as soon as it has been received. Responses are not cached.
+        '''
+        return await self._stream_request_and_deserialize(endpoints['Vehicle_GetByPathIds'], params=[ids], endpoint_args=None, fields=fields)
+
+    async def getbypathidsbatch(self, ids: List[str], chunk_size: int = 25) -> BatchResponseModel:
+        '''
+        Batch variant of `getbypathids`: splits `ids` into chunks of at most `chunk_size` ids,
+        requests the chunks concurrently and merges them into one `models.PredictionArray`.
+        Chunks that fail are reported in `BatchResponseModel.errors`.
+        '''
+        return await self._send_batched_request_and_deserialize(endpoints['Vehicle_GetByPathIds'], ids, chunk_size, params=[ids], ids_index=0, endpoint_args=None)
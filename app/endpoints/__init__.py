@@ -1,30 +1,80 @@
-from .LineClient import LineClient
-from .OccupancyClient import OccupancyClient
-from .VehicleClient import VehicleClient
-from .ModeClient import ModeClient
-from .CrowdingClient import CrowdingClient
-from .PlaceClient import PlaceClient
-from .AirQualityClient import AirQualityClient
-from .SearchClient import SearchClient
-from .StopPointClient import StopPointClient
-from .JourneyClient import JourneyClient
-from .BikePointClient import BikePointClient
-from .AccidentStatsClient import AccidentStatsClient
-from .LiftDisruptionsClient import LiftDisruptionsClient
-from .RoadClient import RoadClient
+from typing import TYPE_CHECKING
+from ..lazy import lazy_package
+
+if TYPE_CHECKING:
+    from .LineClient import LineClient, AsyncLineClient
+    from .OccupancyClient import OccupancyClient, AsyncOccupancyClient
+    from .VehicleClient import VehicleClient, AsyncVehicleClient
+    from .ModeClient import ModeClient, AsyncModeClient
+    from .CrowdingClient import CrowdingClient, AsyncCrowdingClient
+    from .PlaceClient import PlaceClient, AsyncPlaceClient
+    from .AirQualityClient import AirQualityClient, AsyncAirQualityClient
+    from .SearchClient import SearchClient, AsyncSearchClient
+    from .StopPointClient import StopPointClient, AsyncStopPointClient
+    from .JourneyClient import JourneyClient, AsyncJourneyClient
+    from .BikePointClient import BikePointClient, AsyncBikePointClient
+    from .AccidentStatsClient import AccidentStatsClient, AsyncAccidentStatsClient
+    from .LiftDisruptionsClient import LiftDisruptionsClient, AsyncLiftDisruptionsClient
+    from .RoadClient import RoadClient, AsyncRoadClient
+
+__getattr__, __dir__ = lazy_package(__name__, {
+    'LineClient': ('.LineClient', 'LineClient'),
+    'OccupancyClient': ('.OccupancyClient', 'OccupancyClient'),
+    'VehicleClient': ('.VehicleClient', 'VehicleClient'),
+    'ModeClient': ('.ModeClient', 'ModeClient'),
+    'CrowdingClient': ('.CrowdingClient', 'CrowdingClient'),
+    'PlaceClient': ('.PlaceClient', 'PlaceClient'),
+    'AirQualityClient': ('.AirQualityClient', 'AirQualityClient'),
+    'SearchClient': ('.SearchClient', 'SearchClient'),
+    'StopPointClient': ('.StopPointClient', 'StopPointClient'),
+    'JourneyClient': ('.JourneyClient', 'JourneyClient'),
+    'BikePointClient': ('.BikePointClient', 'BikePointClient'),
+    'AccidentStatsClient': ('.AccidentStatsClient', 'AccidentStatsClient'),
+    'LiftDisruptionsClient': ('.LiftDisruptionsClient', 'LiftDisruptionsClient'),
+    'RoadClient': ('.RoadClient', 'RoadClient'),
+    'AsyncLineClient': ('.LineClient', 'AsyncLineClient'),
+    'AsyncOccupancyClient': ('.OccupancyClient', 'AsyncOccupancyClient'),
+    'AsyncVehicleClient': ('.VehicleClient', 'AsyncVehicleClient'),
+    'AsyncModeClient': ('.ModeClient', 'AsyncModeClient'),
+    'AsyncCrowdingClient': ('.CrowdingClient', 'AsyncCrowdingClient'),
+    'AsyncPlaceClient': ('.PlaceClient', 'AsyncPlaceClient'),
+    'AsyncAirQualityClient': ('.AirQualityClient', 'AsyncAirQualityClient'),
+    'AsyncSearchClient': ('.SearchClient', 'AsyncSearchClient'),
+    'AsyncStopPointClient': ('.StopPointClient', 'AsyncStopPointClient'),
+    'AsyncJourneyClient': ('.JourneyClient', 'AsyncJourneyClient'),
+    'AsyncBikePointClient': ('.BikePointClient', 'AsyncBikePointClient'),
+    'AsyncAccidentStatsClient': ('.AccidentStatsClient', 'AsyncAccidentStatsClient'),
+    'AsyncLiftDisruptionsClient': ('.LiftDisruptionsClient', 'AsyncLiftDisruptionsClient'),
+    'AsyncRoadClient': ('.RoadClient', 'AsyncRoadClient'),
+})
+
 __all__ = [
-    'LineClient',
-    'OccupancyClient',
-    'VehicleClient',
-    'ModeClient',
-    'CrowdingClient',
-    'PlaceClient',
-    'AirQualityClient',
-    'SearchClient',
-    'StopPointClient',
-    'JourneyClient',
-    'BikePointClient',
-    'AccidentStatsClient',
-    'LiftDisruptionsClient',
-    'RoadClient'
+    "LineClient",
+    "OccupancyClient",
+    "VehicleClient",
+    "ModeClient",
+    "CrowdingClient",
+    "PlaceClient",
+    "AirQualityClient",
+    "SearchClient",
+    "StopPointClient",
+    "JourneyClient",
+    "BikePointClient",
+    "AccidentStatsClient",
+    "LiftDisruptionsClient",
+    "RoadClient",
+    "AsyncLineClient",
+    "AsyncOccupancyClient",
+    "AsyncVehicleClient",
+    "AsyncModeClient",
+    "AsyncCrowdingClient",
+    "AsyncPlaceClient",
+    "AsyncAirQualityClient",
+    "AsyncSearchClient",
+    "AsyncStopPointClient",
+    "AsyncJourneyClient",
+    "AsyncBikePointClient",
+    "AsyncAccidentStatsClient",
+    "AsyncLiftDisruptionsClient",
+    "AsyncRoadClient"
 ]
@@ -3,7 +3,7 @@ from .Crowding import Crowding
 from .RouteTypeEnum import RouteTypeEnum
 from .StatusEnum import StatusEnum
 from pydantic import BaseModel, Field
-from typing import Optional, Type
+from typing import Optional
 
 
 class Identifier(BaseModel):
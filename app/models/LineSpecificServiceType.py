@@ -1,7 +1,7 @@
 from pydantic import BaseModel, Field
 from .LineServiceTypeInfo import LineServiceTypeInfo
 from pydantic import BaseModel, Field
-from typing import Optional, Type
+from typing import Optional
 
 
 class LineSpecificServiceType(BaseModel):
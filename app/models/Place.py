@@ -1,7 +1,6 @@
 from pydantic import BaseModel, Field
 from .AdditionalProperties import AdditionalProperties
 from pydantic import BaseModel, Field
-from typing import ForwardRef
 
 
 class Place(BaseModel):
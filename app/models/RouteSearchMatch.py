@@ -3,7 +3,7 @@ from .LineRouteSection import LineRouteSection
 from .MatchedRouteSections import MatchedRouteSections
 from .MatchedStop import MatchedStop
 from pydantic import BaseModel, Field
-from typing import List, Match, Optional
+from typing import List, Optional
 
 
 class RouteSearchMatch(BaseModel):
@@ -2,7 +2,7 @@ from pydantic import BaseModel, Field
 from .DateTimeTypeEnum import DateTimeTypeEnum
 from .TimeAdjustments import TimeAdjustments
 from pydantic import BaseModel, Field
-from typing import Optional, Type
+from typing import Optional
 
 
 class SearchCriteria(BaseModel):
@@ -1,7 +1,7 @@
 from pydantic import BaseModel, Field
 from .SearchMatch import SearchMatch
 from pydantic import BaseModel, Field
-from typing import List, Match, Optional
+from typing import List, Optional
 
 
 class SearchResponse(BaseModel):
@@ -3,7 +3,7 @@ from .Disambiguation import Disambiguation
 from .MatchedStop import MatchedStop
 from .Timetable import Timetable
 from pydantic import BaseModel, Field
-from typing import List, Match, Optional
+from typing import List, Optional
 
 
 class TimetableResponse(BaseModel):
@@ -1,185 +1,262 @@
-from .ObjectResponse import ObjectResponse
-from .Mode import Mode
-from .Place import Place
-from .StopPoint import StopPoint
-from .RouteSectionNaptanEntrySequence import RouteSectionNaptanEntrySequence
-from .RouteSection import RouteSection
-from .Disruption import Disruption
-from .ValidityPeriod import ValidityPeriod
-from .LineStatus import LineStatus
-from .MatchedRoute import MatchedRoute
-from .LineServiceTypeInfo import LineServiceTypeInfo
-from .Line import Line
-from .StatusSeverity import StatusSeverity
-from .MatchedStop import MatchedStop
-from .StopPointSequence import StopPointSequence
-from .OrderedRoute import OrderedRoute
-from .RouteSequence import RouteSequence
-from .LineRouteSection import LineRouteSection
-from .MatchedRouteSections import MatchedRouteSections
-from .RouteSearchMatch import RouteSearchMatch
-from .RouteSearchResponse import RouteSearchResponse
-from .Interval import Interval
-from .StationInterval import StationInterval
-from .PassengerFlow import PassengerFlow
-from .KnownJourney import KnownJourney
-from .TwentyFourHourClockTime import TwentyFourHourClockTime
-from .ServiceFrequency import ServiceFrequency
-from .Period import Period
-from .Schedule import Schedule
-from .TimetableRoute import TimetableRoute
-from .Timetable import Timetable
-from .DisambiguationOption import DisambiguationOption
-from .Disambiguation import Disambiguation
-from .TimetableResponse import TimetableResponse
-from .TrainLoading import TrainLoading
-from .PredictionTiming import PredictionTiming
-from .Prediction import Prediction
-from .Crowding import Crowding
-from .Identifier import Identifier
-from .LineGroup import LineGroup
-from .LineModeGroup import LineModeGroup
-from .AdditionalProperties import AdditionalProperties
-from .Bay import Bay
-from .CarParkOccupancy import CarParkOccupancy
-from .ChargeConnectorOccupancy import ChargeConnectorOccupancy
-from .BikePointOccupancy import BikePointOccupancy
-from .VehicleMatch import VehicleMatch
-from .ActiveServiceType import ActiveServiceType
-from .Object import Object
-from .PlaceCategory import PlaceCategory
-from .LondonAirForecast import LondonAirForecast
-from .SearchMatch import SearchMatch
-from .SearchResponse import SearchResponse
-from .LineSpecificServiceType import LineSpecificServiceType
-from .LineServiceType import LineServiceType
-from .ArrivalDeparture import ArrivalDeparture
-from .StopPointRouteSection import StopPointRouteSection
-from .DisruptedPoint import DisruptedPoint
-from .StopPointsResponse import StopPointsResponse
-from .JpElevation import JpElevation
-from .Path import Path
-from .RouteOption import RouteOption
-from .PathAttribute import PathAttribute
-from .PlannedWork import PlannedWork
-from .Leg import Leg
-from .FareTapDetails import FareTapDetails
-from .FareTap import FareTap
-from .Fare import Fare
-from .FareCaveat import FareCaveat
-from .JourneyFare import JourneyFare
-from .Journey import Journey
-from .InstructionStep import InstructionStep
-from .JourneyPlannerCycleHireDockingStationData import JourneyPlannerCycleHireDockingStationData
-from .TimeAdjustment import TimeAdjustment
-from .TimeAdjustments import TimeAdjustments
-from .SearchCriteria import SearchCriteria
-from .JourneyVector import JourneyVector
-from .Instruction import Instruction
-from .ItineraryResult import ItineraryResult
-from .Obstacle import Obstacle
-from .Point import Point
-from .AccidentDetail import AccidentDetail
-from .Casualty import Casualty
-from .Vehicle import Vehicle
-from .LiftDisruption import LiftDisruption
-from .DbGeographyWellKnownValue import DbGeographyWellKnownValue
-from .DbGeography import DbGeography
-from .RoadCorridor import RoadCorridor
-from .StreetSegment import StreetSegment
-from .Street import Street
-from .RoadProject import RoadProject
-from .RoadDisruptionLine import RoadDisruptionLine
-from .RoadDisruptionImpactArea import RoadDisruptionImpactArea
-from .RoadDisruptionSchedule import RoadDisruptionSchedule
-from .RoadDisruption import RoadDisruption
-from .ModeArray import ModeArray
-from .StatusSeveritiesArray import StatusSeveritiesArray
-from .StringsArray import StringsArray
-from .LineArray import LineArray
-from .StopPointArray import StopPointArray
-from .DisruptionsArray import DisruptionsArray
-from .PredictionArray import PredictionArray
-from .ActiveServiceTypesArray import ActiveServiceTypesArray
-from .PlaceCategoryArray import PlaceCategoryArray
-from .PlaceArray import PlaceArray
-from .AccidentDetailArray import AccidentDetailArray
-from .LiftDisruptionsArray import LiftDisruptionsArray
-from .RoadCorridorsArray import RoadCorridorsArray
-from .RoadDisruptionsArray import RoadDisruptionsArray
-from .ChargeConnectorOccupancyArray import ChargeConnectorOccupancyArray
-from .BikePointOccupancyArray import BikePointOccupancyArray
-from .StopPointCategoryArray import StopPointCategoryArray
-from .LineServiceTypeArray import LineServiceTypeArray
-from .ArrivalDepartureArray import ArrivalDepartureArray
-from .StopPointRouteSectionArray import StopPointRouteSectionArray
-from .DisruptedPointArray import DisruptedPointArray
-from .GenericResponseModel import GenericResponseModel
+from typing import TYPE_CHECKING
+from ..lazy import lazy_package
+
+if TYPE_CHECKING:
+    from .Place import Place
+    from .AdditionalProperties import AdditionalProperties
+    from .SearchMatch import SearchMatch
+    from .SearchResponse import SearchResponse
+    from .Mode import Mode
+    from .Identifier import Identifier
+    from .JpElevation import JpElevation
+    from .Path import Path
+    from .RouteOption import RouteOption
+    from .LineGroup import LineGroup
+    from .LineModeGroup import LineModeGroup
+    from .StopPoint import StopPoint
+    from .RouteSectionNaptanEntrySequence import RouteSectionNaptanEntrySequence
+    from .PathAttribute import PathAttribute
+    from .RouteSection import RouteSection
+    from .Disruption import Disruption
+    from .PlannedWork import PlannedWork
+    from .Leg import Leg
+    from .FareTapDetails import FareTapDetails
+    from .FareTap import FareTap
+    from .Fare import Fare
+    from .FareCaveat import FareCaveat
+    from .JourneyFare import JourneyFare
+    from .Journey import Journey
+    from .InstructionStep import InstructionStep
+    from .ValidityPeriod import ValidityPeriod
+    from .LineStatus import LineStatus
+    from .MatchedRoute import MatchedRoute
+    from .LineServiceTypeInfo import LineServiceTypeInfo
+    from .Line import Line
+    from .JourneyPlannerCycleHireDockingStationData import JourneyPlannerCycleHireDockingStationData
+    from .TimeAdjustment import TimeAdjustment
+    from .TimeAdjustments import TimeAdjustments
+    from .SearchCriteria import SearchCriteria
+    from .JourneyVector import JourneyVector
+    from .Instruction import Instruction
+    from .ItineraryResult import ItineraryResult
+    from .Obstacle import Obstacle
+    from .Point import Point
+    from .PassengerFlow import PassengerFlow
+    from .TrainLoading import TrainLoading
+    from .Crowding import Crowding
+    from .ObjectResponse import ObjectResponse
+    from .Object import Object
+    from .PlaceCategory import PlaceCategory
+    from .AccidentDetail import AccidentDetail
+    from .Casualty import Casualty
+    from .Vehicle import Vehicle
+    from .DbGeographyWellKnownValue import DbGeographyWellKnownValue
+    from .DbGeography import DbGeography
+    from .RoadCorridor import RoadCorridor
+    from .StreetSegment import StreetSegment
+    from .Street import Street
+    from .RoadProject import RoadProject
+    from .RoadDisruptionLine import RoadDisruptionLine
+    from .RoadDisruptionImpactArea import RoadDisruptionImpactArea
+    from .RoadDisruptionSchedule import RoadDisruptionSchedule
+    from .RoadDisruption import RoadDisruption
+    from .StatusSeverity import StatusSeverity
+    from .Bay import Bay
+    from .CarParkOccupancy import CarParkOccupancy
+    from .ChargeConnectorOccupancy import ChargeConnectorOccupancy
+    from .BikePointOccupancy import BikePointOccupancy
+    from .ActiveServiceType import ActiveServiceType
+    from .Prediction import Prediction
+    from .PredictionTiming import PredictionTiming
+    from .MatchedStop import MatchedStop
+    from .StopPointSequence import StopPointSequence
+    from .OrderedRoute import OrderedRoute
+    from .RouteSequence import RouteSequence
+    from .LineRouteSection import LineRouteSection
+    from .MatchedRouteSections import MatchedRouteSections
+    from .RouteSearchMatch import RouteSearchMatch
+    from .RouteSearchResponse import RouteSearchResponse
+    from .Interval import Interval
+    from .StationInterval import StationInterval
+    from .KnownJourney import KnownJourney
+    from .TwentyFourHourClockTime import TwentyFourHourClockTime
+    from .ServiceFrequency import ServiceFrequency
+    from .Period import Period
+    from .Schedule import Schedule
+    from .TimetableRoute import TimetableRoute
+    from .Timetable import Timetable
+    from .DisambiguationOption import DisambiguationOption
+    from .Disambiguation import Disambiguation
+    from .TimetableResponse import TimetableResponse
+    from .LondonAirForecast import LondonAirForecast
+    from .LineSpecificServiceType import LineSpecificServiceType
+    from .LineServiceType import LineServiceType
+    from .ArrivalDeparture import ArrivalDeparture
+    from .StopPointRouteSection import StopPointRouteSection
+    from .DisruptedPoint import DisruptedPoint
+    from .StopPointsResponse import StopPointsResponse
+    from .VehicleMatch import VehicleMatch
+    from .LiftDisruption import LiftDisruption
+    from .PlaceArray import PlaceArray
+    from .StringsArray import StringsArray
+    from .ModeArray import ModeArray
+    from .PlaceCategoryArray import PlaceCategoryArray
+    from .StopPointArray import StopPointArray
+    from .AccidentDetailArray import AccidentDetailArray
+    from .RoadCorridorsArray import RoadCorridorsArray
+    from .RoadDisruptionsArray import RoadDisruptionsArray
+    from .StatusSeveritiesArray import StatusSeveritiesArray
+    from .ActiveServiceTypesArray import ActiveServiceTypesArray
+    from .PredictionArray import PredictionArray
+    from .LineArray import LineArray
+    from .DisruptionsArray import DisruptionsArray
+    from .LiftDisruptionsArray import LiftDisruptionsArray
+    from .ChargeConnectorOccupancyArray import ChargeConnectorOccupancyArray
+    from .BikePointOccupancyArray import BikePointOccupancyArray
+    from .StopPointCategoryArray import StopPointCategoryArray
+    from .LineServiceTypeArray import LineServiceTypeArray
+    from .ArrivalDepartureArray import ArrivalDepartureArray
+    from .StopPointRouteSectionArray import StopPointRouteSectionArray
+    from .DisruptedPointArray import DisruptedPointArray
+    from .GenericResponseModel import GenericResponseModel
+
+__getattr__, __dir__ = lazy_package(__name__, {
+    'Place': ('.Place', 'Place'),
+    'AdditionalProperties': ('.AdditionalProperties', 'AdditionalProperties'),
+    'SearchMatch': ('.SearchMatch', 'SearchMatch'),
+    'SearchResponse': ('.SearchResponse', 'SearchResponse'),
+    'Mode': ('.Mode', 'Mode'),
+    'Identifier': ('.Identifier', 'Identifier'),
+    'JpElevation': ('.JpElevation', 'JpElevation'),
+    'Path': ('.Path', 'Path'),
+    'RouteOption': ('.RouteOption', 'RouteOption'),
+    'LineGroup': ('.LineGroup', 'LineGroup'),
+    'LineModeGroup': ('.LineModeGroup', 'LineModeGroup'),
+    'StopPoint': ('.StopPoint', 'StopPoint'),
+    'RouteSectionNaptanEntrySequence': ('.RouteSectionNaptanEntrySequence', 'RouteSectionNaptanEntrySequence'),
+    'PathAttribute': ('.PathAttribute', 'PathAttribute'),
+    'RouteSection': ('.RouteSection', 'RouteSection'),
+    'Disruption': ('.Disruption', 'Disruption'),
+    'PlannedWork': ('.PlannedWork', 'PlannedWork'),
+    'Leg': ('.Leg', 'Leg'),
+    'FareTapDetails': ('.FareTapDetails', 'FareTapDetails'),
+    'FareTap': ('.FareTap', 'FareTap'),
+    'Fare': ('.Fare', 'Fare'),
+    'FareCaveat': ('.FareCaveat', 'FareCaveat'),
+    'JourneyFare': ('.JourneyFare', 'JourneyFare'),
+    'Journey': ('.Journey', 'Journey'),
+    'InstructionStep': ('.InstructionStep', 'InstructionStep'),
+    'ValidityPeriod': ('.ValidityPeriod', 'ValidityPeriod'),
+    'LineStatus': ('.LineStatus', 'LineStatus'),
+    'MatchedRoute': ('.MatchedRoute', 'MatchedRoute'),
+    'LineServiceTypeInfo': ('.LineServiceTypeInfo', 'LineServiceTypeInfo'),
+    'Line': ('.Line', 'Line'),
+    'JourneyPlannerCycleHireDockingStationData': ('.JourneyPlannerCycleHireDockingStationData', 'JourneyPlannerCycleHireDockingStationData'),
+    'TimeAdjustment': ('.TimeAdjustment', 'TimeAdjustment'),
+    'TimeAdjustments': ('.TimeAdjustments', 'TimeAdjustments'),
+    'SearchCriteria': ('.SearchCriteria', 'SearchCriteria'),
+    'JourneyVector': ('.JourneyVector', 'JourneyVector'),
+    'Instruction': ('.Instruction', 'Instruction'),
+    'ItineraryResult': ('.ItineraryResult', 'ItineraryResult'),
+    'Obstacle': ('.Obstacle', 'Obstacle'),
+    'Point': ('.Point', 'Point'),
+    'PassengerFlow': ('.PassengerFlow', 'PassengerFlow'),
+    'TrainLoading': ('.TrainLoading', 'TrainLoading'),
+    'Crowding': ('.Crowding', 'Crowding'),
+    'ObjectResponse': ('.ObjectResponse', 'ObjectResponse'),
+    'Object': ('.Object', 'Object'),
+    'PlaceCategory': ('.PlaceCategory', 'PlaceCategory'),
+    'AccidentDetail': ('.AccidentDetail', 'AccidentDetail'),
+    'Casualty': ('.Casualty', 'Casualty'),
+    'Vehicle': ('.Vehicle', 'Vehicle'),
+    'DbGeographyWellKnownValue': ('.DbGeographyWellKnownValue', 'DbGeographyWellKnownValue'),
+    'DbGeography': ('.DbGeography', 'DbGeography'),
+    'RoadCorridor': ('.RoadCorridor', 'RoadCorridor'),
+    'StreetSegment': ('.StreetSegment', 'StreetSegment'),
+    'Street': ('.Street', 'Street'),
+    'RoadProject': ('.RoadProject', 'RoadProject'),
+    'RoadDisruptionLine': ('.RoadDisruptionLine', 'RoadDisruptionLine'),
+    'RoadDisruptionImpactArea': ('.RoadDisruptionImpactArea', 'RoadDisruptionImpactArea'),
+    'RoadDisruptionSchedule': ('.RoadDisruptionSchedule', 'RoadDisruptionSchedule'),
+    'RoadDisruption': ('.RoadDisruption', 'RoadDisruption'),
+    'StatusSeverity': ('.StatusSeverity', 'StatusSeverity'),
+    'Bay': ('.Bay', 'Bay'),
+    'CarParkOccupancy': ('.CarParkOccupancy', 'CarParkOccupancy'),
+    'ChargeConnectorOccupancy': ('.ChargeConnectorOccupancy', 'ChargeConnectorOccupancy'),
+    'BikePointOccupancy': ('.BikePointOccupancy', 'BikePointOccupancy'),
+    'ActiveServiceType': ('.ActiveServiceType', 'ActiveServiceType'),
+    'Prediction': ('.Prediction', 'Prediction'),
+    'PredictionTiming': ('.PredictionTiming', 'PredictionTiming'),
+    'MatchedStop': ('.MatchedStop', 'MatchedStop'),
+    'StopPointSequence': ('.StopPointSequence', 'StopPointSequence'),
+    'OrderedRoute': ('.OrderedRoute', 'OrderedRoute'),
+    'RouteSequence': ('.RouteSequence', 'RouteSequence'),
+    'LineRouteSection': ('.LineRouteSection', 'LineRouteSection'),
+    'MatchedRouteSections': ('.MatchedRouteSections', 'MatchedRouteSections'),
+    'RouteSearchMatch': ('.RouteSearchMatch', 'RouteSearchMatch'),
+    'RouteSearchResponse': ('.RouteSearchResponse', 'RouteSearchResponse'),
+    'Interval': ('.Interval', 'Interval'),
+    'StationInterval': ('.StationInterval', 'StationInterval'),
+    'KnownJourney': ('.KnownJourney', 'KnownJourney'),
+    'TwentyFourHourClockTime': ('.TwentyFourHourClockTime', 'TwentyFourHourClockTime'),
+    'ServiceFrequency': ('.ServiceFrequency', 'ServiceFrequency'),
+    'Period': ('.Period', 'Period'),
+    'Schedule': ('.Schedule', 'Schedule'),
+    'TimetableRoute': ('.TimetableRoute', 'TimetableRoute'),
+    'Timetable': ('.Timetable', 'Timetable'),
+    'DisambiguationOption': ('.DisambiguationOption', 'DisambiguationOption'),
+    'Disambiguation': ('.Disambiguation', 'Disambiguation'),
+    'TimetableResponse': ('.TimetableResponse', 'TimetableResponse'),
+    'LondonAirForecast': ('.LondonAirForecast', 'LondonAirForecast'),
+    'LineSpecificServiceType': ('.LineSpecificServiceType', 'LineSpecificServiceType'),
+    'LineServiceType': ('.LineServiceType', 'LineServiceType'),
+    'ArrivalDeparture': ('.ArrivalDeparture', 'ArrivalDeparture'),
+    'StopPointRouteSection': ('.StopPointRouteSection', 'StopPointRouteSection'),
+    'DisruptedPoint': ('.DisruptedPoint', 'DisruptedPoint'),
+    'StopPointsResponse': ('.StopPointsResponse', 'StopPointsResponse'),
+    'VehicleMatch': ('.VehicleMatch', 'VehicleMatch'),
+    'LiftDisruption': ('.LiftDisruption', 'LiftDisruption'),
+    'PlaceArray': ('.PlaceArray', 'PlaceArray'),
+    'StringsArray': ('.StringsArray', 'StringsArray'),
+    'ModeArray': ('.ModeArray', 'ModeArray'),
+    'PlaceCategoryArray': ('.PlaceCategoryArray', 'PlaceCategoryArray'),
+    'StopPointArray': ('.StopPointArray', 'StopPointArray'),
+    'AccidentDetailArray': ('.AccidentDetailArray', 'AccidentDetailArray'),
+    'RoadCorridorsArray': ('.RoadCorridorsArray', 'RoadCorridorsArray'),
+    'RoadDisruptionsArray': ('.RoadDisruptionsArray', 'RoadDisruptionsArray'),
+    'StatusSeveritiesArray': ('.StatusSeveritiesArray', 'StatusSeveritiesArray'),
+    'ActiveServiceTypesArray': ('.ActiveServiceTypesArray', 'ActiveServiceTypesArray'),
+    'PredictionArray': ('.PredictionArray', 'PredictionArray'),
+    'LineArray': ('.LineArray', 'LineArray'),
+    'DisruptionsArray': ('.DisruptionsArray', 'DisruptionsArray'),
+    'LiftDisruptionsArray': ('.LiftDisruptionsArray', 'LiftDisruptionsArray'),
+    'ChargeConnectorOccupancyArray': ('.ChargeConnectorOccupancyArray', 'ChargeConnectorOccupancyArray'),
+    'BikePointOccupancyArray': ('.BikePointOccupancyArray', 'BikePointOccupancyArray'),
+    'StopPointCategoryArray': ('.StopPointCategoryArray', 'StopPointCategoryArray'),
+    'LineServiceTypeArray': ('.LineServiceTypeArray', 'LineServiceTypeArray'),
+    'ArrivalDepartureArray': ('.ArrivalDepartureArray', 'ArrivalDepartureArray'),
+    'StopPointRouteSectionArray': ('.StopPointRouteSectionArray', 'StopPointRouteSectionArray'),
+    'DisruptedPointArray': ('.DisruptedPointArray', 'DisruptedPointArray'),
+    'GenericResponseModel': ('.GenericResponseModel', 'GenericResponseModel'),
+})
 
 __all__ = [
-    "ObjectResponse",
-    "Mode",
     "Place",
-    "StopPoint",
-    "RouteSectionNaptanEntrySequence",
-    "RouteSection",
-    "Disruption",
-    "ValidityPeriod",
-    "LineStatus",
-    "MatchedRoute",
-    "LineServiceTypeInfo",
-    "Line",
-    "StatusSeverity",
-    "MatchedStop",
-    "StopPointSequence",
-    "OrderedRoute",
-    "RouteSequence",
-    "LineRouteSection",
-    "MatchedRouteSections",
-    "RouteSearchMatch",
-    "RouteSearchResponse",
-    "Interval",
-    "StationInterval",
-    "PassengerFlow",
-    "KnownJourney",
-    "TwentyFourHourClockTime",
-    "ServiceFrequency",
-    "Period",
-    "Schedule",
-    "TimetableRoute",
-    "Timetable",
-    "DisambiguationOption",
-    "Disambiguation",
-    "TimetableResponse",
-    "TrainLoading",
-    "PredictionTiming",
-    "Prediction",
-    "Crowding",
-    "Identifier",
-    "LineGroup",
-    "LineModeGroup",
     "AdditionalProperties",
-    "Bay",
-    "CarParkOccupancy",
-    "ChargeConnectorOccupancy",
-    "BikePointOccupancy",
-    "VehicleMatch",
-    "ActiveServiceType",
-    "Object",
-    "PlaceCategory",
-    "LondonAirForecast",
     "SearchMatch",
     "SearchResponse",
-    "LineSpecificServiceType",
-    "LineServiceType",
-    "ArrivalDeparture",
-    "StopPointRouteSection",
-    "DisruptedPoint",
-    "StopPointsResponse",
+    "Mode",
+    "Identifier",
     "JpElevation",
     "Path",
     "RouteOption",
+    "LineGroup",
+    "LineModeGroup",
+    "StopPoint",
+    "RouteSectionNaptanEntrySequence",
     "PathAttribute",
+    "RouteSection",
+    "Disruption",
     "PlannedWork",
     "Leg",
     "FareTapDetails",
@@ -189,6 +266,11 @@ __all__ = [
     "JourneyFare",
     "Journey",
     "InstructionStep",
+    "ValidityPeriod",
+    "LineStatus",
+    "MatchedRoute",
+    "LineServiceTypeInfo",
+    "Line",
     "JourneyPlannerCycleHireDockingStationData",
     "TimeAdjustment",
     "TimeAdjustments",
@@ -198,10 +280,15 @@ __all__ = [
     "ItineraryResult",
     "Obstacle",
     "Point",
+    "PassengerFlow",
+    "TrainLoading",
+    "Crowding",
+    "ObjectResponse",
+    "Object",
+    "PlaceCategory",
     "AccidentDetail",
     "Casualty",
     "Vehicle",
-    "LiftDisruption",
     "DbGeographyWellKnownValue",
     "DbGeography",
     "RoadCorridor",
@@ -212,20 +299,57 @@ __all__ = [
     "RoadDisruptionImpactArea",
     "RoadDisruptionSchedule",
     "RoadDisruption",
-    "ModeArray",
-    "StatusSeveritiesArray",
+    "StatusSeverity",
+    "Bay",
+    "CarParkOccupancy",
+    "ChargeConnectorOccupancy",
+    "BikePointOccupancy",
+    "ActiveServiceType",
+    "Prediction",
+    "PredictionTiming",
+    "MatchedStop",
+    "StopPointSequence",
+    "OrderedRoute",
+    "RouteSequence",
+    "LineRouteSection",
+    "MatchedRouteSections",
+    "RouteSearchMatch",
+    "RouteSearchResponse",
+    "Interval",
+    "StationInterval",
+    "KnownJourney",
+    "TwentyFourHourClockTime",
+    "ServiceFrequency",
+    "Period",
+    "Schedule",
+    "TimetableRoute",
+    "Timetable",
+    "DisambiguationOption",
+    "Disambiguation",
+    "TimetableResponse",
+    "LondonAirForecast",
+    "LineSpecificServiceType",
+    "LineServiceType",
+    "ArrivalDeparture",
+    "StopPointRouteSection",
+    "DisruptedPoint",
+    "StopPointsResponse",
+    "VehicleMatch",
+    "LiftDisruption",
+    "PlaceArray",
     "StringsArray",
-    "LineArray",
-    "StopPointArray",
-    "DisruptionsArray",
-    "PredictionArray",
-    "ActiveServiceTypesArray",
+    "ModeArray",
     "PlaceCategoryArray",
-    "PlaceArray",
+    "StopPointArray",
     "AccidentDetailArray",
-    "LiftDisruptionsArray",
     "RoadCorridorsArray",
     "RoadDisruptionsArray",
+    "StatusSeveritiesArray",
+    "ActiveServiceTypesArray",
+    "PredictionArray",
+    "LineArray",
+    "DisruptionsArray",
+    "LiftDisruptionsArray",
     "ChargeConnectorOccupancyArray",
     "BikePointOccupancyArray",
     "StopPointCategoryArray",
@@ -1,12 +1,14 @@
 from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
 from email.utils import parsedate_to_datetime
-from typing import Optional, Any
+from typing import Optional, Any, List
 
 class ResponseModel(BaseModel):
     content_expires: Optional[datetime]
     shared_expires: Optional[datetime]
     content: Any
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
 
     class Config:
         from_attributes = True
@@ -24,7 +26,24 @@ class ApiError(BaseModel):
 
     @field_validator('timestamp_utc', mode='before')
     def parse_timestamp(cls, v):
-        return v if isinstance(v, datetime) else parsedate_to_datetime(v)
+        # a Date header is RFC 2822; error bodies from the API use ISO 8601, which pydantic parses
+        if not isinstance(v, str):
+            return v
+        try:
+            return parsedate_to_datetime(v)
+        except (TypeError, ValueError):
+            return v
         # return datetime.strptime(v, '%a, %d %b %Y %H:%M:%S %Z')
 
-    model_config = {'populate_by_name': True}
\ No newline at end of file
+    model_config = {'populate_by_name': True}
+
+
+class BatchResponseModel(ResponseModel):
+    """Merged result of a request fanned out over chunks of ids.
+
+    ``content`` holds the items of every successful chunk and ``errors`` the
+    ``ApiError`` of every chunk that failed. A chunk that got no HTTP response
+    (connection error, timeout) is reported with ``http_status_code`` 0 and
+    the exception's class name as ``exception_type``.
+    """
+    errors: List[ApiError] = []
@@ -0,0 +1,43 @@
+from typing import List, Optional, Sequence, get_args
+from copy import copy
+from pydantic import BaseModel, RootModel, create_model
+
+
+def projection_name(model_name: str, fields: Optional[Sequence[str]]) -> str:
+    """Name under which the projection of ``model_name`` onto ``fields`` is resolved and cached.
+
+    The name is self-describing (``Prediction[naptanId,timeToStation]``) so that
+    any process reading a shared cache entry can rebuild the same model.
+    """
+    if not fields:
+        return model_name
+    return f"{model_name}[{','.join(sorted(set(fields)))}]"
+
+
+def parse_projection_name(model_name: str) -> tuple[str, tuple[str, ...]]:
+    base_name, _, fields = model_name.removesuffix("]").partition("[")
+    return base_name, tuple(fields.split(",")) if fields else ()
+
+
+def project_model(Model: type[BaseModel], fields: Sequence[str]) -> type[BaseModel]:
+    """Build a copy of ``Model`` that only declares ``fields``.
+
+    Other keys in the payload are ignored by the parser, so they are never
+    validated or kept in memory. For ``RootModel[List[X]]`` array models the
+    projection applies to ``X``.
+    """
+    if issubclass(Model, RootModel):
+        item_types = get_args(Model.model_fields["root"].annotation)
+        if len(item_types) != 1 or not issubclass(item_types[0], BaseModel):
+            raise ValueError(f"Model {Model.__name__} is not an array of models and cannot be projected")
+        Item = project_model(item_types[0], fields)
+        return create_model(f"{Model.__name__}Projection", __base__=RootModel[List[Item]])
+
+    unknown = set(fields) - Model.model_fields.keys()
+    if unknown:
+        raise ValueError(f"Model {Model.__name__} has no fields {', '.join(sorted(unknown))}")
+    return create_model(
+        f"{Model.__name__}Projection",
+        __config__=Model.model_config,
+        **{name: (Model.model_fields[name].annotation, copy(Model.model_fields[name])) for name in fields},
+    )
@@ -0,0 +1,1053 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Union
+from pydantic import BaseModel, RootModel
+from .models.CategoryEnum import CategoryEnum
+from .models.ComplianceEnum import ComplianceEnum
+from .models.DateTimeTypeEnum import DateTimeTypeEnum
+from .models.DepartureStatusEnum import DepartureStatusEnum
+from .models.PhaseEnum import PhaseEnum
+from .models.RouteTypeEnum import RouteTypeEnum
+from .models.ServiceTypeEnum import ServiceTypeEnum
+from .models.SkyDirectionDescriptionEnum import SkyDirectionDescriptionEnum
+from .models.StatusEnum import StatusEnum
+from .models.TrackTypeEnum import TrackTypeEnum
+from .models.TypeEnum import TypeEnum
+
+
+@dataclass(slots=True, frozen=True)
+class Place:
+    id: Optional[str] = None
+    url: Optional[str] = None
+    commonName: Optional[str] = None
+    distance: Optional[float] = None
+    placeType: Optional[str] = None
+    additionalProperties: Optional[tuple[AdditionalProperties, ...]] = None
+    children: Optional[tuple[Place, ...]] = None
+    childrenUrls: Optional[tuple[str, ...]] = None
+    lat: Optional[float] = None
+    lon: Optional[float] = None
+
+
+@dataclass(slots=True, frozen=True)
+class AdditionalProperties:
+    category: Optional[str] = None
+    key: Optional[str] = None
+    sourceSystemKey: Optional[str] = None
+    value: Optional[str] = None
+    modified: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class SearchMatch:
+    id: Optional[str] = None
+    url: Optional[str] = None
+    name: Optional[str] = None
+    lat: Optional[float] = None
+    lon: Optional[float] = None
+
+
+@dataclass(slots=True, frozen=True)
+class SearchResponse:
+    query: Optional[str] = None
+    from_field: Optional[int] = None
+    page: Optional[int] = None
+    pageSize: Optional[int] = None
+    provider: Optional[str] = None
+    total: Optional[int] = None
+    matches: Optional[tuple[SearchMatch, ...]] = None
+    maxScore: Optional[float] = None
+
+
+@dataclass(slots=True, frozen=True)
+class Mode:
+    isTflService: Optional[bool] = None
+    isFarePaying: Optional[bool] = None
+    isScheduledService: Optional[bool] = None
+    modeName: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class Identifier:
+    id: Optional[str] = None
+    name: Optional[str] = None
+    uri: Optional[str] = None
+    fullName: Optional[str] = None
+    type: Optional[str] = None
+    crowding: Optional[Crowding] = None
+    routeType: Optional[RouteTypeEnum] = None
+    status: Optional[StatusEnum] = None
+
+
+@dataclass(slots=True, frozen=True)
+class JpElevation:
+    distance: Optional[int] = None
+    startLat: Optional[float] = None
+    startLon: Optional[float] = None
+    endLat: Optional[float] = None
+    endLon: Optional[float] = None
+    heightFromPreviousPoint: Optional[int] = None
+    gradient: Optional[float] = None
+
+
+@dataclass(slots=True, frozen=True)
+class Path:
+    lineString: Optional[str] = None
+    stopPoints: Optional[tuple[Identifier, ...]] = None
+    elevation: Optional[tuple[JpElevation, ...]] = None
+
+
+@dataclass(slots=True, frozen=True)
+class RouteOption:
+    id: Optional[str] = None
+    name: Optional[str] = None
+    directions: Optional[tuple[str, ...]] = None
+    lineIdentifier: Optional[Identifier] = None
+
+
+@dataclass(slots=True, frozen=True)
+class LineGroup:
+    naptanIdReference: Optional[str] = None
+    stationAtcoCode: Optional[str] = None
+    lineIdentifier: Optional[tuple[str, ...]] = None
+
+
+@dataclass(slots=True, frozen=True)
+class LineModeGroup:
+    modeName: Optional[str] = None
+    lineIdentifier: Optional[tuple[str, ...]] = None
+
+
+@dataclass(slots=True, frozen=True)
+class StopPoint:
+    naptanId: Optional[str] = None
+    platformName: Optional[str] = None
+    indicator: Optional[str] = None
+    stopLetter: Optional[str] = None
+    modes: Optional[tuple[str, ...]] = None
+    icsCode: Optional[str] = None
+    smsCode: Optional[str] = None
+    stopType: Optional[str] = None
+    stationNaptan: Optional[str] = None
+    accessibilitySummary: Optional[str] = None
+    hubNaptanCode: Optional[str] = None
+    lines: Optional[tuple[Identifier, ...]] = None
+    lineGroup: Optional[tuple[LineGroup, ...]] = None
+    lineModeGroups: Optional[tuple[LineModeGroup, ...]] = None
+    fullName: Optional[str] = None
+    naptanMode: Optional[str] = None
+    status: Optional[bool] = None
+    id: Optional[str] = None
+    url: Optional[str] = None
+    commonName: Optional[str] = None
+    distance: Optional[float] = None
+    placeType: Optional[str] = None
+    additionalProperties: Optional[tuple[AdditionalProperties, ...]] = None
+    children: Optional[tuple[Place, ...]] = None
+    childrenUrls: Optional[tuple[str, ...]] = None
+    lat: Optional[float] = None
+    lon: Optional[float] = None
+
+
+@dataclass(slots=True, frozen=True)
+class RouteSectionNaptanEntrySequence:
+    ordinal: Optional[int] = None
+    stopPoint: Optional[StopPoint] = None
+
+
+@dataclass(slots=True, frozen=True)
+class PathAttribute:
+    name: Optional[str] = None
+    value: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class RouteSection:
+    id: Optional[str] = None
+    lineId: Optional[str] = None
+    routeCode: Optional[str] = None
+    name: Optional[str] = None
+    lineString: Optional[str] = None
+    direction: Optional[str] = None
+    originationName: Optional[str] = None
+    destinationName: Optional[str] = None
+    validTo: Optional[str] = None
+    validFrom: Optional[str] = None
+    routeSectionNaptanEntrySequence: Optional[tuple[RouteSectionNaptanEntrySequence, ...]] = None
+
+
+@dataclass(slots=True, frozen=True)
+class Disruption:
+    category: Optional[CategoryEnum] = None
+    type: Optional[str] = None
+    categoryDescription: Optional[str] = None
+    description: Optional[str] = None
+    summary: Optional[str] = None
+    additionalInfo: Optional[str] = None
+    created: Optional[str] = None
+    lastUpdate: Optional[str] = None
+    affectedRoutes: Optional[tuple[RouteSection, ...]] = None
+    affectedStops: Optional[tuple[StopPoint, ...]] = None
+    closureText: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class PlannedWork:
+    id: Optional[str] = None
+    description: Optional[str] = None
+    createdDateTime: Optional[str] = None
+    lastUpdateDateTime: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class Leg:
+    duration: Optional[int] = None
+    speed: Optional[str] = None
+    instruction: Optional[Instruction] = None
+    obstacles: Optional[tuple[Obstacle, ...]] = None
+    departureTime: Optional[str] = None
+    arrivalTime: Optional[str] = None
+    departurePoint: Optional[Point] = None
+    arrivalPoint: Optional[Point] = None
+    path: Optional[Path] = None
+    routeOptions: Optional[tuple[RouteOption, ...]] = None
+    mode: Optional[Identifier] = None
+    disruptions: Optional[tuple[Disruption, ...]] = None
+    plannedWorks: Optional[tuple[PlannedWork, ...]] = None
+    distance: Optional[float] = None
+    isDisrupted: Optional[bool] = None
+    hasFixedLocations: Optional[bool] = None
+
+
+@dataclass(slots=True, frozen=True)
+class FareTapDetails:
+    modeType: Optional[str] = None
+    validationType: Optional[str] = None
+    hostDeviceType: Optional[str] = None
+    busRouteId: Optional[str] = None
+    nationalLocationCode: Optional[int] = None
+    tapTimestamp: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class FareTap:
+    atcoCode: Optional[str] = None
+    tapDetails: Optional[FareTapDetails] = None
+
+
+@dataclass(slots=True, frozen=True)
+class Fare:
+    lowZone: Optional[int] = None
+    highZone: Optional[int] = None
+    cost: Optional[int] = None
+    chargeProfileName: Optional[str] = None
+    isHopperFare: Optional[bool] = None
+    chargeLevel: Optional[str] = None
+    peak: Optional[int] = None
+    offPeak: Optional[int] = None
+    taps: Optional[tuple[FareTap, ...]] = None
+
+
+@dataclass(slots=True, frozen=True)
+class FareCaveat:
+    text: Optional[str] = None
+    type: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class JourneyFare:
+    totalCost: Optional[int] = None
+    fares: Optional[tuple[Fare, ...]] = None
+    caveats: Optional[tuple[FareCaveat, ...]] = None
+
+
+@dataclass(slots=True, frozen=True)
+class Journey:
+    startDateTime: Optional[str] = None
+    duration: Optional[int] = None
+    arrivalDateTime: Optional[str] = None
+    legs: Optional[tuple[Leg, ...]] = None
+    fare: Optional[JourneyFare] = None
+
+
+@dataclass(slots=True, frozen=True)
+class InstructionStep:
+    description: Optional[str] = None
+    turnDirection: Optional[str] = None
+    streetName: Optional[str] = None
+    distance: Optional[int] = None
+    cumulativeDistance: Optional[int] = None
+    skyDirection: Optional[int] = None
+    skyDirectionDescription: Optional[SkyDirectionDescriptionEnum] = None
+    cumulativeTravelTime: Optional[int] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    pathAttribute: Optional[PathAttribute] = None
+    descriptionHeading: Optional[str] = None
+    trackType: Optional[TrackTypeEnum] = None
+
+
+@dataclass(slots=True, frozen=True)
+class ValidityPeriod:
+    fromDate: Optional[str] = None
+    toDate: Optional[str] = None
+    isNow: Optional[bool] = None
+
+
+@dataclass(slots=True, frozen=True)
+class LineStatus:
+    id: Optional[int] = None
+    lineId: Optional[str] = None
+    statusSeverity: Optional[int] = None
+    statusSeverityDescription: Optional[str] = None
+    reason: Optional[str] = None
+    created: Optional[str] = None
+    modified: Optional[str] = None
+    validityPeriods: Optional[tuple[ValidityPeriod, ...]] = None
+    disruption: Optional[Disruption] = None
+
+
+@dataclass(slots=True, frozen=True)
+class MatchedRoute:
+    routeCode: Optional[str] = None
+    name: Optional[str] = None
+    direction: Optional[str] = None
+    originationName: Optional[str] = None
+    destinationName: Optional[str] = None
+    originator: Optional[str] = None
+    destination: Optional[str] = None
+    serviceType: Optional[str] = None
+    validTo: Optional[str] = None
+    validFrom: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class LineServiceTypeInfo:
+    name: Optional[str] = None
+    uri: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class Line:
+    id: Optional[str] = None
+    name: Optional[str] = None
+    modeName: Optional[str] = None
+    disruptions: Optional[tuple[Disruption, ...]] = None
+    created: Optional[str] = None
+    modified: Optional[str] = None
+    lineStatuses: Optional[tuple[LineStatus, ...]] = None
+    routeSections: Optional[tuple[MatchedRoute, ...]] = None
+    serviceTypes: Optional[tuple[LineServiceTypeInfo, ...]] = None
+    crowding: Optional[Crowding] = None
+
+
+@dataclass(slots=True, frozen=True)
+class JourneyPlannerCycleHireDockingStationData:
+    originNumberOfBikes: Optional[int] = None
+    destinationNumberOfBikes: Optional[int] = None
+    originNumberOfEmptySlots: Optional[int] = None
+    destinationNumberOfEmptySlots: Optional[int] = None
+    originId: Optional[str] = None
+    destinationId: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class TimeAdjustment:
+    date: Optional[str] = None
+    time: Optional[str] = None
+    timeIs: Optional[str] = None
+    uri: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class TimeAdjustments:
+    earliest: Optional[TimeAdjustment] = None
+    earlier: Optional[TimeAdjustment] = None
+    later: Optional[TimeAdjustment] = None
+    latest: Optional[TimeAdjustment] = None
+
+
+@dataclass(slots=True, frozen=True)
+class SearchCriteria:
+    dateTime: Optional[str] = None
+    dateTimeType: Optional[DateTimeTypeEnum] = None
+    timeAdjustments: Optional[TimeAdjustments] = None
+
+
+@dataclass(slots=True, frozen=True)
+class JourneyVector:
+    from_field: Optional[str] = None
+    to: Optional[str] = None
+    via: Optional[str] = None
+    uri: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class Instruction:
+    summary: Optional[str] = None
+    detailed: Optional[str] = None
+    steps: Optional[tuple[InstructionStep, ...]] = None
+
+
+@dataclass(slots=True, frozen=True)
+class ItineraryResult:
+    journeys: Optional[tuple[Journey, ...]] = None
+    lines: Optional[tuple[Line, ...]] = None
+    cycleHireDockingStationData: Optional[JourneyPlannerCycleHireDockingStationData] = None
+    stopMessages: Optional[tuple[str, ...]] = None
+    recommendedMaxAgeMinutes: Optional[int] = None
+    searchCriteria: Optional[SearchCriteria] = None
+    journeyVector: Optional[JourneyVector] = None
+
+
+@dataclass(slots=True, frozen=True)
+class Obstacle:
+    type: Optional[str] = None
+    incline: Optional[str] = None
+    stopId: Optional[int] = None
+    position: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class Point:
+    lat: Optional[float] = None
+    lon: Optional[float] = None
+
+
+@dataclass(slots=True, frozen=True)
+class PassengerFlow:
+    timeSlice: Optional[str] = None
+    value: Optional[int] = None
+
+
+@dataclass(slots=True, frozen=True)
+class TrainLoading:
+    line: Optional[str] = None
+    lineDirection: Optional[str] = None
+    platformDirection: Optional[str] = None
+    direction: Optional[str] = None
+    naptanTo: Optional[str] = None
+    timeSlice: Optional[str] = None
+    value: Optional[int] = None
+
+
+@dataclass(slots=True, frozen=True)
+class Crowding:
+    passengerFlows: Optional[tuple[PassengerFlow, ...]] = None
+    trainLoadings: Optional[tuple[TrainLoading, ...]] = None
+
+
+@dataclass(slots=True, frozen=True)
+class PlaceCategory:
+    category: Optional[str] = None
+    availableKeys: Optional[tuple[str, ...]] = None
+
+
+@dataclass(slots=True, frozen=True)
+class AccidentDetail:
+    id: Optional[int] = None
+    lat: Optional[float] = None
+    lon: Optional[float] = None
+    location: Optional[str] = None
+    date: Optional[str] = None
+    severity: Optional[str] = None
+    borough: Optional[str] = None
+    casualties: Optional[tuple[Casualty, ...]] = None
+    vehicles: Optional[tuple[Vehicle, ...]] = None
+
+
+@dataclass(slots=True, frozen=True)
+class Casualty:
+    age: Optional[int] = None
+    class_field: Optional[str] = None
+    severity: Optional[str] = None
+    mode: Optional[str] = None
+    ageBand: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class Vehicle:
+    type: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class DbGeographyWellKnownValue:
+    coordinateSystemId: Optional[int] = None
+    wellKnownText: Optional[str] = None
+    wellKnownBinary: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class DbGeography:
+    geography: Optional[DbGeographyWellKnownValue] = None
+
+
+@dataclass(slots=True, frozen=True)
+class RoadCorridor:
+    id: Optional[str] = None
+    displayName: Optional[str] = None
+    group: Optional[str] = None
+    statusSeverity: Optional[str] = None
+    statusSeverityDescription: Optional[str] = None
+    bounds: Optional[str] = None
+    envelope: Optional[str] = None
+    statusAggregationStartDate: Optional[str] = None
+    statusAggregationEndDate: Optional[str] = None
+    url: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class StreetSegment:
+    toid: Optional[str] = None
+    lineString: Optional[str] = None
+    sourceSystemId: Optional[int] = None
+    sourceSystemKey: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class Street:
+    name: Optional[str] = None
+    closure: Optional[str] = None
+    directions: Optional[str] = None
+    segments: Optional[tuple[StreetSegment, ...]] = None
+    sourceSystemId: Optional[int] = None
+    sourceSystemKey: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class RoadProject:
+    projectId: Optional[str] = None
+    schemeName: Optional[str] = None
+    projectName: Optional[str] = None
+    projectDescription: Optional[str] = None
+    projectPageUrl: Optional[str] = None
+    consultationPageUrl: Optional[str] = None
+    consultationStartDate: Optional[str] = None
+    consultationEndDate: Optional[str] = None
+    constructionStartDate: Optional[str] = None
+    constructionEndDate: Optional[str] = None
+    boroughsBenefited: Optional[tuple[str, ...]] = None
+    cycleSuperhighwayId: Optional[str] = None
+    phase: Optional[PhaseEnum] = None
+    contactName: Optional[str] = None
+    contactEmail: Optional[str] = None
+    externalPageUrl: Optional[str] = None
+    projectSummaryPageUrl: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class RoadDisruptionLine:
+    id: Optional[int] = None
+    roadDisruptionId: Optional[str] = None
+    isDiversion: Optional[bool] = None
+    multiLineString: Optional[DbGeography] = None
+    startDate: Optional[str] = None
+    endDate: Optional[str] = None
+    startTime: Optional[str] = None
+    endTime: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class RoadDisruptionImpactArea:
+    id: Optional[int] = None
+    roadDisruptionId: Optional[str] = None
+    polygon: Optional[DbGeography] = None
+    startDate: Optional[str] = None
+    endDate: Optional[str] = None
+    startTime: Optional[str] = None
+    endTime: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class RoadDisruptionSchedule:
+    startTime: Optional[str] = None
+    endTime: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class RoadDisruption:
+    id: Optional[str] = None
+    url: Optional[str] = None
+    point: Optional[str] = None
+    severity: Optional[str] = None
+    ordinal: Optional[int] = None
+    category: Optional[str] = None
+    subCategory: Optional[str] = None
+    comments: Optional[str] = None
+    currentUpdate: Optional[str] = None
+    currentUpdateDateTime: Optional[str] = None
+    corridorIds: Optional[tuple[str, ...]] = None
+    startDateTime: Optional[str] = None
+    endDateTime: Optional[str] = None
+    lastModifiedTime: Optional[str] = None
+    levelOfInterest: Optional[str] = None
+    location: Optional[str] = None
+    status: Optional[str] = None
+    geography: Optional[DbGeography] = None
+    geometry: Optional[DbGeography] = None
+    streets: Optional[tuple[Street, ...]] = None
+    isProvisional: Optional[bool] = None
+    hasClosures: Optional[bool] = None
+    linkText: Optional[str] = None
+    linkUrl: Optional[str] = None
+    roadProject: Optional[RoadProject] = None
+    publishStartDate: Optional[str] = None
+    publishEndDate: Optional[str] = None
+    timeFrame: Optional[str] = None
+    roadDisruptionLines: Optional[tuple[RoadDisruptionLine, ...]] = None
+    roadDisruptionImpactAreas: Optional[tuple[RoadDisruptionImpactArea, ...]] = None
+    recurringSchedules: Optional[tuple[RoadDisruptionSchedule, ...]] = None
+
+
+@dataclass(slots=True, frozen=True)
+class StatusSeverity:
+    modeName: Optional[str] = None
+    severityLevel: Optional[int] = None
+    description: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class Bay:
+    bayType: Optional[str] = None
+    bayCount: Optional[int] = None
+    free: Optional[int] = None
+    occupied: Optional[int] = None
+
+
+@dataclass(slots=True, frozen=True)
+class CarParkOccupancy:
+    id: Optional[str] = None
+    bays: Optional[tuple[Bay, ...]] = None
+    name: Optional[str] = None
+    carParkDetailsUrl: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class ChargeConnectorOccupancy:
+    id: Optional[int] = None
+    sourceSystemPlaceId: Optional[str] = None
+    status: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class BikePointOccupancy:
+    id: Optional[str] = None
+    name: Optional[str] = None
+    bikesCount: Optional[int] = None
+    emptyDocks: Optional[int] = None
+    totalDocks: Optional[int] = None
+
+
+@dataclass(slots=True, frozen=True)
+class ActiveServiceType:
+    mode: Optional[str] = None
+    serviceType: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class Prediction:
+    id: Optional[str] = None
+    operationType: Optional[int] = None
+    vehicleId: Optional[str] = None
+    naptanId: Optional[str] = None
+    stationName: Optional[str] = None
+    lineId: Optional[str] = None
+    lineName: Optional[str] = None
+    platformName: Optional[str] = None
+    direction: Optional[str] = None
+    bearing: Optional[str] = None
+    destinationNaptanId: Optional[str] = None
+    destinationName: Optional[str] = None
+    timestamp: Optional[str] = None
+    timeToStation: Optional[int] = None
+    currentLocation: Optional[str] = None
+    towards: Optional[str] = None
+    expectedArrival: Optional[str] = None
+    timeToLive: Optional[str] = None
+    modeName: Optional[str] = None
+    timing: Optional[PredictionTiming] = None
+
+
+@dataclass(slots=True, frozen=True)
+class PredictionTiming:
+    countdownServerAdjustment: Optional[str] = None
+    source: Optional[str] = None
+    insert: Optional[str] = None
+    read: Optional[str] = None
+    sent: Optional[str] = None
+    received: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class MatchedStop:
+    routeId: Optional[int] = None
+    parentId: Optional[str] = None
+    stationId: Optional[str] = None
+    icsId: Optional[str] = None
+    topMostParentId: Optional[str] = None
+    direction: Optional[str] = None
+    towards: Optional[str] = None
+    modes: Optional[tuple[str, ...]] = None
+    stopType: Optional[str] = None
+    stopLetter: Optional[str] = None
+    zone: Optional[str] = None
+    accessibilitySummary: Optional[str] = None
+    hasDisruption: Optional[bool] = None
+    lines: Optional[tuple[Identifier, ...]] = None
+    status: Optional[bool] = None
+    id: Optional[str] = None
+    url: Optional[str] = None
+    name: Optional[str] = None
+    lat: Optional[float] = None
+    lon: Optional[float] = None
+
+
+@dataclass(slots=True, frozen=True)
+class StopPointSequence:
+    lineId: Optional[str] = None
+    lineName: Optional[str] = None
+    direction: Optional[str] = None
+    branchId: Optional[int] = None
+    nextBranchIds: Optional[tuple[int, ...]] = None
+    prevBranchIds: Optional[tuple[int, ...]] = None
+    stopPoint: Optional[tuple[MatchedStop, ...]] = None
+    serviceType: Optional[ServiceTypeEnum] = None
+
+
+@dataclass(slots=True, frozen=True)
+class OrderedRoute:
+    name: Optional[str] = None
+    naptanIds: Optional[tuple[str, ...]] = None
+    serviceType: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class RouteSequence:
+    lineId: Optional[str] = None
+    lineName: Optional[str] = None
+    direction: Optional[str] = None
+    isOutboundOnly: Optional[bool] = None
+    mode: Optional[str] = None
+    lineStrings: Optional[tuple[str, ...]] = None
+    stations: Optional[tuple[MatchedStop, ...]] = None
+    stopPointSequences: Optional[tuple[StopPointSequence, ...]] = None
+    orderedLineRoutes: Optional[tuple[OrderedRoute, ...]] = None
+
+
+@dataclass(slots=True, frozen=True)
+class LineRouteSection:
+    routeId: Optional[int] = None
+    direction: Optional[str] = None
+    destination: Optional[str] = None
+    fromStation: Optional[str] = None
+    toStation: Optional[str] = None
+    serviceType: Optional[str] = None
+    vehicleDestinationText: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class MatchedRouteSections:
+    id: Optional[int] = None
+
+
+@dataclass(slots=True, frozen=True)
+class RouteSearchMatch:
+    lineId: Optional[str] = None
+    mode: Optional[str] = None
+    lineName: Optional[str] = None
+    lineRouteSection: Optional[tuple[LineRouteSection, ...]] = None
+    matchedRouteSections: Optional[tuple[MatchedRouteSections, ...]] = None
+    matchedStops: Optional[tuple[MatchedStop, ...]] = None
+    id: Optional[str] = None
+    url: Optional[str] = None
+    name: Optional[str] = None
+    lat: Optional[float] = None
+    lon: Optional[float] = None
+
+
+@dataclass(slots=True, frozen=True)
+class RouteSearchResponse:
+    input: Optional[str] = None
+    searchMatches: Optional[tuple[RouteSearchMatch, ...]] = None
+
+
+@dataclass(slots=True, frozen=True)
+class Interval:
+    stopId: Optional[str] = None
+    timeToArrival: Optional[float] = None
+
+
+@dataclass(slots=True, frozen=True)
+class StationInterval:
+    id: Optional[str] = None
+    intervals: Optional[tuple[Interval, ...]] = None
+
+
+@dataclass(slots=True, frozen=True)
+class KnownJourney:
+    hour: Optional[str] = None
+    minute: Optional[str] = None
+    intervalId: Optional[int] = None
+
+
+@dataclass(slots=True, frozen=True)
+class TwentyFourHourClockTime:
+    hour: Optional[str] = None
+    minute: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class ServiceFrequency:
+    lowestFrequency: Optional[float] = None
+    highestFrequency: Optional[float] = None
+
+
+@dataclass(slots=True, frozen=True)
+class Period:
+    type: Optional[TypeEnum] = None
+    fromTime: Optional[TwentyFourHourClockTime] = None
+    toTime: Optional[TwentyFourHourClockTime] = None
+    frequency: Optional[ServiceFrequency] = None
+
+
+@dataclass(slots=True, frozen=True)
+class Schedule:
+    name: Optional[str] = None
+    knownJourneys: Optional[tuple[KnownJourney, ...]] = None
+    firstJourney: Optional[KnownJourney] = None
+    lastJourney: Optional[KnownJourney] = None
+    periods: Optional[tuple[Period, ...]] = None
+
+
+@dataclass(slots=True, frozen=True)
+class TimetableRoute:
+    stationIntervals: Optional[tuple[StationInterval, ...]] = None
+    schedules: Optional[tuple[Schedule, ...]] = None
+
+
+@dataclass(slots=True, frozen=True)
+class Timetable:
+    departureStopId: Optional[str] = None
+    routes: Optional[tuple[TimetableRoute, ...]] = None
+
+
+@dataclass(slots=True, frozen=True)
+class DisambiguationOption:
+    description: Optional[str] = None
+    uri: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class Disambiguation:
+    disambiguationOptions: Optional[tuple[DisambiguationOption, ...]] = None
+
+
+@dataclass(slots=True, frozen=True)
+class TimetableResponse:
+    lineId: Optional[str] = None
+    lineName: Optional[str] = None
+    direction: Optional[str] = None
+    pdfUrl: Optional[str] = None
+    stations: Optional[tuple[MatchedStop, ...]] = None
+    stops: Optional[tuple[MatchedStop, ...]] = None
+    timetable: Optional[Timetable] = None
+    disambiguation: Optional[Disambiguation] = None
+    statusErrorMessage: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class LineSpecificServiceType:
+    serviceType: Optional[LineServiceTypeInfo] = None
+    stopServesServiceType: Optional[bool] = None
+
+
+@dataclass(slots=True, frozen=True)
+class LineServiceType:
+    lineName: Optional[str] = None
+    lineSpecificServiceTypes: Optional[tuple[LineSpecificServiceType, ...]] = None
+
+
+@dataclass(slots=True, frozen=True)
+class ArrivalDeparture:
+    platformName: Optional[str] = None
+    destinationNaptanId: Optional[str] = None
+    destinationName: Optional[str] = None
+    naptanId: Optional[str] = None
+    stationName: Optional[str] = None
+    estimatedTimeOfArrival: Optional[str] = None
+    scheduledTimeOfArrival: Optional[str] = None
+    estimatedTimeOfDeparture: Optional[str] = None
+    scheduledTimeOfDeparture: Optional[str] = None
+    minutesAndSecondsToArrival: Optional[str] = None
+    minutesAndSecondsToDeparture: Optional[str] = None
+    cause: Optional[str] = None
+    departureStatus: Optional[DepartureStatusEnum] = None
+    timing: Optional[PredictionTiming] = None
+
+
+@dataclass(slots=True, frozen=True)
+class StopPointRouteSection:
+    naptanId: Optional[str] = None
+    lineId: Optional[str] = None
+    mode: Optional[str] = None
+    validFrom: Optional[str] = None
+    validTo: Optional[str] = None
+    direction: Optional[str] = None
+    routeSectionName: Optional[str] = None
+    lineString: Optional[str] = None
+    isActive: Optional[bool] = None
+    serviceType: Optional[str] = None
+    vehicleDestinationText: Optional[str] = None
+    destinationName: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class DisruptedPoint:
+    atcoCode: Optional[str] = None
+    fromDate: Optional[str] = None
+    toDate: Optional[str] = None
+    description: Optional[str] = None
+    commonName: Optional[str] = None
+    type: Optional[str] = None
+    mode: Optional[str] = None
+    stationAtcoCode: Optional[str] = None
+    appearance: Optional[str] = None
+    additionalInformation: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class StopPointsResponse:
+    centrePoint: Optional[tuple[float, ...]] = None
+    stopPoints: Optional[tuple[StopPoint, ...]] = None
+    pageSize: Optional[int] = None
+    total: Optional[int] = None
+    page: Optional[int] = None
+
+
+@dataclass(slots=True, frozen=True)
+class VehicleMatch:
+    vrm: Optional[str] = None
+    type: Optional[str] = None
+    make: Optional[str] = None
+    model: Optional[str] = None
+    colour: Optional[str] = None
+    compliance: Optional[ComplianceEnum] = None
+
+
+@dataclass(slots=True, frozen=True)
+class LiftDisruption:
+    icsCode: Optional[str] = None
+    naptanCode: Optional[str] = None
+    stopPointName: Optional[str] = None
+    outageStartArea: Optional[str] = None
+    outageEndArea: Optional[str] = None
+    message: Optional[str] = None
+
+
+record_types = {
+    'Place': Place,
+    'AdditionalProperties': AdditionalProperties,
+    'SearchMatch': SearchMatch,
+    'SearchResponse': SearchResponse,
+    'Mode': Mode,
+    'Identifier': Identifier,
+    'JpElevation': JpElevation,
+    'Path': Path,
+    'RouteOption': RouteOption,
+    'LineGroup': LineGroup,
+    'LineModeGroup': LineModeGroup,
+    'StopPoint': StopPoint,
+    'RouteSectionNaptanEntrySequence': RouteSectionNaptanEntrySequence,
+    'PathAttribute': PathAttribute,
+    'RouteSection': RouteSection,
+    'Disruption': Disruption,
+    'PlannedWork': PlannedWork,
+    'Leg': Leg,
+    'FareTapDetails': FareTapDetails,
+    'FareTap': FareTap,
+    'Fare': Fare,
+    'FareCaveat': FareCaveat,
+    'JourneyFare': JourneyFare,
+    'Journey': Journey,
+    'InstructionStep': InstructionStep,
+    'ValidityPeriod': ValidityPeriod,
+    'LineStatus': LineStatus,
+    'MatchedRoute': MatchedRoute,
+    'LineServiceTypeInfo': LineServiceTypeInfo,
+    'Line': Line,
+    'JourneyPlannerCycleHireDockingStationData': JourneyPlannerCycleHireDockingStationData,
+    'TimeAdjustment': TimeAdjustment,
+    'TimeAdjustments': TimeAdjustments,
+    'SearchCriteria': SearchCriteria,
+    'JourneyVector': JourneyVector,
+    'Instruction': Instruction,
+    'ItineraryResult': ItineraryResult,
+    'Obstacle': Obstacle,
+    'Point': Point,
+    'PassengerFlow': PassengerFlow,
+    'TrainLoading': TrainLoading,
+    'Crowding': Crowding,
+    'PlaceCategory': PlaceCategory,
+    'AccidentDetail': AccidentDetail,
+    'Casualty': Casualty,
+    'Vehicle': Vehicle,
+    'DbGeographyWellKnownValue': DbGeographyWellKnownValue,
+    'DbGeography': DbGeography,
+    'RoadCorridor': RoadCorridor,
+    'StreetSegment': StreetSegment,
+    'Street': Street,
+    'RoadProject': RoadProject,
+    'RoadDisruptionLine': RoadDisruptionLine,
+    'RoadDisruptionImpactArea': RoadDisruptionImpactArea,
+    'RoadDisruptionSchedule': RoadDisruptionSchedule,
+    'RoadDisruption': RoadDisruption,
+    'StatusSeverity': StatusSeverity,
+    'Bay': Bay,
+    'CarParkOccupancy': CarParkOccupancy,
+    'ChargeConnectorOccupancy': ChargeConnectorOccupancy,
+    'BikePointOccupancy': BikePointOccupancy,
+    'ActiveServiceType': ActiveServiceType,
+    'Prediction': Prediction,
+    'PredictionTiming': PredictionTiming,
+    'MatchedStop': MatchedStop,
+    'StopPointSequence': StopPointSequence,
+    'OrderedRoute': OrderedRoute,
+    'RouteSequence': RouteSequence,
+    'LineRouteSection': LineRouteSection,
+    'MatchedRouteSections': MatchedRouteSections,
+    'RouteSearchMatch': RouteSearchMatch,
+    'RouteSearchResponse': RouteSearchResponse,
+    'Interval': Interval,
+    'StationInterval': StationInterval,
+    'KnownJourney': KnownJourney,
+    'TwentyFourHourClockTime': TwentyFourHourClockTime,
+    'ServiceFrequency': ServiceFrequency,
+    'Period': Period,
+    'Schedule': Schedule,
+    'TimetableRoute': TimetableRoute,
+    'Timetable': Timetable,
+    'DisambiguationOption': DisambiguationOption,
+    'Disambiguation': Disambiguation,
+    'TimetableResponse': TimetableResponse,
+    'LineSpecificServiceType': LineSpecificServiceType,
+    'LineServiceType': LineServiceType,
+    'ArrivalDeparture': ArrivalDeparture,
+    'StopPointRouteSection': StopPointRouteSection,
+    'DisruptedPoint': DisruptedPoint,
+    'StopPointsResponse': StopPointsResponse,
+    'VehicleMatch': VehicleMatch,
+    'LiftDisruption': LiftDisruption,
+}
+
+
+def to_record(value: Any) -> Any:
+    '''Convert a validated model, or a list of them, into its compact record form.'''
+    if isinstance(value, RootModel):
+        return to_record(value.root)
+    if isinstance(value, BaseModel):
+        record_type = record_types[type(value).__name__]
+        return record_type(*[to_record(getattr(value, field)) for field in record_type.__slots__])
+    if isinstance(value, list):
+        return tuple([to_record(item) for item in value])
+    return value
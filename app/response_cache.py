@@ -0,0 +1,285 @@
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import NamedTuple, Optional, Sequence, Tuple
+from urllib.parse import urlencode
+from .package_models import ResponseModel
+
+
+class ResponseCache():
+    """ResponseCache.
+
+    In-process LRU cache of deserialised responses. Entries are served until
+    their ``content_expires`` time (from the response's ``max-age``). Expired
+    entries that carry an ``ETag`` or ``Last-Modified`` validator are kept so
+    the client can revalidate them. The least recently used entries are
+    evicted once either budget is exceeded. Share one instance between
+    endpoint clients to share the cache.
+
+    :param int max_entries: Maximum number of cached responses
+    :param int max_bytes: Maximum total size of the cached response bodies
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, Tuple[ResponseModel, int]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        endpoint: str, params: Optional[dict] = None, raw: bool = False, fields: Optional[Sequence[str]] = None
+    ) -> str:
+        # sort the query so that equivalent calls share one entry; raw bodies,
+        # projections and full models are different values, so they are kept apart
+        query = sorted((key, str(value)) for key, value in (params or {}).items())
+        key = f"{endpoint}?{urlencode(query)}"
+        if raw:
+            return f"{key}#raw"
+        if fields:
+            return f"{key}#fields={','.join(sorted(set(fields)))}"
+        return key
+
+    @staticmethod
+    def is_fresh(expires: Optional[datetime]) -> bool:
+        return expires is not None and expires > datetime.now(timezone.utc)
+
+    @staticmethod
+    def has_validators(response: ResponseModel) -> bool:
+        return response.etag is not None or response.last_modified is not None
+
+    def get(self, key: str) -> Optional[ResponseModel]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            response, size = entry
+            if not self.is_fresh(response.content_expires):
+                if not self.has_validators(response):
+                    self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def get_stale(self, key: str) -> Optional[ResponseModel]:
+        """Return the entry for ``key`` even if it has expired, for revalidation."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[0] if entry is not None else None
+
+    def set(self, key: str, response: ResponseModel, size: int) -> None:
+        if size > self.max_bytes:
+            return
+        if not self.is_fresh(response.content_expires) and not self.has_validators(response):
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (response, size)
+            self._size += size
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def refresh(self, key: str, response: ResponseModel) -> None:
+        """Replace a revalidated entry, keeping its recorded size."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries[key] = (response, entry[1])
+                self._entries.move_to_end(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        _, size = self._entries.pop(key)
+        self._size -= size
+
+
+class SharedCacheEntry(NamedTuple):
+    model_name: str
+    body: bytes
+    content_expires: Optional[datetime]
+    shared_expires: Optional[datetime]
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+class SharedResponseCache():
+    """SharedResponseCache.
+
+    On-disk SQLite cache of raw response bodies, shared by every process on
+    a host that opens the same file. Entries live until their
+    ``shared_expires`` time (from the response's ``s-maxage``); expired entries
+    with an ``ETag`` or ``Last-Modified`` validator are kept for revalidation
+    until the size budget needs the space. Once a key has been answered with
+    an ``s-maxage`` it is remembered as shareable for ``shareable_ttl``
+    seconds, and a short fetch lease then lets one process refresh it while
+    the others wait for it instead of all calling the API. The database runs
+    in WAL mode, so readers and writers in different processes can use it
+    concurrently.
+
+    :param str path: Path to the SQLite database file
+    :param int max_bytes: Maximum total size of the cached response bodies
+    :param float lease_timeout: Seconds a fetch lease is held before others may fetch
+    :param float poll_interval: Seconds between checks while waiting on another fetch
+    :param float shareable_ttl: Seconds a key is remembered as shareable after its last ``s-maxage`` response
+    :param int max_shareable_keys: Maximum number of keys remembered as shareable
+    """
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024,
+                 lease_timeout: float = 10.0, poll_interval: float = 0.05,
+                 shareable_ttl: float = 24 * 60 * 60, max_shareable_keys: int = 100_000):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.lease_timeout = lease_timeout
+        self.poll_interval = poll_interval
+        self.shareable_ttl = shareable_ttl
+        self.max_shareable_keys = max_shareable_keys
+        self._local = threading.local()
+        with self._connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, model_name TEXT NOT NULL, "
+                "body BLOB NOT NULL, size INTEGER NOT NULL, content_expires REAL, shared_expires REAL, "
+                "etag TEXT, last_modified TEXT)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS responses_shared_expires ON responses (shared_expires)")
+            connection.execute("CREATE TABLE IF NOT EXISTS leases (key TEXT PRIMARY KEY, expires REAL NOT NULL)")
+            connection.execute("CREATE TABLE IF NOT EXISTS shareable (key TEXT PRIMARY KEY, expires REAL NOT NULL)")
+            connection.execute("CREATE INDEX IF NOT EXISTS shareable_expires ON shareable (expires)")
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections must not be shared between threads
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    @staticmethod
+    def _to_timestamp(value: Optional[datetime]) -> Optional[float]:
+        return value.timestamp() if value is not None else None
+
+    @staticmethod
+    def _from_timestamp(value: Optional[float]) -> Optional[datetime]:
+        return datetime.fromtimestamp(value, timezone.utc) if value is not None else None
+
+    def get(self, key: str) -> Optional[SharedCacheEntry]:
+        # freshness is checked in the query, so an expired entry's body is never read
+        return self._select("key = ? AND shared_expires > ?", (key, time.time()))
+
+    def get_stale(self, key: str) -> Optional[SharedCacheEntry]:
+        """Return the entry for ``key`` even if it has expired, for revalidation."""
+        return self._select("key = ?", (key,))
+
+    def _select(self, condition: str, parameters: tuple) -> Optional[SharedCacheEntry]:
+        row = self._connection().execute(
+            "SELECT model_name, body, content_expires, shared_expires, etag, last_modified "
+            f"FROM responses WHERE {condition}",
+            parameters,
+        ).fetchone()
+        if row is None:
+            return None
+        model_name, body, content_expires, shared_expires, etag, last_modified = row
+        return SharedCacheEntry(
+            model_name, body, self._from_timestamp(content_expires), self._from_timestamp(shared_expires),
+            etag, last_modified,
+        )
+
+    def get_validators(self, key: str) -> Optional[Tuple[Optional[str], Optional[str]]]:
+        """Return the ``ETag`` and ``Last-Modified`` of the entry for ``key`` without reading its body."""
+        return self._connection().execute(
+            "SELECT etag, last_modified FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+
+    def set(self, key: str, model_name: str, body: bytes,
+            content_expires: Optional[datetime], shared_expires: Optional[datetime],
+            etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        stored = len(body) <= self.max_bytes and (
+            ResponseCache.is_fresh(shared_expires) or etag is not None or last_modified is not None
+        )
+        if shared_expires is None and not stored:
+            return
+        with self._connection() as connection:
+            if shared_expires is not None:
+                connection.execute(
+                    "INSERT OR REPLACE INTO shareable VALUES (?, ?)", (key, time.time() + self.shareable_ttl)
+                )
+            if stored:
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, model_name, body, len(body),
+                     self._to_timestamp(content_expires), self._to_timestamp(shared_expires),
+                     etag, last_modified),
+                )
+            self._evict(connection)
+
+    def refresh(self, key: str, content_expires: Optional[datetime], shared_expires: Optional[datetime]) -> None:
+        """Extend the expiry of a revalidated entry without rewriting its body."""
+        with self._connection() as connection:
+            connection.execute(
+                "UPDATE responses SET content_expires = ?, shared_expires = ? WHERE key = ?",
+                (self._to_timestamp(content_expires), self._to_timestamp(shared_expires), key),
+            )
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        now = time.time()
+        connection.execute("DELETE FROM shareable WHERE expires <= ?", (now,))
+        # beyond the cap, forget the keys that have gone longest without an s-maxage response
+        connection.execute(
+            "DELETE FROM shareable WHERE key IN "
+            "(SELECT key FROM shareable ORDER BY expires DESC LIMIT -1 OFFSET ?)",
+            (self.max_shareable_keys,),
+        )
+        connection.execute(
+            "DELETE FROM responses WHERE COALESCE(shared_expires, 0) <= ? "
+            "AND etag IS NULL AND last_modified IS NULL",
+            (now,),
+        )
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # drop the entries closest to expiry (stale ones first) until the cache is back under budget
+        for key, size in connection.execute(
+            "SELECT key, size FROM responses ORDER BY COALESCE(shared_expires, 0)"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+
+    def is_shareable(self, key: str) -> bool:
+        """Whether a response for ``key`` has carried an ``s-maxage``, so that its fetches are worth coalescing."""
+        return self._connection().execute(
+            "SELECT 1 FROM shareable WHERE key = ? AND expires > ?", (key, time.time())
+        ).fetchone() is not None
+
+    def acquire(self, key: str) -> bool:
+        """Try to take the fetch lease for ``key``; returns False if another process holds it."""
+        now = time.time()
+        with self._connection() as connection:
+            connection.execute("DELETE FROM leases WHERE key = ? AND expires <= ?", (key, now))
+            cursor = connection.execute(
+                "INSERT OR IGNORE INTO leases VALUES (?, ?)", (key, now + self.lease_timeout)
+            )
+            return cursor.rowcount == 1
+
+    def release(self, key: str) -> None:
+        with self._connection() as connection:
+            connection.execute("DELETE FROM leases WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._connection() as connection:
+            connection.execute("DELETE FROM responses")
+            connection.execute("DELETE FROM leases")
+            connection.execute("DELETE FROM shareable")
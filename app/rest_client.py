@@ -21,37 +21,223 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
 import requests
+from requests.adapters import HTTPAdapter
 try:
     from urllib.parse import urlencode, urljoin
 except ImportError:
     from urllib import urlencode
 from .config import base_url
 
+
+class TokenBucket():
+    """TokenBucket.
+
+    Client-side rate limiter. Tokens refill continuously at ``rate`` per
+    second up to ``capacity``; each request takes one, waiting for it if the
+    bucket is empty. :meth:`penalise` pauses the bucket when the API answers
+    429 with a ``Retry-After``. Use :meth:`for_key` to share one bucket
+    between every client that uses the same app key.
+
+    :param float rate: Tokens added per second
+    :param float capacity: Maximum number of tokens, i.e. the largest burst
+    """
+
+    _shared: dict = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_key(cls, app_key: str, requests_per_minute: int) -> "TokenBucket":
+        with cls._shared_lock:
+            bucket = cls._shared.get(app_key)
+            if bucket is None:
+                # allow at most one second's worth of requests as a burst
+                bucket = cls._shared[app_key] = cls(
+                    requests_per_minute / 60, max(1.0, requests_per_minute / 60))
+            return bucket
+
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            # _updated is in the future while the bucket is paused by penalise()
+            if now > self._updated:
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+            self._tokens -= 1
+            return max(0.0, self._updated - now) + max(0.0, -self._tokens / self.rate)
+
+    def acquire(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def penalise(self, retry_after: float) -> None:
+        """Hand out no tokens for ``retry_after`` seconds, then refill from empty."""
+        with self._lock:
+            resume = time.monotonic() + retry_after
+            if resume > self._updated:
+                self._tokens = min(self._tokens, 0.0)
+                self._updated = resume
+
+    @staticmethod
+    def parse_retry_after(value: str | None) -> float | None:
+        # Retry-After is either a number of seconds or an HTTP date
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
 class RestClient():
     """RestClient.
 
+    Owns a pooled, keep-alive :class:`requests.Session` so repeated calls to
+    the API reuse TCP/TLS connections. Pass the same instance to several
+    endpoint clients to share one pool between them.
+
     :param str app_key: App key to access TfL unified API
+    :param int pool_connections: Number of per-host connection pools to cache
+    :param int pool_maxsize: Maximum number of connections kept per host
+    :param bool keep_alive: Keep connections open between requests
+    :param int requests_per_minute: Optional quota of the app key; requests
+        are rate limited client-side by a :class:`TokenBucket` shared by every
+        RestClient using the same key
     """
 
-    def __init__(self, app_key: str = None):
+    def __init__(self, app_key: str = None, pool_connections: int = 10,
+                 pool_maxsize: int = 10, keep_alive: bool = True, requests_per_minute: int = None):
         self.app_key = {"app_key": app_key} if app_key else None
+        self.keep_alive = keep_alive
+        self.rate_limiter = TokenBucket.for_key(app_key, requests_per_minute) if requests_per_minute else None
+        self.session = self._create_session(pool_connections, pool_maxsize)
+
+    @staticmethod
+    def _create_session(pool_connections: int, pool_maxsize: int) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
-    def send_request(self, location, params=None):
-        request_headers = self._get_request_headers()
+    def send_request(self, location, params=None, headers=None, stream=False):
+        request_headers = self._get_request_headers(headers)
         full_path = urljoin(base_url, location)
-        return requests.get(full_path + "?" + self._get_query_strings(params), headers=request_headers)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        response = self.session.get(
+            full_path + "?" + self._get_query_strings(params), headers=request_headers, stream=stream)
+        self._handle_rate_limit(response)
+        return response
+
+    def _handle_rate_limit(self, response) -> None:
+        if self.rate_limiter is None or response.status_code != 429:
+            return
+        retry_after = TokenBucket.parse_retry_after(response.headers.get("Retry-After"))
+        # without a Retry-After, back off for long enough to earn one token
+        self.rate_limiter.penalise(retry_after if retry_after is not None else 1 / self.rate_limiter.rate)
+
+    def close(self):
+        self.session.close()
 
-    def _get_request_headers(self):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _get_request_headers(self, headers=None):
         request_headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
+            "Connection": "keep-alive" if self.keep_alive else "close",
         }
         if self.app_key is not None:
             request_headers.update(self.app_key)
+        if headers:
+            request_headers.update(headers)
         return request_headers
 
     def _get_query_strings(self, params):
         if params is None:
             params = {}
-        return urlencode(params)
\ No newline at end of file
+        return urlencode(params)
+
+
+class AsyncRestClient(RestClient):
+    """AsyncRestClient.
+
+    asyncio counterpart of :class:`RestClient`, backed by a pooled
+    ``httpx.AsyncClient``. Requires the optional ``httpx`` package.
+
+    :param str app_key: App key to access TfL unified API
+    :param int pool_connections: Number of hosts to keep pooled connections for
+    :param int pool_maxsize: Maximum number of connections kept per host
+    :param bool keep_alive: Keep connections open between requests
+    :param int requests_per_minute: Optional quota of the app key, shared with
+        every sync and async client using the same key
+    """
+
+    def __init__(self, app_key: str = None, pool_connections: int = 10,
+                 pool_maxsize: int = 10, keep_alive: bool = True, requests_per_minute: int = None):
+        # httpx is imported here rather than at module level so that sync-only users never load it
+        try:
+            import httpx  # noqa: F401
+        except ImportError:
+            raise ImportError("AsyncRestClient requires the 'httpx' package: pip install httpx") from None
+        self.app_key = {"app_key": app_key} if app_key else None
+        self.keep_alive = keep_alive
+        self.rate_limiter = TokenBucket.for_key(app_key, requests_per_minute) if requests_per_minute else None
+        self.session = self._create_async_session(pool_connections, pool_maxsize, keep_alive)
+
+    @staticmethod
+    def _create_async_session(pool_connections: int, pool_maxsize: int, keep_alive: bool):
+        import httpx
+
+        limits = httpx.Limits(
+            max_connections=pool_connections * pool_maxsize,
+            max_keepalive_connections=pool_maxsize if keep_alive else 0,
+        )
+        return httpx.AsyncClient(limits=limits)
+
+    async def send_request(self, location, params=None, headers=None, stream=False):
+        request_headers = self._get_request_headers(headers)
+        full_path = urljoin(base_url, location)
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async()
+        request = self.session.build_request(
+            "GET", full_path + "?" + self._get_query_strings(params), headers=request_headers)
+        response = await self.session.send(request, stream=stream)
+        self._handle_rate_limit(response)
+        return response
+
+    async def close(self):
+        await self.session.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
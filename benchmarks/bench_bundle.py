@@ -0,0 +1,63 @@
+"""Compare cold-start import times of per-file and bundled model output.
+
+Run from the repository root with the interpreter used for generation
+(build_models.py needs Python 3.12+):
+
+    python benchmarks/bench_bundle.py [--repeat N]
+
+Generates the models twice into a temporary directory, once per module and
+once with ``--bundle-models``, then times each statement in a fresh
+interpreter for both layouts.
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STATEMENTS = {
+    "one model": "from {package}.models import Prediction",
+    "all models": "import {package}.models as m; [getattr(m, name) for name in m.__all__]",
+}
+
+TIMER = (
+    "import time; start = time.perf_counter(); {statement}; "
+    "print((time.perf_counter() - start) * 1000)"
+)
+
+
+def generate(output_dir: str, *options: str) -> None:
+    subprocess.run(
+        [sys.executable, os.path.join(ROOT, "build_models.py"), os.path.join(ROOT, "OpenAPI_specs"), output_dir, *options],
+        check=True, capture_output=True,
+    )
+    # the generated package imports its lazy loader from the runtime files
+    shutil.copy(os.path.join(ROOT, "model_files", "lazy.py"), output_dir)
+
+
+def import_time_ms(workdir: str, statement: str) -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", TIMER.format(statement=statement)],
+        cwd=workdir, capture_output=True, text=True, check=True,
+    ).stdout
+    return float(output)
+
+
+def main(repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as workdir:
+        generate(os.path.join(workdir, "per_file"))
+        generate(os.path.join(workdir, "bundled"), "--bundle-models")
+        print(f"{'statement':<12} {'layout':>9} {'best ms':>8}")
+        for name, statement in STATEMENTS.items():
+            for package in ("per_file", "bundled"):
+                best = min(import_time_ms(workdir, statement.format(package=package)) for _ in range(repeat))
+                print(f"{name:<12} {package:>9} {best:>8.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    main(parser.parse_args().repeat)
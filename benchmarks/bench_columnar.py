@@ -0,0 +1,37 @@
+"""Compare building columns from validated models and from the raw JSON body.
+
+Run from the repository root:
+
+    python benchmarks/bench_columnar.py [count ...]
+"""
+import sys
+import time
+
+from synthetic import prediction_payload
+from app.columnar import to_columns
+from app.models import PredictionArray
+
+
+def best_time(func, repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(counts):
+    print(f"{'items':>8} {'path':>28} {'best ms':>9}")
+    for count in counts:
+        body = prediction_payload(count)
+        paths = (
+            ("validate + to_columns(model)", lambda: to_columns(PredictionArray.model_validate_json(body))),
+            ("to_columns(raw json)", lambda: to_columns(body, PredictionArray)),
+        )
+        for name, func in paths:
+            print(f"{count:>8} {name:>28} {best_time(func) * 1000:>9.1f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 50_000])
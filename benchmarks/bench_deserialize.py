@@ -0,0 +1,57 @@
+"""Compare the dict-based and JSON-bytes deserialisation paths.
+
+Run from the repository root:
+
+    python benchmarks/bench_deserialize.py [count ...]
+
+For each payload size it reports the best wall time and the tracemalloc
+peak for ``Model(json.loads(body))`` (the previous ``Client`` path) and for
+``Model.model_validate_json(body)`` (the current fast path).
+"""
+import json
+import sys
+import time
+import tracemalloc
+
+from synthetic import prediction_payload
+from app.models import PredictionArray
+
+
+def dict_path(body: bytes):
+    return PredictionArray(json.loads(body))
+
+
+def json_path(body: bytes):
+    return PredictionArray.model_validate_json(body)
+
+
+def best_time(func, body: bytes, repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(body)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def peak_memory(func, body: bytes) -> int:
+    tracemalloc.start()
+    result = func(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak
+
+
+def main(counts):
+    print(f"{'items':>8} {'body MiB':>9} {'path':>20} {'best ms':>9} {'peak MiB':>9}")
+    for count in counts:
+        body = prediction_payload(count)
+        for name, func in (("json.loads + Model()", dict_path), ("model_validate_json", json_path)):
+            seconds = best_time(func, body)
+            peak = peak_memory(func, body)
+            print(f"{count:>8} {len(body) / 2**20:>9.2f} {name:>20} {seconds * 1000:>9.1f} {peak / 2**20:>9.2f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 50_000])
@@ -0,0 +1,54 @@
+"""Check cold-start import times of the generated package against a budget.
+
+Run from the repository root:
+
+    python benchmarks/bench_import.py [--repeat N]
+
+Each statement runs in a fresh interpreter; the best of ``--repeat`` runs is
+compared with its budget and the script exits non-zero if any is exceeded,
+so it can gate CI.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# statement -> budget in milliseconds
+BUDGETS = {
+    "import app": 50,
+    "from app import BikePointClient": 400,
+    "from app.models import Prediction": 250,
+    "import app.models; app.models.__all__": 50,
+}
+
+TIMER = (
+    "import time; start = time.perf_counter(); {statement}; "
+    "print((time.perf_counter() - start) * 1000)"
+)
+
+
+def import_time_ms(statement: str) -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", TIMER.format(statement=statement)],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stdout
+    return float(output)
+
+
+def main(repeat: int) -> int:
+    over_budget = 0
+    print(f"{'statement':<40} {'best ms':>8} {'budget':>7}")
+    for statement, budget in BUDGETS.items():
+        best = min(import_time_ms(statement) for _ in range(repeat))
+        flag = "" if best <= budget else "  OVER BUDGET"
+        over_budget += best > budget
+        print(f"{statement:<40} {best:>8.1f} {budget:>7}{flag}")
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    sys.exit(main(parser.parse_args().repeat))
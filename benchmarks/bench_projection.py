@@ -0,0 +1,52 @@
+"""Compare full and projected validation of a prediction array.
+
+Run from the repository root:
+
+    python benchmarks/bench_projection.py [count ...]
+
+For each payload size it reports the best wall time and the memory retained
+by the result for the full ``PredictionArray`` and for a departure-board
+projection onto five fields.
+"""
+import sys
+import time
+import tracemalloc
+
+from synthetic import prediction_payload
+from app.models import PredictionArray
+from app.projection import project_model
+
+FIELDS = ("naptanId", "lineName", "platformName", "destinationName", "timeToStation")
+
+
+def best_time(Model, body: bytes, repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        Model.model_validate_json(body)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def retained_memory(Model, body: bytes) -> int:
+    tracemalloc.start()
+    result = Model.model_validate_json(body)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained
+
+
+def main(counts):
+    Projected = project_model(PredictionArray, FIELDS)
+    print(f"{'items':>8} {'model':>12} {'best ms':>9} {'retained MiB':>13}")
+    for count in counts:
+        body = prediction_payload(count)
+        for name, Model in (("full", PredictionArray), ("projected", Projected)):
+            seconds = best_time(Model, body)
+            retained = retained_memory(Model, body)
+            print(f"{count:>8} {name:>12} {seconds * 1000:>9.1f} {retained / 2**20:>13.2f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 50_000])
@@ -0,0 +1,40 @@
+"""Compare the memory held by validated models and by their record form.
+
+Run from the repository root:
+
+    python benchmarks/bench_records.py [count ...]
+
+``app/records.py`` is produced by ``build_models.py --records``. For each
+payload size it reports the bytes retained per ``Prediction`` as a pydantic
+model and as a slotted, frozen dataclass record, as measured by tracemalloc.
+"""
+import sys
+import tracemalloc
+
+from synthetic import prediction_payload
+from app.models import PredictionArray
+from app.records import to_record
+
+
+def retained_bytes(build) -> int:
+    tracemalloc.start()
+    result = build()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained
+
+
+def main(counts):
+    print(f"{'items':>8} {'form':>8} {'bytes/item':>11}")
+    for count in counts:
+        body = prediction_payload(count)
+        model_bytes = retained_bytes(lambda: PredictionArray.model_validate_json(body))
+        # converting keeps only the records: the models are dropped as soon as each one is converted
+        record_bytes = retained_bytes(lambda: to_record(PredictionArray.model_validate_json(body)))
+        print(f"{count:>8} {'model':>8} {model_bytes / count:>11.0f}")
+        print(f"{count:>8} {'record':>8} {record_bytes / count:>11.0f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 50_000])
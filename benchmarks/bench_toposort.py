@@ -0,0 +1,44 @@
+"""Measure how topological_sort scales with the size of the schema graph.
+
+Run from the repository root with Python 3.12+ (build_models.py needs it):
+
+    python benchmarks/bench_toposort.py [size ...]
+
+Each synthetic graph has ``size`` models, each depending on up to four
+models generated before it, like nested schemas do. Time per model should
+stay roughly flat as the graph grows.
+"""
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+logging.disable(logging.INFO)
+
+from build_models import topological_sort  # noqa: E402
+
+
+def synthetic_graph(size: int, seed: int = 0) -> dict[str, set[str]]:
+    rng = random.Random(seed)
+    names = [f"Model{index:06d}" for index in range(size)]
+    rng.shuffle(names)
+    return {
+        name: {names[rng.randrange(index)] for _ in range(rng.randint(0, 4))} if index else set()
+        for index, name in enumerate(names)
+    }
+
+
+def main(sizes):
+    print(f"{'models':>8} {'seconds':>9} {'us/model':>9}")
+    for size in sizes:
+        graph = synthetic_graph(size)
+        start = time.perf_counter()
+        topological_sort(graph)
+        elapsed = time.perf_counter() - start
+        print(f"{size:>8} {elapsed:>9.3f} {elapsed / size * 1e6:>9.1f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1_000, 5_000, 10_000, 50_000])
@@ -0,0 +1,57 @@
+"""Synthetic TfL-shaped payloads shared by the benchmark scripts."""
+import json
+import os
+import random
+import sys
+
+# make the generated ``app`` package importable when run from any directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+LINES = ["victoria", "central", "northern", "jubilee", "district", "piccadilly",
+         "bakerloo", "circle", "metropolitan", "hammersmith-city", "elizabeth", "dlr"]
+STATIONS = [f"940GZZLU{code:03d}" for code in range(300)]
+PLATFORMS = ["Northbound - Platform 1", "Southbound - Platform 2",
+             "Eastbound - Platform 3", "Westbound - Platform 4"]
+
+
+def prediction(index: int, rng: random.Random) -> dict:
+    line = rng.choice(LINES)
+    station = rng.choice(STATIONS)
+    destination = rng.choice(STATIONS)
+    return {
+        "$type": "Tfl.Api.Presentation.Entities.Prediction, Tfl.Api.Presentation.Entities",
+        "id": f"-{index}",
+        "operationType": 1,
+        "vehicleId": f"{rng.randint(100, 999)}",
+        "naptanId": station,
+        "stationName": f"{station} Underground Station",
+        "lineId": line,
+        "lineName": line.title(),
+        "platformName": rng.choice(PLATFORMS),
+        "direction": rng.choice(["inbound", "outbound"]),
+        "bearing": "",
+        "destinationNaptanId": destination,
+        "destinationName": f"{destination} Underground Station",
+        "timestamp": "2024-09-30T17:45:12.1234567Z",
+        "timeToStation": rng.randint(0, 1800),
+        "currentLocation": "Between Stations",
+        "towards": f"{destination}",
+        "expectedArrival": "2024-09-30T17:52:41Z",
+        "timeToLive": "2024-09-30T17:53:11Z",
+        "modeName": "tube",
+        "timing": {
+            "$type": "Tfl.Api.Presentation.Entities.PredictionTiming, Tfl.Api.Presentation.Entities",
+            "countdownServerAdjustment": "00:00:00",
+            "source": "0001-01-01T00:00:00",
+            "insert": "0001-01-01T00:00:00",
+            "read": "2024-09-30T17:45:10.983Z",
+            "sent": "2024-09-30T17:45:12Z",
+            "received": "0001-01-01T00:00:00",
+        },
+    }
+
+
+def prediction_payload(count: int, seed: int = 0) -> bytes:
+    """Return a JSON array of ``count`` predictions, as TfL's arrivals endpoints do."""
+    rng = random.Random(seed)
+    return json.dumps([prediction(i, rng) for i in range(count)]).encode()
@@ -1,3 +1,5 @@
+import hashlib
+import io
 import json
 import os
 from io import TextIOWrapper
@@ -10,7 +12,12 @@ import re
 import keyword
 import builtins
 import argparse
+import heapq
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import repeat
 from urllib.parse import urljoin
 
 from typing import __all__ as typing_all
@@ -28,7 +35,11 @@ from typing import (
     get_args,
     Literal,
     ForwardRef,
+    Hashable,
     Tuple,
+    Callable,
+    Iterable,
+    FrozenSet,
 )
 from pydantic import BaseModel, RootModel, create_model, Field
 from pydantic.fields import FieldInfo
@@ -44,6 +55,95 @@ logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
+MANIFEST_FILE = ".build_models_manifest.json"
+
+# names that generated model modules import from pydantic
+PYDANTIC_NAMES = {"BaseModel", "RootModel", "Field"}
+
+# path -> content hash of every file written by this run
+emitted_files: Dict[str, str] = {}
+
+
+# Generated output
+def content_hash(content: str | bytes) -> str:
+    if isinstance(content, str):
+        content = content.encode()
+    return hashlib.sha256(content).hexdigest()
+
+
+@contextmanager
+def open_output(path: str):
+    """Open a generated file for writing; it is only rewritten if its content changed.
+
+    Unchanged files keep their mtime, so bytecode caches, file watchers and
+    test runners downstream don't see a change.
+    """
+    buffer = io.StringIO()
+    yield buffer
+    content = buffer.getvalue()
+    emitted_files[os.path.normpath(path)] = content_hash(content)
+    if os.path.exists(path):
+        with open(path, newline="") as existing:
+            if existing.read() == content:
+                return
+    with open(path, "w") as output:
+        output.write(content)
+
+
+def get_input_hashes(spec_path: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """Hash everything the output depends on: each spec, the generator and its options."""
+    generator_files = [__file__, os.path.join(os.path.dirname(__file__), "mappings.py")]
+    generator_hash = hashlib.sha256()
+    for generator_file in generator_files:
+        with open(generator_file, "rb") as f:
+            generator_hash.update(f.read())
+
+    specs = {}
+    for file_name in sorted(os.listdir(spec_path)):
+        if file_name.endswith(".json"):
+            with open(os.path.join(spec_path, file_name), "rb") as f:
+                specs[file_name] = content_hash(f.read())
+    return {"generator": generator_hash.hexdigest(), "options": options, "specs": specs}
+
+
+def load_manifest(output_path: str) -> Dict[str, Any]:
+    try:
+        with open(os.path.join(output_path, MANIFEST_FILE)) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def is_output_current(manifest: Dict[str, Any], output_path: str, inputs: Dict[str, Any]) -> bool:
+    """True if the inputs are unchanged and every file from the last run is still as written."""
+    if not manifest or manifest.get("inputs") != inputs:
+        return False
+    for relative_path, file_hash in manifest.get("outputs", {}).items():
+        try:
+            with open(os.path.join(output_path, relative_path), "rb") as f:
+                if content_hash(f.read()) != file_hash:
+                    return False
+        except FileNotFoundError:
+            return False
+    return True
+
+
+def save_manifest(manifest: Dict[str, Any], output_path: str, inputs: Dict[str, Any]):
+    """Record this run's inputs and outputs, removing files the last run wrote but this one didn't."""
+    outputs = {
+        os.path.relpath(path, output_path): file_hash
+        for path, file_hash in sorted(emitted_files.items())
+    }
+    for relative_path in sorted(manifest.get("outputs", {}).keys() - outputs.keys()):
+        stale_file = os.path.join(output_path, relative_path)
+        if os.path.exists(stale_file):
+            os.remove(stale_file)
+            logging.info(f"Removed stale generated file: {stale_file}")
+
+    with open_output(os.path.join(output_path, MANIFEST_FILE)) as f:
+        json.dump({"inputs": inputs, "outputs": outputs}, f, indent=2)
+        f.write("\n")
+
 
 # Helper functions
 def sanitize_name(name: str, prefix: str = "Model") -> str:
@@ -282,82 +382,260 @@ def create_generic_response_model() -> Type[RootModel]:
 
 
 # Save models and config to files
-def determine_typing_imports(
-    model_fields: Dict[str, FieldInfo],
-    models: Dict[str, Type[BaseModel] | type],
-    circular_models: Set[str],
-) -> List[str]:
-    """Determine necessary typing imports based on the field annotations."""
-    import_set = set()
+def save_models(
+    models: Dict[str, Union[Type[BaseModel], Type[List]]],
+    base_path: str,
+    dependency_graph: Dict[str, Set[str]],
+    circular_models: Dict[str, Set[str]],
+    defer_build: bool = False,
+):
+    models_dir = os.path.join(base_path, "models")
+    os.makedirs(models_dir, exist_ok=True)
+    # existing_models = find_existing_models(models_dir)
+
+    # all_models_to_import = {**models, **existing_models}
 
-    for field in model_fields.values():
-        field_annotation = get_type_str(field.annotation, models)
+    cycle_peers = get_cycle_peers(dependency_graph)
+    for model_name, model in models.items():
+        save_model_file(
+            model_name,
+            model,
+            models,
+            models_dir,
+            cycle_peers,
+            circular_models,
+            defer_build,
+        )
 
-        # Check for any type in typing.__all__
-        for type_name in typing_all:
-            if type_name in field_annotation:
-                import_set.add(type_name)
+    init_file = os.path.join(models_dir, "__init__.py")
+    with open_output(init_file) as init_f:
+        write_lazy_init(
+            init_f,
+            {
+                sanitize_name(model_name): (f".{sanitize_name(model_name)}", sanitize_name(model_name))
+                for model_name in models
+            },
+            "..lazy",
+        )
 
-        # Check for circular references
-        if field_annotation in circular_models:
-            import_set.add("ForwardRef")
+    # Write enums after saving the models
+    write_enum_files(models, models_dir)
 
-    return import_set
+    write_model_registry(models, models_dir)
 
 
-def write_import_statements(
-    init_f: TextIOWrapper, models: Dict[str, Type[BaseModel]], models_dir: str
+def write_lazy_init(
+    init_f: TextIOWrapper,
+    lazy_imports: Dict[str, Tuple[str, Optional[str]]],
+    lazy_module: str,
 ):
-    # Group models by their module, excluding standard Python and typing modules
-    module_to_classes = {}
-    for model_name, model in models.items():
-        # Skip models that are Dict or List or other typing models
-        if isinstance(model, (Dict, List)) or model.__module__ in ['builtins', 'typing', '__main__']:
-            continue
+    """Write a package `__init__` that imports its exports on first access (PEP 562).
 
-        module_name = model.__module__.split(".")[-1]
-        if module_name not in module_to_classes:
-            module_to_classes[module_name] = []
-        module_to_classes[module_name].append(model_name)
+    `lazy_imports` maps each exported name to the relative module it comes
+    from and the attribute to take from it, or None to export the module.
+    """
+    # static imports for type checkers and IDEs, which don't run __getattr__
+    type_checking_imports = defaultdict(list)
+    for name, (module_path, attribute) in lazy_imports.items():
+        if attribute is None:
+            type_checking_imports["."].append(name)
+        else:
+            type_checking_imports[module_path].append(attribute)
+
+    init_f.write("from typing import TYPE_CHECKING\n")
+    init_f.write(f"from {lazy_module} import lazy_package\n\n")
+    init_f.write("if TYPE_CHECKING:\n")
+    for module_path, names in type_checking_imports.items():
+        init_f.write(f"    from {module_path} import {', '.join(names)}\n")
+    init_f.write("\n__getattr__, __dir__ = lazy_package(__name__, {\n")
+    for name, (module_path, attribute) in lazy_imports.items():
+        init_f.write(f"    '{name}': ('{module_path}', {repr(attribute)}),\n")
+    init_f.write("})\n")
+    init_f.write(
+        f"\n__all__ = [\n    {',\n    '.join(f'\"{name}\"' for name in lazy_imports)}\n]\n"
+    )
 
-    # Write the import statements, one per module
-    for module, class_names in module_to_classes.items():
-        init_f.write(f"from .{module} import {', '.join(class_names)}\n")
 
-def save_models(
+def write_model_registry(models: Dict[str, Type[BaseModel]], models_dir: str, bundled: bool = False):
+    """Write a static model name -> module path registry so the client can import models lazily.
+
+    A bundled models package defines every model itself, so each entry points at the package.
+    """
+    registry_file = os.path.join(models_dir, "model_registry.py")
+    model_names = sorted(sanitize_name(model_name) for model_name in models)
+    with open_output(registry_file) as rf:
+        rf.write("model_registry = {\n")
+        for model_name in model_names:
+            rf.write(f"    '{model_name}': '.{'' if bundled else model_name}',\n")
+        rf.write("}\n")
+
+
+def get_bundle_order(
+    sorted_models: List[str],
+    dependency_graph: Dict[str, Set[str]],
+    circular_models: Optional[Dict[str, Set[str]]] = None,
+) -> List[str]:
+    """Order models so that each is defined after the models it references.
+
+    `sorted_models` lists dependents first, so it is walked in reverse; models
+    that the sort could not place because of a cycle are pulled in after their
+    dependencies instead of at the end. Deferred references in
+    `circular_models` are quoted, so they don't constrain the order.
+    """
+    circular_models = circular_models or {}
+    ordered = []
+    emitted = set()
+
+    def emit(model_name: str):
+        if model_name in emitted:
+            return
+        emitted.add(model_name)
+        for dep in sorted(dependency_graph.get(model_name, set()) - circular_models.get(model_name, set())):
+            emit(dep)
+        ordered.append(model_name)
+
+    for model_name in reversed(sorted_models):
+        emit(model_name)
+    return ordered
+
+
+def save_models_bundle(
     models: Dict[str, Union[Type[BaseModel], Type[List]]],
     base_path: str,
     dependency_graph: Dict[str, Set[str]],
-    circular_models: Set[str],
+    circular_models: Dict[str, Set[str]],
+    sorted_models: List[str],
+    defer_build: bool = False,
 ):
+    """Write every model and enum into a single `models/__init__.py`.
+
+    One module instead of one per schema means one file to find and compile
+    on a cold start, which matters from a zipapp or a network filesystem.
+    """
     models_dir = os.path.join(base_path, "models")
     os.makedirs(models_dir, exist_ok=True)
-    # existing_models = find_existing_models(models_dir)
 
-    # all_models_to_import = {**models, **existing_models}
+    typing_names = set()
+    pydantic_names = set()
+    class_sources = []
+    model_names = {sanitize_name(model_name): model_name for model_name in models}
+    for sanitized_model_name in get_bundle_order(sorted_models, dependency_graph, circular_models):
+        if sanitized_model_name not in model_names:
+            continue
+        model_source = io.StringIO()
+        write_model_source(
+            model_source,
+            models[model_names[sanitized_model_name]],
+            models,
+            circular_models,
+            sanitized_model_name,
+            defer_build,
+        )
+        # hoist the per-module imports; models and enums are defined in the bundle itself
+        body_lines = []
+        for line in model_source.getvalue().splitlines():
+            if line.startswith("from typing import "):
+                typing_names.update(filter(None, line.removeprefix("from typing import ").split(", ")))
+            elif line.startswith("from pydantic import "):
+                pydantic_names.update(line.removeprefix("from pydantic import ").split(", "))
+            elif not line.startswith("from ."):
+                body_lines.append(line)
+        class_sources.append("\n".join(body_lines).strip() + "\n")
 
     init_file = os.path.join(models_dir, "__init__.py")
-    with open(init_file, "w") as init_f:
-        # Write import statements for existing models
-        write_import_statements(init_f, models, models_dir)
-
-        for model_name, model in models.items():
-            save_model_file(
-                model_name,
-                model,
-                models,
-                models_dir,
-                dependency_graph,
-                circular_models,
-                init_f,
-            )
-
+    with open_output(init_file) as init_f:
+        init_f.write("from enum import Enum\n")
+        init_f.write(f"from pydantic import {', '.join(sorted(pydantic_names))}\n")
+        if typing_names:
+            init_f.write(f"from typing import {', '.join(sorted(typing_names))}\n")
+        for enum in collect_enums(models).values():
+            init_f.write("\n\n")
+            write_enum_class(init_f, enum)
+        for class_source in class_sources:
+            init_f.write("\n\n")
+            init_f.write(class_source)
+        # models with deferred references to other models can be completed once all are defined;
+        # with defer_build they are left for pydantic to complete on first use
+        rebuilt_models = sorted(
+            model_name for model_name, refs in circular_models.items() if refs - {model_name}
+        )
+        if rebuilt_models and not defer_build:
+            init_f.write("\n\n")
+            for model_name in rebuilt_models:
+                init_f.write(f"{model_name}.model_rebuild()\n")
         init_f.write(
-            f"\n__all__ = [\n    {',\n    '.join(f'\"{key}\"' for key in models.keys())}\n]\n"
+            f"\n__all__ = [\n    {',\n    '.join(f'\"{name}\"' for name in model_names)}\n]\n"
         )
 
-    # Write enums after saving the models
-    write_enum_files(models, models_dir)
+    write_model_registry(models, models_dir, bundled=True)
+
+
+def get_record_type_str(annotation: Any, models: Dict[str, Type[BaseModel]]) -> str:
+    """Annotation for a record field: like the model's, but with lists stored as tuples."""
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Union and len(args) == 2 and type(None) in args:
+        non_none_arg = args[0] if args[0] is not type(None) else args[1]
+        return f"Optional[{get_record_type_str(non_none_arg, models)}]"
+    if origin is list:
+        return f"tuple[{get_record_type_str(args[0], models)}, ...]"
+    return resolve_forward_refs_in_annotation(annotation, models, set())
+
+
+def save_records(models: Dict[str, Type[BaseModel]], base_path: str, bundled: bool = False):
+    """Write `records.py`: a frozen, slotted dataclass for every object model and a
+    `to_record` converter from the validated pydantic objects.
+
+    Array models become tuples of records and dict models stay dicts, so the
+    records module only declares classes for `BaseModel` schemas.
+    """
+    enum_imports = set()
+    record_names = []
+    class_lines = []
+    for model_name, model in models.items():
+        if is_list_or_dict_model(model) or issubclass(model, RootModel):
+            continue
+        sanitized_model_name = sanitize_name(model_name)
+        record_names.append(sanitized_model_name)
+        # a bundled models package defines its enums itself
+        enum_imports.update(
+            f"from .models import {enum_name}" if bundled else f"from .models.{enum_name} import {enum_name}"
+            for enum_name in collect_enums({sanitized_model_name: model})
+        )
+        class_lines.append(f"\n\n@dataclass(slots=True, frozen=True)\nclass {sanitized_model_name}:\n")
+        if not model.model_fields:
+            class_lines.append("    pass\n")
+        for field_name, field in model.model_fields.items():
+            field_type = get_record_type_str(field.annotation, models)
+            class_lines.append(f"    {sanitize_field_name(field_name)}: {field_type} = None\n")
+
+    records_file = os.path.join(base_path, "records.py")
+    with open_output(records_file) as rf:
+        rf.write("from __future__ import annotations\n\n")
+        rf.write("from dataclasses import dataclass\n")
+        rf.write("from typing import Any, Dict, List, Optional, Union\n")
+        rf.write("from pydantic import BaseModel, RootModel\n")
+        if enum_imports:
+            rf.write("\n".join(sorted(enum_imports)) + "\n")
+        rf.writelines(class_lines)
+        rf.write(
+            "\n\nrecord_types = {\n"
+            + "".join(f"    '{name}': {name},\n" for name in record_names)
+            + "}\n"
+        )
+        rf.write(
+            "\n\ndef to_record(value: Any) -> Any:\n"
+            "    '''Convert a validated model, or a list of them, into its compact record form.'''\n"
+            "    if isinstance(value, RootModel):\n"
+            "        return to_record(value.root)\n"
+            "    if isinstance(value, BaseModel):\n"
+            "        record_type = record_types[type(value).__name__]\n"
+            "        return record_type(*[to_record(getattr(value, field)) for field in record_type.__slots__])\n"
+            "    if isinstance(value, list):\n"
+            "        return tuple([to_record(item) for item in value])\n"
+            "    return value\n"
+        )
+    logging.info(f"Record classes generated at: {records_file}")
 
 
 def save_model_file(
@@ -365,37 +643,101 @@ def save_model_file(
     model: Any,
     models: Dict[str, Type[BaseModel]],
     models_dir: str,
-    dependency_graph: Dict[str, Set[str]],
-    circular_models: Set[str],
-    init_f,
+    cycle_peers: Dict[str, Set[str]],
+    circular_models: Dict[str, Set[str]],
+    defer_build: bool = False,
 ):
     sanitized_model_name = sanitize_name(model_name)
     model_file = os.path.join(models_dir, f"{sanitized_model_name}.py")
     os.makedirs(models_dir, exist_ok=True)
 
-    with open(model_file, "w") as mf:
-        if is_list_or_dict_model(model):
-            mf.write("from pydantic import RootModel\n")
-            handle_list_or_dict_model(
-                mf,
-                model,
-                models,
-                dependency_graph,
-                circular_models,
-                sanitized_model_name,
-            )
-        else:
-            # mf.write("from pydantic import BaseModel, Field\n")
-            handle_regular_model(
-                mf,
-                model,
-                models,
-                dependency_graph,
-                circular_models,
-                sanitized_model_name,
-            )
+    # every reference into the model's own cycle is quoted, not just the
+    # deferred ones, so that no module of a cycle imports another one before
+    # its class is defined
+    peers = cycle_peers.get(sanitized_model_name, set())
+    quoted_refs = {sanitized_model_name: circular_models.get(sanitized_model_name, set()) | peers}
+    with open_output(model_file) as mf:
+        write_model_source(
+            mf, model, models, quoted_refs, sanitized_model_name, defer_build
+        )
+        write_cycle_imports(mf, sanitized_model_name, peers, defer_build)
+
+
+def get_cycle_peers(dependency_graph: Dict[str, Set[str]]) -> Dict[str, Set[str]]:
+    """Map each model on a cycle of two or more models to the other models of its cycle."""
+    cycle_peers = {}
+    for component in find_strongly_connected_components(dependency_graph):
+        if len(component) > 1:
+            for model_name in component:
+                cycle_peers[model_name] = set(component) - {model_name}
+    return cycle_peers
+
+
+def write_cycle_imports(
+    model_file: TextIOWrapper, sanitized_model_name: str, peers: Set[str], defer_build: bool = False
+):
+    """Import the other models of the model's cycle after its class definition, then complete it.
+
+    Whichever model of the cycle is imported first pulls in all the others,
+    each of which finds the classes already defined. By the time a model is
+    rebuilt, its module has bound every name the cycle refers to. With
+    `defer_build` the rebuild is left to pydantic, which resolves the names
+    from the module on first validation or `Client.warm_up()`.
+    """
+    if not peers:
+        return
+    model_file.write("\n")
+    for peer in sorted(peers):
+        model_file.write(f"from .{peer} import {peer}\n")
+    if not defer_build:
+        model_file.write(f"\n{sanitized_model_name}.model_rebuild()\n")
+
+
+def write_model_source(
+    model_file: TextIOWrapper,
+    model: Any,
+    models: Dict[str, Type[BaseModel]],
+    circular_models: Dict[str, Set[str]],
+    sanitized_model_name: str,
+    defer_build: bool = False,
+):
+    """Write the imports and class definition of one model module.
+
+    The imports are computed from the names that the base class and field
+    annotations reference, parsed as Python expressions, so the module
+    imports exactly what it uses.
+    """
+    deferred_refs = circular_models.get(sanitized_model_name, set())
+    if is_list_or_dict_model(model):
+        base, fields = build_list_or_dict_model(model, deferred_refs), []
+    else:
+        base, fields = build_regular_model(model, models, deferred_refs)
+
+    names = set(get_loaded_names(base))
+    for _, _, field_type in fields:
+        names.update(get_loaded_names(field_type))
+    if fields:
+        names.add("Field")
+    imports = get_model_imports(names, model, models, sanitized_model_name)
+
+    # Add model_rebuild() if the model only references itself; models on a
+    # longer cycle are rebuilt once the rest of the cycle is defined, and with
+    # defer_build pydantic completes them on first use
+    rebuild = deferred_refs == {sanitized_model_name} and not defer_build
+    model_file.write(
+        format_model_module(imports, sanitized_model_name, base, fields, get_model_config(defer_build), rebuild)
+    )
+
 
-        init_f.write(f"from .{sanitized_model_name} import {sanitized_model_name}\n")
+def get_model_config(defer_build: bool = False) -> Dict[str, Any]:
+    """The `model_config` shared by every generated model.
+
+    With `defer_build`, pydantic compiles a model's validator on first use
+    instead of at import time.
+    """
+    if defer_build:
+        return {"from_attributes": True, "defer_build": True}
+    return {"from_attributes": True}
 
 
 def get_builtin_types() -> set:
@@ -413,132 +755,94 @@ def is_list_or_dict_model(model: Any) -> str | None:
     return None
 
 
-def handle_list_or_dict_model(
-    model_file: TextIOWrapper,
-    model: Any,
-    models: Dict[str, Type[BaseModel]],
-    dependency_graph: Dict[str, set[str]],
-    circular_models: Set[str],
-    sanitized_model_name: str,
-):
-    """Handle models that are either list or dict types."""
-    inner_type = model.__args__[0]
-    # Check if the model is a List or Dict
+def build_list_or_dict_model(model: Any, deferred_refs: Set[str]) -> str:
+    """Base class of a model that is a list or dict type."""
     model_type = is_list_or_dict_model(model)
-    # Separate sets for typing imports and module imports
-    typing_imports = {model_type}
-    module_imports = set()
-
-    # Handle non-built-in types for inner_type
-    built_in_types = get_builtin_types()
-    inner_type_name = getattr(inner_type, "__name__", None)
-
-    if inner_type_name and inner_type_name not in {"Optional", "List", "Union"}:
-        sanitized_inner_name = sanitize_name(inner_type_name)
-        if sanitized_inner_name in models:
-            module_imports.add(
-                f"from .{sanitized_inner_name} import {sanitized_inner_name}"
-            )
-        elif inner_type not in built_in_types:
-            typing_imports.add(inner_type_name)
-
-    # create the class definition
     if model_type == "List":
-        class_definition = (
-            f"class {sanitized_model_name}(RootModel[List[{inner_type_name}]]):\n"
-        )
+        inner_type_name = getattr(model.__args__[0], "__name__", "Any")
+        if sanitize_name(inner_type_name) in deferred_refs:
+            # imported after the class to close a dependency cycle
+            inner_type_name = repr(inner_type_name)
+        root_type = f"List[{inner_type_name}]"
     elif model_type == "Dict":
-        class_definition = f"class {sanitized_model_name}(RootModel[Dict[str, Any]]):\n"
-        typing_imports.add("Any")
+        root_type = "Dict[str, Any]"
     else:
         raise ValueError("Model is not a list or dict model.")
-    # Write typing imports
-    if typing_imports:
-        typing_imports = sorted(typing_imports - get_builtin_types())
-        model_file.write(f"from typing import {', '.join(sorted(typing_imports))}\n")
+    return f"RootModel[{root_type}]"
+
 
-    # Write module imports
-    if module_imports:
-        model_file.write("\n".join(sorted(module_imports)) + "\n")
+def build_regular_model(
+    model: Type[BaseModel],
+    models: Dict[str, Type[BaseModel]],
+    deferred_refs: Set[str],
+) -> Tuple[str, List[Tuple[str, Optional[str], str]]]:
+    """Base class and `(name, alias, annotation)` fields of an object model, quoting the references that are imported after it."""
+    if issubclass(model, RootModel):
+        root_type = model.model_fields["root"].annotation.__name__
+        return f"RootModel[{root_type}]", []
+
+    fields = []
+    for field_name, field in model.model_fields.items():
+        # Resolve the field's annotation to get the type string, including handling ForwardRefs
+        field_type = resolve_forward_refs_in_annotation(field.annotation, models, deferred_refs)
+        fields.append((sanitize_field_name(field_name), field.alias, field_type))
+    return "BaseModel", fields
 
-    # Write class definition
-    model_file.write(f"\n\n{class_definition}")
 
-    model_file.write("\n    model_config = {'from_attributes': True}\n")
+# Models share most of their annotations, so the names each one reads are cached
+@lru_cache(maxsize=None)
+def get_loaded_names(expression: str) -> FrozenSet[str]:
+    """Names that the Python expression `expression` reads; quoted forward references are not read."""
+    return frozenset(
+        node.id for node in ast.walk(ast.parse(expression, mode="eval")) if isinstance(node, ast.Name)
+    )
 
 
-def handle_regular_model(
-    model_file: TextIOWrapper,
-    model: BaseModel,
+def get_model_imports(
+    names: Set[str],
+    model: Any,
     models: Dict[str, Type[BaseModel]],
-    dependency_graph: Dict[str, set],
-    circular_models: Set[str],
     sanitized_model_name: str,
-):
-    # Check if the model is a RootModel
-    is_root_model = isinstance(model, type) and issubclass(model, RootModel)
-
-    # Determine necessary imports
-    typing_imports = sorted(
-        determine_typing_imports(model.model_fields, models, circular_models)
-        - get_builtin_types()
+) -> List[str]:
+    """Import statements for exactly the names that a model module references."""
+    names = names - {sanitized_model_name}
+    enums = collect_enums({sanitized_model_name: model})
+    local_names = {name for name in names if name in models or name in enums}
+    imports = [f"from .{name} import {name}" for name in local_names]
+    for module, module_names in (("pydantic", PYDANTIC_NAMES), ("typing", set(typing_all))):
+        imported_names = sorted((names - local_names) & module_names)
+        if imported_names:
+            imports.append(f"from {module} import {', '.join(imported_names)}")
+            names -= set(imported_names)
+
+    unresolved_names = names - local_names - vars(builtins).keys()
+    if unresolved_names:
+        logging.warning(f"Model {sanitized_model_name} references unknown names: {sorted(unresolved_names)}")
+
+    return sorted(imports)
+
+
+def format_model_module(
+    imports: List[str],
+    class_name: str,
+    base: str,
+    fields: List[Tuple[str, Optional[str], str]],
+    model_config: Dict[str, Any],
+    rebuild: bool = False,
+) -> str:
+    """Render a model module with the blank lines PEP 8 asks for."""
+    lines = [*imports, "", "", f"class {class_name}({base}):"]
+    lines.extend(
+        f"    {field_name}: {field_type} = Field(None, alias={alias!r})"
+        for field_name, alias, field_type in fields
     )
+    lines.extend(["", f"    model_config = {model_config!r}"])
+    if rebuild:
+        lines.extend(["", f"{class_name}.model_rebuild()"])
+    return "\n".join(lines) + "\n"
 
-    import_set = {f"from typing import {', '.join(typing_imports)}"}
-
-    # Add RootModel import if necessary
-    if is_root_model:
-        import_set.add("from pydantic import RootModel")
-    else:
-        import_set.add("from pydantic import BaseModel, Field")
-
-    # Write imports for referenced models
-    referenced_models = dependency_graph.get(sanitized_model_name, set())
-    for ref_model in referenced_models:
-        if ref_model != sanitized_model_name and ref_model not in {
-            "Optional",
-            "List",
-            "Union",
-        }:
-            import_set.add(f"from .{ref_model} import {ref_model}")
-
-    # Add Enum imports
-    import_set.update(find_enum_imports(model))
-
-    # Write imports
-    model_file.write("\n".join(sorted(import_set)) + "\n\n\n")
-
-    # Write class definition
-    if is_root_model:
-        model_file.write(
-            f"class {sanitized_model_name}(RootModel[{model.model_fields['root'].annotation.__name__}]):\n"
-        )
-    else:
-        model_file.write(f"class {sanitized_model_name}(BaseModel):\n")
-        write_model_fields(model_file, model, models, circular_models)
-
-    # Pydantic model config
-    model_file.write("\n    model_config = {'from_attributes': True}\n")
-
-    # Add model_rebuild() if circular dependencies exist
-    if sanitized_model_name in circular_models:
-        model_file.write(f"\n{sanitized_model_name}.model_rebuild()\n")
 
-
-def find_enum_imports(model: BaseModel) -> Set[str]:
-    """Find all enum imports in the model fields."""
-    import_set = set()
-    for field_name, field in model.model_fields.items():
-        inner_types = extract_inner_types(field.annotation)
-        for inner_type in inner_types:
-            if isinstance(inner_type, type) and issubclass(inner_type, Enum):
-                import_set.add(
-                    f"from .{inner_type.__name__} import {inner_type.__name__}"
-                )
-    return import_set
-
-
-def resolve_forward_refs_in_annotation(annotation: Any, models: Dict[str, Type[BaseModel]], circular_models: Set[str]) -> str:
+def resolve_forward_refs_in_annotation(annotation: Any, models: Dict[str, Type[BaseModel]], deferred_refs: Set[str]) -> str:
     """
     Recursively resolve ForwardRef in an annotation to a string representation, 
     handling Optional, List, and other generics, and quoting forward references.
@@ -549,55 +853,51 @@ def resolve_forward_refs_in_annotation(annotation: Any, models: Dict[str, Type[B
     # Handle Optional as Union[T, NoneType] and convert it to Optional[T]
     if origin is Union and len(args) == 2 and type(None) in args:
         non_none_arg = args[0] if args[0] is not type(None) else args[1]
-        resolved_inner = resolve_forward_refs_in_annotation(non_none_arg, models, circular_models)
+        resolved_inner = resolve_forward_refs_in_annotation(non_none_arg, models, deferred_refs)
         return f"Optional[{resolved_inner}]"
 
     if origin is None:
-        # Base case: if it's a ForwardRef, return it quoted
+        # Base case: quote references to models that are defined later
         if isinstance(annotation, ForwardRef):
-            return f"'{annotation.__forward_arg__}'" if annotation.__forward_arg__ in circular_models else annotation.__forward_arg__
-        return annotation.__name__ if hasattr(annotation, "__name__") else str(annotation)
+            name = annotation.__forward_arg__
+        elif hasattr(annotation, "__name__"):
+            name = annotation.__name__
+        else:
+            return str(annotation)
+        return f"'{name}'" if name in deferred_refs else name
 
     # For generics like List, Dict, etc., resolve the inner types
-    resolved_args = ", ".join(resolve_forward_refs_in_annotation(arg, models, circular_models) for arg in args)
+    resolved_args = ", ".join(resolve_forward_refs_in_annotation(arg, models, deferred_refs) for arg in args)
     return f"{origin.__name__}[{resolved_args}]"
 
 
-def write_model_fields(
-    model_file: TextIOWrapper,
-    model: BaseModel,
-    models: Dict[str, Type[BaseModel]],
-    circular_models: Set[str],
-):
-    """Write the fields for the model."""
-    for field_name, field in model.model_fields.items():
-        sanitized_field_name = sanitize_field_name(field_name)
-
-        # Resolve the field's annotation to get the type string, including handling ForwardRefs
-        field_type = resolve_forward_refs_in_annotation(field.annotation, models, circular_models)
-
-        model_file.write(
-            f"    {sanitized_field_name}: {field_type} = Field(None, alias='{field.alias}')\n"
-        )
-
-def write_enum_files(models: Dict[str, Type[BaseModel]], models_dir: str):
-    """Write enum files directly from the model's fields."""
+def collect_enums(models: Dict[str, Type[BaseModel]]) -> Dict[str, Type[Enum]]:
+    """Find the enums used by the model fields. Later enums win on a name clash, as they do on disk."""
+    enums = {}
     for model in models.values():
         if hasattr(model, "model_fields"):
             for field in model.model_fields.values():
                 inner_types = extract_inner_types(field.annotation)
                 for inner_type in inner_types:
                     if isinstance(inner_type, type) and issubclass(inner_type, Enum):
-                        enum_name = inner_type.__name__
-                        enum_file = os.path.join(models_dir, f"{enum_name}.py")
-                        os.makedirs(models_dir, exist_ok=True)
-                        with open(enum_file, "w") as ef:
-                            ef.write("from enum import Enum\n\n\n")
-                            ef.write(f"class {enum_name}(Enum):\n")
-                            for enum_member in inner_type:
-                                ef.write(
-                                    f"    {enum_member.name} = '{enum_member.value}'\n"
-                                )
+                        enums[inner_type.__name__] = inner_type
+    return enums
+
+
+def write_enum_class(enum_file: TextIOWrapper, enum: Type[Enum]):
+    enum_file.write(f"class {enum.__name__}(Enum):\n")
+    for enum_member in enum:
+        enum_file.write(f"    {enum_member.name} = '{enum_member.value}'\n")
+
+
+def write_enum_files(models: Dict[str, Type[BaseModel]], models_dir: str):
+    """Write enum files directly from the model's fields."""
+    for enum_name, enum in collect_enums(models).items():
+        enum_file = os.path.join(models_dir, f"{enum_name}.py")
+        os.makedirs(models_dir, exist_ok=True)
+        with open_output(enum_file) as ef:
+            ef.write("from enum import Enum\n\n\n")
+            write_enum_class(ef, enum)
 
 
 def sanitize_field_name(field_name: str) -> str:
@@ -608,52 +908,10 @@ def sanitize_field_name(field_name: str) -> str:
     return field_name
 
 
-def get_type_str(annotation: Any, models: Dict[str, Type[BaseModel]]) -> str:
-    """Convert the annotation to a valid Python type string for writing to a file, handling model references."""
-    if isinstance(annotation, ForwardRef):
-        # Handle ForwardRef directly by returning the forward-referenced name
-        return annotation.__forward_arg__
-
-    if isinstance(annotation, type):
-        # Handle basic types (e.g., int, str, float)
-        return annotation.__name__
-
-    elif hasattr(annotation, "__origin__"):
-        origin = annotation.__origin__
-        args = annotation.__args__
-
-        # Handle List (e.g., List[str], List[Casualty])
-        if origin is list or origin is List:
-            inner_type = get_type_str(args[0], models)
-            return f"List[{inner_type}]"
-
-        # Handle Dict (e.g., Dict[str, int])
-        elif origin is dict or origin is Dict:
-            key_type = get_type_str(args[0], models)
-            value_type = get_type_str(args[1], models)
-            return f"Dict[{key_type}, {value_type}]"
-
-        # Handle Optional and Union (e.g., Optional[int], Union[str, int])
-        elif origin is Union:
-            if len(args) == 2 and args[1] is type(None):
-                # It's an Optional type
-                return f"Optional[{get_type_str(args[0], models)}]"
-            else:
-                # General Union type
-                inner_types = ", ".join(get_type_str(arg, models) for arg in args)
-                return f"Union[{inner_types}]"
-
-    elif hasattr(annotation, "__name__") and annotation.__name__ in models:
-        # Handle references to other models (e.g., Casualty)
-        return annotation.__name__
-
-    return "Any"
-
-
 def create_mermaid_class_diagram(
     dependency_graph: Dict[str, Set[str]], sort_order: List[str], output_file: str
 ):
-    with open(output_file, "w") as f:
+    with open_output(output_file) as f:
         f.write("classDiagram\n")
         for model in sort_order:
             if model in dependency_graph:
@@ -766,42 +1024,39 @@ def handle_dependencies(models: Dict[str, Type[BaseModel]]):
 
 
 def topological_sort(graph: Dict[str, Set[str]]) -> List[str]:
-    # Exclude Python built-in types from the graph
+    # Kahn's algorithm, always taking the smallest ready model name so the
+    # order is deterministic; a heap keeps that O((V + E) log V)
     built_in_types = get_builtin_types()
-    sorted_graph = sorted(graph)
 
     # Filter out built-in types from the graph
-    in_degree = {model: 0 for model in sorted_graph if model not in built_in_types}
+    in_degree = {model: 0 for model in graph if model not in built_in_types}
 
-    for model in sorted_graph:
+    for model, deps in graph.items():
         if model in built_in_types:
             continue  # Skip built-in types
 
-        for dep in sorted(graph[model]):
+        for dep in deps:
             if dep not in built_in_types:
-                if dep not in in_degree:
-                    in_degree[dep] = 0
-                in_degree[dep] += 1
+                in_degree[dep] = in_degree.get(dep, 0) + 1
 
-    # Initialize the queue with nodes that have an in-degree of 0
-    queue = sorted([model for model in in_degree if in_degree[model] == 0])
+    # Initialize the heap with nodes that have an in-degree of 0
+    ready = [model for model, degree in in_degree.items() if degree == 0]
+    heapq.heapify(ready)
     sorted_models = []
 
-    while queue:
-        model = queue.pop(
-            0
-        )  # Use pop(0) instead of popleft() for deterministic behavior
+    while ready:
+        model = heapq.heappop(ready)
         sorted_models.append(model)
-        for dep in sorted(graph[model]):
+        for dep in graph.get(model, ()):
             if dep in built_in_types:
                 continue  # Skip built-in types
             in_degree[dep] -= 1
             if in_degree[dep] == 0:
-                queue.append(dep)
-        queue.sort()  # Sort the queue after each iteration
+                heapq.heappush(ready, dep)
 
     if len(sorted_models) != len(in_degree):
-        missing_models = sorted(set(in_degree.keys()) - set(sorted_models))
+        placed = set(sorted_models)
+        missing_models = sorted(model for model in in_degree if model not in placed)
         logging.warning(
             f"Circular dependencies detected among models: {missing_models}"
         )
@@ -810,32 +1065,159 @@ def topological_sort(graph: Dict[str, Set[str]]) -> List[str]:
     return sorted_models
 
 
-def detect_circular_dependencies(graph: Dict[str, Set[str]]) -> Set[str]:
-    circular_models = set()
-    visited = set()
-    stack = set()
+def find_strongly_connected_components(graph: Dict[str, Set[str]]) -> List[List[str]]:
+    """Tarjan's algorithm, iterative so that deep schema graphs can't hit the recursion limit.
 
-    # Use a copy of the graph's keys to avoid modifying the dictionary during iteration
-    def visit(model: str):
-        if model in visited:
-            return
-        if model in stack:
-            circular_models.add(model)
-            return
-        stack.add(model)
-        for dep in graph.get(model, []):
-            visit(dep)
-        stack.remove(model)
-        visited.add(model)
+    Components are returned dependencies first, each sorted by model name.
+    """
+    index = {}
+    low_link = {}
+    stack = []
+    on_stack = set()
+    components = []
+
+    def push(model: str):
+        index[model] = low_link[model] = len(index)
+        stack.append(model)
+        on_stack.add(model)
+        work.append((model, iter(sorted(graph.get(model, ())))))
+
+    for root in sorted(graph):
+        if root in index:
+            continue
+        work = []
+        push(root)
+        while work:
+            model, deps = work[-1]
+            for dep in deps:
+                if dep not in index:
+                    push(dep)
+                    break
+                if dep in on_stack:
+                    low_link[model] = min(low_link[model], index[dep])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low_link[parent] = min(low_link[parent], low_link[model])
+                if low_link[model] == index[model]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == model:
+                            break
+                    components.append(sorted(component))
+    return components
+
+
+def order_component(component: List[str], graph: Dict[str, Set[str]]) -> List[str]:
+    """Order a cyclic component so that few references point backwards (Eades-Lin-Smyth).
+
+    Models that reference nothing left in the component go last and models
+    nothing left references go first; otherwise the model with the most
+    outgoing over incoming references is placed next. Ties go to the smallest
+    name.
+    """
+    remaining = set(component)
+    deps = {model: (set(graph.get(model, ())) & remaining) - {model} for model in component}
+    dependents = {model: set() for model in component}
+    for model in component:
+        for dep in deps[model]:
+            dependents[dep].add(model)
+
+    sinks = [model for model in component if not deps[model]]
+    sources = [model for model in component if not dependents[model]]
+    # (incoming - outgoing, model); entries go stale as models are removed
+    by_delta = [(len(dependents[model]) - len(deps[model]), model) for model in component]
+    for queue in (sinks, sources, by_delta):
+        heapq.heapify(queue)
+
+    def next_model() -> Tuple[str, List[str]]:
+        # a sink or source stays one as models are removed, so only removed entries are stale
+        while sinks:
+            model = heapq.heappop(sinks)
+            if model in remaining:
+                return model, tail
+        while sources:
+            model = heapq.heappop(sources)
+            if model in remaining:
+                return model, head
+        while True:
+            delta, model = heapq.heappop(by_delta)
+            if model in remaining and delta == len(dependents[model]) - len(deps[model]):
+                return model, head
+
+    head, tail = [], []
+    while remaining:
+        model, placed = next_model()
+        placed.append(model)
+        remaining.discard(model)
+        for dep in deps.pop(model):
+            dependents[dep].discard(model)
+            if not dependents[dep]:
+                heapq.heappush(sources, dep)
+            heapq.heappush(by_delta, (len(dependents[dep]) - len(deps[dep]), dep))
+        for dependent in dependents.pop(model):
+            deps[dependent].discard(model)
+            if not deps[dependent]:
+                heapq.heappush(sinks, dependent)
+            heapq.heappush(by_delta, (len(dependents[dependent]) - len(deps[dependent]), dependent))
+    return head + tail[::-1]
+
+
+def detect_circular_dependencies(graph: Dict[str, Set[str]]) -> Dict[str, Set[str]]:
+    """Pick the references to defer so that the remaining dependency graph has no cycles.
+
+    Returns, per model, the dependencies it references as a ForwardRef and
+    imports after its class definition. The set is minimal: restoring any one
+    of these references would close a cycle again. Self-references are always
+    deferred.
+    """
+    circular_models = defaultdict(set)
+    for component in find_strongly_connected_components(graph):
+        members = set(component)
+        if len(component) == 1:
+            model = component[0]
+            if model in graph.get(model, ()):
+                circular_models[model].add(model)
+            continue
+
+        position = {model: i for i, model in enumerate(order_component(component, graph))}
+        kept = {model: set() for model in component}
+        deferred = []
+        for model in component:
+            for dep in sorted(graph.get(model, ())):
+                if dep == model:
+                    circular_models[model].add(model)
+                elif dep not in members:
+                    continue
+                elif position[dep] > position[model]:
+                    kept[model].add(dep)
+                else:
+                    deferred.append((model, dep))
+
+        # keep a deferred reference after all if no path leads back from it
+        for model, dep in deferred:
+            reachable = {dep}
+            pending = [dep]
+            while pending and model not in reachable:
+                for next_dep in kept[pending.pop()] - reachable:
+                    reachable.add(next_dep)
+                    pending.append(next_dep)
+            if model in reachable:
+                circular_models[model].add(dep)
+            else:
+                kept[model].add(dep)
 
-    # Iterate over a copy of the graph's keys
-    for model in list(graph.keys()):
-        visit(model)
+    for model, deps in circular_models.items():
+        logging.info(f"Deferring circular references from {model} to {sorted(deps)}")
+    return dict(circular_models)
 
-    return circular_models
 
 def replace_circular_references(annotation: Any, circular_models: Set[str]) -> Any:
-    """Recursively replace circular model references in annotations with ForwardRef."""
+    """Recursively replace references to the given models in annotations with ForwardRef."""
     origin = get_origin(annotation)
     args = get_args(annotation)
 
@@ -850,14 +1232,16 @@ def replace_circular_references(annotation: Any, circular_models: Set[str]) -> A
     return origin[new_args] if origin else annotation
 
 def break_circular_dependencies(
-    models: Dict[str, Type[BaseModel]], circular_models: Set[str]
+    models: Dict[str, Type[BaseModel]], circular_models: Dict[str, Set[str]]
 ):
-    """Replace circular references in models with ForwardRef."""
-    for model_name in circular_models:
-        model = models[model_name]
+    """Replace the deferred references in models with ForwardRef."""
+    for model_name, deferred_refs in circular_models.items():
+        model = models.get(model_name)
+        if not hasattr(model, "model_fields"):
+            continue
         for field_name, field in model.model_fields.items():
             # Modify field.annotation directly
-            field.annotation = replace_circular_references(field.annotation, circular_models)
+            field.annotation = replace_circular_references(field.annotation, deferred_refs)
 
 # def break_circular_dependencies(
 #     models: Dict[str, Type[BaseModel]], circular_models: Set[str]
@@ -887,12 +1271,26 @@ def break_circular_dependencies(
 
 
 # Load OpenAPI specs
-def load_specs(folder_path: str) -> List[Dict[str, Any]]:
-    return [
-        json.load(open(os.path.join(folder_path, f)))
+def map_jobs(function: Callable, *iterables: Iterable, jobs: int = 1) -> List[Any]:
+    """`map` across a pool of `jobs` processes; results keep the order of the inputs."""
+    if jobs <= 1:
+        return list(map(function, *iterables))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(function, *iterables))
+
+
+def load_spec(spec_file: str) -> Dict[str, Any]:
+    with open(spec_file) as f:
+        return json.load(f)
+
+
+def load_specs(folder_path: str, jobs: int = 1) -> List[Dict[str, Any]]:
+    spec_files = [
+        os.path.join(folder_path, f)
         for f in os.listdir(folder_path)
         if f.endswith(".json")
     ]
+    return map_jobs(load_spec, spec_files, jobs=jobs)
 
 
 def get_api_name(spec: Dict[str, Any]) -> str:
@@ -922,60 +1320,49 @@ def combine_components_and_paths(
     return combined_components, combined_paths
 
 
-def are_models_equal(model1: Type[BaseModel], model2: Type[BaseModel]) -> bool:
-    """Check if two Pydantic models are equal based on their fields and types."""
-    fields1 = {
-        name: str(field.annotation) for name, field in model1.model_fields.items()
-    }
-    fields2 = {
-        name: str(field.annotation) for name, field in model2.model_fields.items()
-    }
-    return fields1 == fields2
+def get_model_fingerprint(model: Any) -> Hashable | None:
+    """Return a hashable key that two models share exactly when they are duplicates.
+
+    Pydantic models are keyed on their field names and annotations, and List
+    models on their inner type. Other models (e.g. Dict) are never deduplicated.
+    """
+    if isinstance(model, type):
+        return (
+            "model",
+            frozenset(
+                (name, str(field.annotation)) for name, field in model.model_fields.items()
+            ),
+        )
+    if get_origin(model) in {list, List}:
+        return ("list", get_args(model)[0])
+    return None
 
 
 def deduplicate_models(
     models: Dict[str, Union[Type[BaseModel], Type[List]]],
 ) -> Dict[str, Union[Type[BaseModel], Type[List]]]:
-    """Deduplicate models by removing models with the same content."""
+    """Deduplicate models by removing models with the same content.
+
+    Each model's fingerprint is computed once and looked up in a dict, so the
+    first model with a given structure is kept and later ones map onto it.
+    """
     deduplicated_models = {}
     reference_map = {}
+    kept_by_fingerprint = {}
 
-    # Compare models to detect duplicates
     for model_name, model in models.items():
-        found_duplicate = False
-
-        # Compare with already deduplicated models
-        for dedup_model_name, dedup_model in deduplicated_models.items():
-            if isinstance(model, type) and isinstance(dedup_model, type):
-                # Compare Pydantic models
-                if are_models_equal(model, dedup_model):
-                    reference_map[model_name] = dedup_model_name
-                    found_duplicate = True
-                    logging.info(
-                        f"Model '{model_name}' is a duplicate of '{dedup_model_name}'"
-                    )
-                    break
-
-            # Handle List models separately by comparing their inner types
-            model_origin = get_origin(model)
-            dedup_model_origin = get_origin(dedup_model)
-
-            if model_origin in {list, List} and dedup_model_origin in {list, List}:
-                model_inner_type = get_args(model)[0]
-                dedup_inner_type = get_args(dedup_model)[0]
-
-                # If the inner types of the lists are the same, consider them duplicates
-                if model_inner_type == dedup_inner_type:
-                    reference_map[model_name] = dedup_model_name
-                    found_duplicate = True
-                    logging.info(
-                        f"Model '{model_name}' is a duplicate of '{dedup_model_name}'"
-                    )
-                    break
+        fingerprint = get_model_fingerprint(model)
+        dedup_model_name = (
+            kept_by_fingerprint.get(fingerprint) if fingerprint is not None else None
+        )
+        if dedup_model_name is not None:
+            reference_map[model_name] = dedup_model_name
+            logging.info(f"Model '{model_name}' is a duplicate of '{dedup_model_name}'")
+            continue
 
-        # If no duplicate found, keep the model
-        if not found_duplicate:
-            deduplicated_models[model_name] = model
+        deduplicated_models[model_name] = model
+        if fingerprint is not None:
+            kept_by_fingerprint[fingerprint] = model_name
 
     # Return the deduplicated models and reference map
     return deduplicated_models, reference_map
@@ -1060,7 +1447,7 @@ def create_config(spec: Dict[str, Any], output_path: str, base_url: str) -> None
     config_file_path = os.path.join(output_path, f"{class_name}_config.py")
     os.makedirs(os.path.dirname(config_file_path), exist_ok=True)
 
-    with open(config_file_path, "w") as config_file:
+    with open_output(config_file_path) as config_file:
         config_file.writelines(config_lines)
 
     logging.info(f"Config file generated at: {config_file_path}")
@@ -1076,16 +1463,18 @@ def classify_parameters(
 
 
 def create_class(spec: Dict[str, Any], output_path: str) -> None:
+    """Create the sync and async client classes for a spec in a single module."""
     paths = spec.get("paths", {})
     class_name = f"{sanitize_name(get_api_name(spec))}Client"
 
     class_lines = []
-    class_lines.append(f"from .{class_name}_config import endpoints, base_url\n")
-    class_lines.append("from ..core import ApiError, ResponseModel, Client\n")
+    class_lines.append(f"from .{class_name}_config import endpoints\n")
     path_lines = [f"class {class_name}(Client):\n"]
+    async_path_lines = [f"\nclass Async{class_name}(AsyncClient):\n"]
 
     all_types = set()
     all_package_models = set()
+    core_imports = ["ApiError", "ResponseModel", "Client", "AsyncClient"]
     api_path = "/" + spec.get("servers", [{}])[0].get("url", "").split("/", 3)[3]
 
     for path, methods in paths.items():
@@ -1097,61 +1486,46 @@ def create_class(spec: Dict[str, Any], output_path: str) -> None:
                 all_types.update(
                     [map_openapi_type(param["schema"]["type"]) for param in parameters]
                 )
-
-                param_str = create_function_parameters(parameters)
                 response_content = details["responses"].get("200", {})
-
                 model_name = get_model_name_from_path(response_content)
                 all_package_models.add(model_name)
 
-                # Sanitize the operation_id to ensure it's a valid Python identifier
-                sanitized_operation_id = sanitize_name(operation_id, prefix="Query")
-                path_lines.append(
-                    f"    def {sanitized_operation_id}(self, {param_str}) -> ResponseModel[{model_name}] | ApiError:\n"
+                path_lines.extend(
+                    create_method_lines(operation_id, details, full_path, model_name)
                 )
-
-                docstring = f"{details.get("description", "No description in the OpenAPI spec.")}\n"
-                docstring = docstring + f"\n  Query path: `{full_path}`\n"
-                docstring = docstring + f"\n  `ResponseModel.content` contains `models.{model_name}` type.\n"
-                if parameters:
-                    docstring_parameters = "\n".join(
-                        [
-                            f"    `{sanitize_field_name(param['name'])}`: {map_openapi_type(param['schema']['type']).__name__} - {param.get('description', '')}. {f"Example: `{param.get('example', '')}`" if param.get('example') else ""}"
-                            for param in parameters
-                        ]
+                async_path_lines.extend(
+                    create_method_lines(
+                        operation_id, details, full_path, model_name, is_async=True
                     )
-                else:
-                    docstring_parameters = "        No parameters required."
-                path_lines.append(
-                    f"        '''\n        {docstring}\n\n  Parameters:\n{docstring_parameters}\n        '''\n"
                 )
 
-                path_params, query_params = classify_parameters(parameters)
-
-                formatted_path_params = ", ".join(
-                    [sanitize_field_name(param) for param in path_params]
-                )
-                formatted_query_params = ", ".join(
-                    [
-                        f"'{param}': {sanitize_field_name(param)}"
-                        for param in query_params
-                    ]
-                )
-
-                if formatted_query_params:
-                    query_params_dict = f"endpoint_args={{ {formatted_query_params} }}"
-                else:
-                    query_params_dict = "endpoint_args=None"
+                if model_name.endswith("Array"):
+                    path_lines.extend(
+                        create_stream_method_lines(operation_id, details, model_name)
+                    )
+                    async_path_lines.extend(
+                        create_stream_method_lines(
+                            operation_id, details, model_name, is_async=True
+                        )
+                    )
 
-                if path_params:
-                    path_lines.append(
-                        f"        return self._send_request_and_deserialize(base_url, endpoints['{operation_id}'], params=[{formatted_path_params}], {query_params_dict})\n\n"
+                batch_parameter = get_batch_parameter(parameters, model_name)
+                if batch_parameter:
+                    all_types.add(List)
+                    if "BatchResponseModel" not in core_imports:
+                        core_imports.append("BatchResponseModel")
+                    path_lines.extend(
+                        create_batch_method_lines(
+                            operation_id, details, model_name, *batch_parameter
+                        )
                     )
-                else:
-                    path_lines.append(
-                        f"        return self._send_request_and_deserialize(base_url, endpoints['{operation_id}'], {query_params_dict})\n\n"
+                    async_path_lines.extend(
+                        create_batch_method_lines(
+                            operation_id, details, model_name, *batch_parameter, is_async=True
+                        )
                     )
 
+    class_lines.append(f"from ..core import {', '.join(core_imports)}\n")
     valid_type_imports = all_types - get_builtin_types()
     valid_type_import_strings = sorted([t.__name__ for t in valid_type_imports])
     if valid_type_import_strings:
@@ -1165,13 +1539,200 @@ def create_class(spec: Dict[str, Any], output_path: str) -> None:
     class_lines.append("\n")
     class_file_path = os.path.join(output_path, f"{class_name}.py")
     os.makedirs(os.path.dirname(class_file_path), exist_ok=True)
-    with open(class_file_path, "w") as class_file:
+    with open_output(class_file_path) as class_file:
         class_file.writelines(class_lines)
         class_file.writelines(path_lines)
+        class_file.writelines(async_path_lines)
 
     logging.info(f"Class file generated at: {class_file_path}")
 
 
+def create_method_lines(
+    operation_id: str,
+    details: Dict[str, Any],
+    full_path: str,
+    model_name: str,
+    is_async: bool = False,
+) -> List[str]:
+    """Create the source lines for one endpoint method of a sync or async client class."""
+    parameters = details.get("parameters", [])
+    param_str = ", ".join(
+        filter(None, [create_function_parameters(parameters), "raw: bool | None = None", "fields: tuple[str, ...] | None = None"])
+    )
+
+    # Sanitize the operation_id to ensure it's a valid Python identifier
+    sanitized_operation_id = sanitize_name(operation_id, prefix="Query")
+    def_keyword = "async def" if is_async else "def"
+    await_keyword = "await " if is_async else ""
+    method_lines = [
+        f"    {def_keyword} {sanitized_operation_id}(self, {param_str}) -> ResponseModel[{model_name}] | ApiError:\n"
+    ]
+
+    docstring = f"{details.get("description", "No description in the OpenAPI spec.")}\n"
+    docstring = docstring + f"\n  Query path: `{full_path}`\n"
+    docstring = docstring + f"\n  `ResponseModel.content` contains `models.{model_name}` type.\n"
+    docstring_parameters = "\n".join(
+        [
+            f"    `{sanitize_field_name(param['name'])}`: {map_openapi_type(param['schema']['type']).__name__} - {param.get('description', '')}. {f"Example: `{param.get('example', '')}`" if param.get('example') else ""}"
+            for param in parameters
+        ]
+        + ["    `raw`: bool - return the response body as `bytes` without validating it. Defaults to the client's `raw` setting.",
+           "    `fields`: tuple[str, ...] - validate and keep only these fields of the model (or of its items, for arrays)."]
+    )
+    method_lines.append(
+        f"        '''\n        {docstring}\n\n  Parameters:\n{docstring_parameters}\n        '''\n"
+    )
+
+    path_params, query_params = classify_parameters(parameters)
+
+    formatted_path_params = ", ".join(
+        [sanitize_field_name(param) for param in path_params]
+    )
+    formatted_query_params = ", ".join(
+        [
+            f"'{param}': {sanitize_field_name(param)}"
+            for param in query_params
+        ]
+    )
+
+    if formatted_query_params:
+        query_params_dict = f"endpoint_args={{ {formatted_query_params} }}"
+    else:
+        query_params_dict = "endpoint_args=None"
+
+    if path_params:
+        method_lines.append(
+            f"        return {await_keyword}self._send_request_and_deserialize(endpoints['{operation_id}'], params=[{formatted_path_params}], {query_params_dict}, raw=raw, fields=fields)\n\n"
+        )
+    else:
+        method_lines.append(
+            f"        return {await_keyword}self._send_request_and_deserialize(endpoints['{operation_id}'], {query_params_dict}, raw=raw, fields=fields)\n\n"
+        )
+    return method_lines
+
+
+def get_batch_parameter(
+    parameters: List[Dict[str, Any]], model_name: str
+) -> Tuple[str, int] | None:
+    """Find a comma-separated path parameter with a documented cap, e.g. 'Max. approx. 20 ids'.
+
+    Only array responses are batched, because their chunks can be merged into one result.
+    """
+    if not model_name.endswith("Array"):
+        return None
+    for param in parameters:
+        if param["in"] != "path":
+            continue
+        match = re.search(
+            r"comma-?\s?sep[ae]rated.*?Max\.? approx\.? (\d+)",
+            param.get("description", ""),
+            re.IGNORECASE | re.DOTALL,
+        )
+        if match:
+            return param["name"], int(match.group(1))
+    return None
+
+
+def create_batch_method_lines(
+    operation_id: str,
+    details: Dict[str, Any],
+    model_name: str,
+    batch_param: str,
+    chunk_size: int,
+    is_async: bool = False,
+) -> List[str]:
+    """Create a `<Method>Batch` variant that takes a list of ids and fans it out in chunks."""
+    parameters = details.get("parameters", [])
+    other_parameters = [param for param in parameters if param["name"] != batch_param]
+    batch_param_name = sanitize_field_name(batch_param)
+    param_str = ", ".join(
+        filter(
+            None,
+            [
+                f"{batch_param_name}: List[str]",
+                create_function_parameters(other_parameters),
+                f"chunk_size: int = {chunk_size}",
+            ],
+        )
+    )
+
+    sanitized_operation_id = sanitize_name(operation_id, prefix="Query")
+    def_keyword = "async def" if is_async else "def"
+    await_keyword = "await " if is_async else ""
+    method_lines = [
+        f"    {def_keyword} {sanitized_operation_id}Batch(self, {param_str}) -> BatchResponseModel[{model_name}]:\n"
+    ]
+    method_lines.append(
+        f"        '''\n        Batch variant of `{sanitized_operation_id}`: splits `{batch_param_name}` into chunks of at most `chunk_size` ids,\n"
+        f"        requests the chunks concurrently and merges them into one `models.{model_name}`.\n"
+        f"        Chunks that fail are reported in `BatchResponseModel.errors`.\n        '''\n"
+    )
+
+    path_params, query_params = classify_parameters(parameters)
+    formatted_path_params = ", ".join(
+        [sanitize_field_name(param) for param in path_params]
+    )
+    formatted_query_params = ", ".join(
+        [f"'{param}': {sanitize_field_name(param)}" for param in query_params]
+    )
+    if formatted_query_params:
+        query_params_dict = f"endpoint_args={{ {formatted_query_params} }}"
+    else:
+        query_params_dict = "endpoint_args=None"
+
+    method_lines.append(
+        f"        return {await_keyword}self._send_batched_request_and_deserialize(endpoints['{operation_id}'], {batch_param_name}, chunk_size, params=[{formatted_path_params}], ids_index={path_params.index(batch_param)}, {query_params_dict})\n\n"
+    )
+    return method_lines
+
+
+def create_stream_method_lines(
+    operation_id: str,
+    details: Dict[str, Any],
+    model_name: str,
+    is_async: bool = False,
+) -> List[str]:
+    """Create a `<Method>Stream` variant that yields array items as they are parsed."""
+    parameters = details.get("parameters", [])
+    param_str = ", ".join(
+        filter(None, [create_function_parameters(parameters), "fields: tuple[str, ...] | None = None"])
+    )
+
+    sanitized_operation_id = sanitize_name(operation_id, prefix="Query")
+    def_keyword = "async def" if is_async else "def"
+    await_keyword = "await " if is_async else ""
+    iterator_kind = "an async iterator" if is_async else "an iterator"
+    method_lines = [
+        f"    {def_keyword} {sanitized_operation_id}Stream(self, {param_str}) -> ResponseModel | ApiError:\n"
+    ]
+    method_lines.append(
+        f"        '''\n        Streaming variant of `{sanitized_operation_id}`: `ResponseModel.content` is {iterator_kind} over the items\n"
+        f"        of `models.{model_name}`, each validated as soon as it has been received. Responses are not cached.\n        '''\n"
+    )
+
+    path_params, query_params = classify_parameters(parameters)
+    formatted_path_params = ", ".join(
+        [sanitize_field_name(param) for param in path_params]
+    )
+    formatted_query_params = ", ".join(
+        [f"'{param}': {sanitize_field_name(param)}" for param in query_params]
+    )
+    if formatted_query_params:
+        query_params_dict = f"endpoint_args={{ {formatted_query_params} }}"
+    else:
+        query_params_dict = "endpoint_args=None"
+
+    if path_params:
+        method_lines.append(
+            f"        return {await_keyword}self._stream_request_and_deserialize(endpoints['{operation_id}'], params=[{formatted_path_params}], {query_params_dict}, fields=fields)\n\n"
+        )
+    else:
+        method_lines.append(
+            f"        return {await_keyword}self._stream_request_and_deserialize(endpoints['{operation_id}'], {query_params_dict}, fields=fields)\n\n"
+        )
+    return method_lines
+
+
 def get_model_name_from_path(
     response_content: Dict[str, Any], only_arrays: bool = False
 ) -> str:
@@ -1222,49 +1783,63 @@ def create_function_parameters(parameters: List[Dict[str, Any]]) -> str:
     return param_str
 
 
-def save_classes(specs: List[Dict[str, Any]], base_path: str, base_url: str) -> None:
-    """Create config and class files for each spec in the specs list."""
+def save_classes(
+    specs: List[Dict[str, Any]], base_path: str, base_url: str, jobs: int = 1
+) -> None:
+    """Create config and class files for each spec in the specs list, across `jobs` processes."""
 
-    class_names = [f"{sanitize_name(get_api_name(spec))}Client" for spec in specs]
+    sync_class_names = [f"{sanitize_name(get_api_name(spec))}Client" for spec in specs]
+    class_names = sync_class_names + [f"Async{name}" for name in sync_class_names]
     init_file_path = os.path.join(base_path, "__init__.py")
-    with open(init_file_path, "w") as init_file:
-        # init_file.write(f"# {init_file_path}\n")
-        init_file.write(
-            f"from .endpoints import (\n    {',\n    '.join(class_names)}\n)\n"
+    with open_output(init_file_path) as init_file:
+        write_lazy_init(
+            init_file,
+            {
+                **{name: (".endpoints", name) for name in class_names},
+                "models": (".models", None),
+            },
+            ".lazy",
         )
-        # init_file.write("\n".join([f"from .endpoints.{name} import {name}" for name in class_names]))
-        # init_file.write("from ..core import Client\n")
-        # init_file.write("from ..core import RestClient\n")
-        init_file.write("from . import models\n")
-        # init_file.write("from .models import ApiError, GenericResponseModel, ResponseModel\n")
-        # other_classes = ["Client", "RestClient", "ApiError", "GenericResponseModel", "ResponseModel"]
-        init_file.write("__all__ = [\n")
-        init_file.write(",\n".join([f"    '{name}'" for name in class_names]))
-        # init_file.write(",\n".join([f"    '{name}'" for name in other_classes]))
-        init_file.write(",\n    'models'\n]\n")
 
     endpoint_path = os.path.join(base_path, "endpoints")
     os.makedirs(endpoint_path, exist_ok=True)
     endpoint_init_file = os.path.join(endpoint_path, "__init__.py")
-    with open(endpoint_init_file, "w") as endpoint_init:
-        # endpoint_init.write(f"# {endpoint_init_file}\n")
-        endpoint_init.write(
-            "\n".join([f"from .{name} import {name}" for name in class_names])
+    with open_output(endpoint_init_file) as endpoint_init:
+        write_lazy_init(
+            endpoint_init,
+            {
+                name: (f".{name.removeprefix('Async')}", name)
+                for name in class_names
+            },
+            "..lazy",
         )
-        endpoint_init.write("\n__all__ = [\n")
-        endpoint_init.write(",\n".join([f"    '{name}'" for name in class_names]))
-        endpoint_init.write("\n]\n")
 
-    for spec in specs:
-        api_name = get_api_name(spec)
-        logging.info(f"Creating config and class files for {api_name}...")
-
-        create_config(spec, endpoint_path, base_url)
-        create_class(spec, endpoint_path)
+    # merge in spec order so the manifest doesn't depend on which worker finished first
+    for api_files in map_jobs(save_api_classes, specs, repeat(endpoint_path), repeat(base_url), jobs=jobs):
+        emitted_files.update(api_files)
 
     logging.info("All classes and configs saved.")
 
 
+def save_api_classes(spec: Dict[str, Any], endpoint_path: str, base_url: str) -> Dict[str, str]:
+    """Create the config and class files of one spec.
+
+    Returns the `emitted_files` entries it added, since a worker process
+    can't update the parent's.
+    """
+    api_name = get_api_name(spec)
+    logging.info(f"Creating config and class files for {api_name}...")
+
+    already_emitted = dict(emitted_files)
+    create_config(spec, endpoint_path, base_url)
+    create_class(spec, endpoint_path)
+    return {
+        path: file_hash
+        for path, file_hash in emitted_files.items()
+        if already_emitted.get(path) != file_hash
+    }
+
+
 def map_deduplicated_name(type_name: str, reference_map: Dict[str, str]) -> str:
     if type_name in reference_map:
         return reference_map[type_name]
@@ -1325,10 +1900,27 @@ def update_specs_with_model_changes(
 
 
 # Main function
-def main(spec_path: str, output_path: str):
+def main(
+    spec_path: str,
+    output_path: str,
+    records: bool = False,
+    bundle_models: bool = False,
+    defer_build: bool = False,
+    force: bool = False,
+    jobs: int = 1,
+):
     os.makedirs(output_path, exist_ok=True)
+    inputs = get_input_hashes(
+        spec_path, {"records": records, "bundle_models": bundle_models, "defer_build": defer_build}
+    )
+    manifest = load_manifest(output_path)
+    if not force and is_output_current(manifest, output_path, inputs):
+        logging.info("Specs, generator and options are unchanged; output is up to date.")
+        return
+    emitted_files.clear()
+
     logging.info("Loading OpenAPI specs...")
-    specs = load_specs(spec_path)
+    specs = load_specs(spec_path, jobs)
 
     logging.info("Generating components...")
     pydantic_names = {}
@@ -1362,8 +1954,18 @@ def main(spec_path: str, output_path: str):
     dependency_graph, circular_models, sorted_models = handle_dependencies(models)
 
     # Now save the deduplicated models
-    logging.info("Saving models to files...")
-    save_models(models, output_path, dependency_graph, circular_models)
+    if bundle_models:
+        logging.info("Saving models to a single module...")
+        save_models_bundle(
+            models, output_path, dependency_graph, circular_models, sorted_models, defer_build
+        )
+    else:
+        logging.info("Saving models to files...")
+        save_models(models, output_path, dependency_graph, circular_models, defer_build)
+
+    if records:
+        logging.info("Saving record classes...")
+        save_records(models, output_path, bundled=bundle_models)
 
     # Create config and class
     logging.info("Creating config and class files...")
@@ -1373,13 +1975,15 @@ def main(spec_path: str, output_path: str):
         specs, combined_components, reference_map
     )
 
-    save_classes(updated_specs, output_path, base_url)
+    save_classes(updated_specs, output_path, base_url, jobs)
 
     logging.info("Creating Mermaid class diagram...")
     create_mermaid_class_diagram(
         dependency_graph, sorted_models, os.path.join(output_path, "class_diagram.mmd")
     )
 
+    save_manifest(manifest, output_path, inputs)
+
     logging.info("Processing complete.")
 
 
@@ -1389,7 +1993,41 @@ if __name__ == "__main__":
     )
     parser.add_argument("specpath", help="Path to the OpenAPI specification file")
     parser.add_argument("output", help="Path to the output file")
+    parser.add_argument(
+        "--records",
+        action="store_true",
+        help="Also emit records.py with compact __slots__ dataclasses for every model",
+    )
+    parser.add_argument(
+        "--bundle-models",
+        action="store_true",
+        help="Emit all models into a single models/__init__.py instead of one module per model",
+    )
+    parser.add_argument(
+        "--defer-build",
+        action="store_true",
+        help="Defer building each model's validator until it is first used",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate even if the specs, generator and options are unchanged",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes used to parse the specs and write the API clients",
+    )
 
     args = parser.parse_args()
 
-    main(args.specpath, args.output)
+    main(
+        args.specpath,
+        args.output,
+        records=args.records,
+        bundle_models=args.bundle_models,
+        defer_build=args.defer_build,
+        force=args.force,
+        jobs=args.jobs,
+    )
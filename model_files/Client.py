@@ -1,34 +1,72 @@
-from .rest_client import RestClient
+from .rest_client import RestClient, AsyncRestClient
 from importlib import import_module
-from typing import Any, Literal, List, Optional, Tuple
+from typing import Any, AsyncIterator, Iterable, Iterator, Literal, List, Optional, Tuple, get_args
 from requests import Response
-import pkgutil
 from pydantic import BaseModel
-from . import models
-from datetime import datetime, timedelta
+from .models.model_registry import model_registry
+from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
-from .package_models import ResponseModel, ApiError
+from .package_models import ResponseModel, ApiError, BatchResponseModel
+from .response_cache import ResponseCache, SharedResponseCache, SharedCacheEntry
+from .singleflight import SingleFlight, AsyncSingleFlight
+from .json_stream import iter_array_items, aiter_array_items
+from .projection import projection_name, parse_projection_name, project_model
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 class Client:
     """Client
 
     :param str api_token: API token to access TfL unified API
+    :param RestClient rest_client: Optional shared RestClient. Pass the same
+        instance to several endpoint clients so they share one connection pool.
+    :param ResponseCache cache: Optional in-memory cache for responses that
+        carry a ``max-age``
+    :param SharedResponseCache shared_cache: Optional on-disk cache shared
+        between processes for responses that carry an ``s-maxage``
+    :param bool raw: Return the undecoded response body as ``bytes`` in
+        ``ResponseModel.content`` instead of validating it. Endpoint methods
+        can override this per call with ``raw=``.
+
+    Endpoint methods also accept ``fields=("naptanId", "timeToStation")`` to
+    validate and keep only those fields. The slimmed model is built once per
+    projection and cached alongside the generated models.
     """
 
-    def __init__(self, api_token: str = None):
-        self.client = RestClient(api_token)
-        self.models = self._load_models()
-
-    def _load_models(self):
-        models_dict = {}
-        for importer, modname, ispkg in pkgutil.iter_modules(models.__path__):
-            module = import_module(f".models.{modname}", __package__)
-            for model_name in dir(module):
-                attr = getattr(module, model_name)
-                if isinstance(attr, type) and issubclass(attr, BaseModel):
-                    models_dict[model_name] = attr
-        # print(models_dict)
-        return models_dict
+    # model classes resolved from model_registry on first use, shared by every
+    # Client subclass and instance in the process
+    _resolved_models: dict[str, type[BaseModel]] = {}
+
+    # concurrent identical requests from Clients on the same transport share one round-trip
+    _singleflight = SingleFlight()
+
+    # upper bound on the chunks of a batched request that are in flight at once
+    max_batch_workers = 8
+
+    def __init__(self, api_token: str = None, rest_client: RestClient = None,
+                 cache: ResponseCache = None, shared_cache: SharedResponseCache = None, raw: bool = False):
+        self.client = rest_client if rest_client is not None else RestClient(api_token)
+        self.cache = cache
+        self.shared_cache = shared_cache
+        self.raw = raw
+
+    @staticmethod
+    def _resolve_model(model_name: str) -> type[BaseModel] | None:
+        base_name, fields = parse_projection_name(model_name)
+        if fields:
+            Model = Client._resolved_models.get(base_name) or Client._resolve_model(base_name)
+            if Model is None:
+                return None
+            Model = project_model(Model, fields)
+        else:
+            module_path = model_registry.get(model_name)
+            if module_path is None:
+                return None
+            module = import_module(module_path, f"{__package__}.models")
+            Model = getattr(module, model_name)
+        Client._resolved_models[model_name] = Model
+        return Model
 
     @staticmethod
     def _parse_int_or_none(value: str) -> int | None:
@@ -70,45 +108,222 @@ class Client:
 
         return s_maxage_expiry, maxage_expiry
 
-    def _deserialize(self, model_name: str, response: Response) -> Any:
+    def _deserialize(self, model_name: str, response: Response, raw: bool = False) -> Any:
         shared_expiry, result_expiry = self._get_result_expiry(response)
-        Model = self._get_model(model_name)
-        data = response.json()
+        Model = None if raw else self._get_model(model_name)
 
-        result = self._create_model_instance(
-            Model, data, result_expiry, shared_expiry)
+        result = self._create_model_instance_from_json(
+            Model, response.content, result_expiry, shared_expiry)
+        result.etag = response.headers.get("ETag")
+        result.last_modified = response.headers.get("Last-Modified")
 
         return result
 
-    def _get_model(self, model_name: str) -> BaseModel:
-        Model = self.models.get(model_name)
+    @staticmethod
+    def _get_model(model_name: str) -> BaseModel:
+        Model = Client._resolved_models.get(model_name) or Client._resolve_model(model_name)
         if Model is None:
             raise ValueError(f"No model found with name {model_name}")
         return Model
 
-    def _create_model_instance(
-        self, Model: BaseModel, response_json: Any, result_expiry: Optional[datetime], shared_expiry: Optional[datetime]
+    @staticmethod
+    def warm_up(models: Iterable[str | type[BaseModel]] = None) -> List[type[BaseModel]]:
+        """Import models and compile their validators now rather than on first use.
+
+        Models generated with ``--defer-build`` compile on their first
+        validation; long-running services can call this at boot with the
+        models they need so that the first requests don't pay for it.
+
+        :param models: Model names or classes; every registered model if omitted
+        """
+        warmed = []
+        for model in model_registry if models is None else models:
+            Model = Client._get_model(model) if isinstance(model, str) else model
+            Model.model_rebuild()
+            warmed.append(Model)
+        return warmed
+
+    def _create_model_instance_from_json(
+        self, Model: BaseModel, response_bytes: bytes, result_expiry: Optional[datetime], shared_expiry: Optional[datetime]
     ) -> ResponseModel:
-        content = Model(response_json)
-        return ResponseModel(content_expires=result_expiry, shared_expires=shared_expiry, content=content)  
+        # validate the raw body with pydantic-core's JSON parser rather than
+        # building an intermediate dict/list tree with response.json();
+        # without a model the body is passed through untouched
+        content = response_bytes if Model is None else Model.model_validate_json(response_bytes)
+        return ResponseModel(content_expires=result_expiry, shared_expires=shared_expiry, content=content)
 
     def _deserialize_error(self, response: Response) -> ApiError:
         # if content is json, deserialize it, otherwise manually create an ApiError object
         if response.headers.get("Content-Type") == "application/json":
-            return self._deserialize("ApiError", response)
+            return ApiError.model_validate_json(response.content)
         return ApiError(
             timestampUtc=parsedate_to_datetime(response.headers.get("Date")),
             exceptionType="Unknown",
             httpStatusCode=response.status_code,
-            httpStatus=response.reason,
-            relativeUri=response.url,
+            httpStatus=getattr(response, "reason", None) or getattr(response, "reason_phrase", ""),
+            relativeUri=str(response.url),
             message=response.text,
         )
 
     def _send_request_and_deserialize(
         self, endpoint_and_model: dict[str, str],
-        params: str | int | List[str | int] = None, endpoint_args: dict = None
+        params: str | int | List[str | int] = None, endpoint_args: dict = None, raw: bool = None,
+        fields: Tuple[str, ...] = None
+    ) -> BaseModel | List[BaseModel] | ApiError:
+        endpoint, model_name = self._resolve_endpoint(endpoint_and_model, params)
+        raw = self.raw if raw is None else raw
+        if fields and not raw:
+            # build the projection up front so that unknown fields fail before a round-trip
+            model_name = projection_name(model_name, fields)
+            self._get_model(model_name)
+        cache_key = ResponseCache.make_key(endpoint, endpoint_args, raw, fields)
+        cached = self._get_cached(cache_key, raw)
+        if cached is not None:
+            return cached
+
+        return self._singleflight.do(
+            self._singleflight_key(cache_key), lambda: self._fetch_and_deserialize(endpoint, model_name, cache_key, endpoint_args, raw))
+
+    def _singleflight_key(self, cache_key: str) -> Tuple[int, str]:
+        # clients on other transports (other app keys, hosts or sessions) must
+        # not receive each other's responses
+        return id(self.client), cache_key
+
+    def _fetch_and_deserialize(
+        self, endpoint: str, model_name: str, cache_key: str, endpoint_args: dict = None, raw: bool = False
     ) -> BaseModel | List[BaseModel] | ApiError:
+        # for keys the shared cache knows to be shareable, only the process
+        # holding the lease fetches; the others poll until its response lands
+        # in the shared cache. Other keys are fetched without a lease.
+        leased = self._needs_fetch_lease(cache_key)
+        while leased and not self.shared_cache.acquire(cache_key):
+            time.sleep(self.shared_cache.poll_interval)
+            cached = self._get_cached(cache_key, raw)
+            if cached is not None:
+                return cached
+
+        try:
+            response = self.client.send_request(endpoint, endpoint_args, self._get_validator_headers(cache_key))
+            if response.status_code == 304:
+                # the stale body is only parsed once the server has confirmed it is still current
+                stale = self._get_stale(cache_key, raw)
+                if stale is not None:
+                    return self._refresh_cached(cache_key, stale, response)
+                # the stale entry was evicted while the request was in flight, so fetch the body itself
+                response = self.client.send_request(endpoint, endpoint_args)
+            return self._cache_result(cache_key, model_name, self._handle_response(model_name, response, raw), response)
+        finally:
+            if leased:
+                self.shared_cache.release(cache_key)
+
+    def _stream_request_and_deserialize(
+        self, endpoint_and_model: dict[str, str],
+        params: str | int | List[str | int] = None, endpoint_args: dict = None, fields: Tuple[str, ...] = None
+    ) -> ResponseModel | ApiError:
+        endpoint, model_name = self._resolve_endpoint(endpoint_and_model, params)
+        ItemModel = self._get_item_model(projection_name(model_name, fields))
+
+        response = self.client.send_request(endpoint, endpoint_args, stream=True)
+
+        if response.status_code != 200:
+            return self._deserialize_error(response)
+        shared_expiry, result_expiry = self._get_result_expiry(response)
+        return ResponseModel(
+            content_expires=result_expiry, shared_expires=shared_expiry,
+            content=self._iter_items(ItemModel, response),
+        )
+
+    @staticmethod
+    def _iter_items(ItemModel: type[BaseModel], response: Response) -> Iterator[BaseModel]:
+        # validate each array element as soon as its bytes have arrived
+        try:
+            for item in iter_array_items(response.iter_content(chunk_size=64 * 1024)):
+                yield ItemModel.model_validate_json(item)
+        finally:
+            response.close()
+
+    def _get_item_model(self, model_name: str) -> type[BaseModel]:
+        Model = self._get_model(model_name)
+        root = Model.model_fields.get("root")
+        item_types = get_args(root.annotation) if root is not None else ()
+        if len(item_types) != 1:
+            raise ValueError(f"Model {model_name} is not an array model and cannot be streamed")
+        return item_types[0]
+
+    def _send_batched_request_and_deserialize(
+        self, endpoint_and_model: dict[str, str], ids: List[str], chunk_size: int,
+        params: List[str | int] = None, ids_index: int = 0, endpoint_args: dict = None
+    ) -> BatchResponseModel:
+        chunk_params = self._chunk_params(ids, chunk_size, params, ids_index)
+        # chunks are always validated, even on a raw client, so that their items can be merged
+        with ThreadPoolExecutor(max_workers=max(1, min(len(chunk_params), self.max_batch_workers))) as executor:
+            results = list(executor.map(
+                lambda chunk: self._send_batch_chunk(endpoint_and_model, chunk, endpoint_args), chunk_params
+            ))
+        return self._merge_batch(endpoint_and_model["model"], results)
+
+    def _send_batch_chunk(
+        self, endpoint_and_model: dict[str, str], chunk: List[str | int], endpoint_args: dict = None
+    ) -> ResponseModel | ApiError:
+        try:
+            return self._send_request_and_deserialize(endpoint_and_model, chunk, endpoint_args, raw=False)
+        except Exception as error:
+            return self._chunk_error(endpoint_and_model, chunk, error)
+
+    def _chunk_error(
+        self, endpoint_and_model: dict[str, str], chunk: List[str | int], error: Exception
+    ) -> ApiError:
+        # a chunk that failed without an HTTP response (connection error, timeout, ...)
+        # is reported alongside the HTTP errors instead of discarding the other chunks
+        endpoint, _ = self._resolve_endpoint(endpoint_and_model, chunk)
+        return ApiError(
+            timestampUtc=datetime.now(timezone.utc),
+            exceptionType=type(error).__name__,
+            httpStatusCode=0,
+            httpStatus="",
+            relativeUri=endpoint,
+            message=str(error),
+        )
+
+    @staticmethod
+    def _chunk_params(
+        ids: List[str], chunk_size: int, params: List[str | int] = None, ids_index: int = 0
+    ) -> List[List[str | int]]:
+        # one params list per chunk, with the comma-joined chunk in place of the ids
+        params = list(params or [None])
+        chunk_params = []
+        for start in range(0, len(ids), chunk_size):
+            chunk = list(params)
+            chunk[ids_index] = ",".join(str(id) for id in ids[start:start + chunk_size])
+            chunk_params.append(chunk)
+        return chunk_params
+
+    def _merge_batch(self, model_name: str, results: List[ResponseModel | ApiError]) -> BatchResponseModel:
+        items, errors, responses = [], [], []
+        for result in results:
+            if isinstance(result, ApiError):
+                errors.append(result)
+            else:
+                responses.append(result)
+                items.extend(result.content.root)
+        return BatchResponseModel(
+            content_expires=self._earliest([response.content_expires for response in responses]),
+            shared_expires=self._earliest([response.shared_expires for response in responses]),
+            content=self._get_model(model_name)(items),
+            errors=errors,
+        )
+
+    @staticmethod
+    def _earliest(expiries: List[Optional[datetime]]) -> Optional[datetime]:
+        # a merged result is only as fresh as its stalest chunk
+        if not expiries or None in expiries:
+            return None
+        return min(expiries)
+
+    @staticmethod
+    def _resolve_endpoint(
+        endpoint_and_model: dict[str, str], params: str | int | List[str | int] = None
+    ) -> Tuple[str, str]:
         if params is None:
             params = []
         if not isinstance(params, list):
@@ -116,9 +331,201 @@ class Client:
 
         endpoint = endpoint_and_model["uri"].format(*params)
         model_name = endpoint_and_model["model"]
+        return endpoint, model_name
+
+    def _handle_response(self, model_name: str, response: Response, raw: bool = False) -> Any:
+        if response.status_code != 200:
+            return self._deserialize_error(response)
+        return self._deserialize(model_name, response, raw)
+
+    def _get_cached(self, cache_key: str, raw: bool = False) -> Optional[ResponseModel]:
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        if self.shared_cache is not None:
+            entry = self.shared_cache.get(cache_key)
+            if entry is not None:
+                cached = self._create_model_instance_from_shared_entry(entry, raw)
+                if self.cache is not None:
+                    self.cache.set(cache_key, cached, len(entry.body))
+                return cached
+        return None
+
+    def _get_stale(self, cache_key: str, raw: bool = False) -> Optional[ResponseModel]:
+        if self.cache is not None:
+            stale = self.cache.get_stale(cache_key)
+            if stale is not None:
+                return stale
+        if self.shared_cache is not None:
+            entry = self.shared_cache.get_stale(cache_key)
+            if entry is not None:
+                return self._create_model_instance_from_shared_entry(entry, raw)
+        return None
+
+    def _create_model_instance_from_shared_entry(self, entry: SharedCacheEntry, raw: bool = False) -> ResponseModel:
+        Model = None if raw else self._get_model(entry.model_name)
+        result = self._create_model_instance_from_json(
+            Model, entry.body, entry.content_expires, entry.shared_expires)
+        result.etag = entry.etag
+        result.last_modified = entry.last_modified
+        return result
 
-        response = self.client.send_request(endpoint, endpoint_args)
+    def _get_stale_validators(self, cache_key: str) -> Tuple[Optional[str], Optional[str]]:
+        if self.cache is not None:
+            stale = self.cache.get_stale(cache_key)
+            if stale is not None:
+                return stale.etag, stale.last_modified
+        if self.shared_cache is not None:
+            validators = self.shared_cache.get_validators(cache_key)
+            if validators is not None:
+                return validators
+        return None, None
+
+    def _get_validator_headers(self, cache_key: str) -> Optional[dict[str, str]]:
+        etag, last_modified = self._get_stale_validators(cache_key)
+        headers = {}
+        if etag is not None:
+            headers["If-None-Match"] = etag
+        if last_modified is not None:
+            headers["If-Modified-Since"] = last_modified
+        return headers or None
+
+    def _refresh_cached(self, cache_key: str, stale: ResponseModel, response: Response) -> ResponseModel:
+        # 304 Not Modified: reuse the parsed content and take the new expiry times
+        shared_expiry, result_expiry = self._get_result_expiry(response)
+        refreshed = stale.model_copy(update={
+            "content_expires": result_expiry,
+            "shared_expires": shared_expiry,
+            "etag": response.headers.get("ETag", stale.etag),
+            "last_modified": response.headers.get("Last-Modified", stale.last_modified),
+        })
+        if self.cache is not None:
+            self.cache.refresh(cache_key, refreshed)
+        if self.shared_cache is not None:
+            self.shared_cache.refresh(cache_key, result_expiry, shared_expiry)
+        return refreshed
+
+    def _cache_result(self, cache_key: str, model_name: str, result: Any, response: Response) -> Any:
+        if not isinstance(result, ResponseModel):
+            return result
+        if self.cache is not None:
+            self.cache.set(cache_key, result, len(response.content))
+        if self.shared_cache is not None:
+            self.shared_cache.set(
+                cache_key, model_name, response.content, result.content_expires, result.shared_expires,
+                result.etag, result.last_modified)
+        return result
+
+    def _needs_fetch_lease(self, cache_key: str) -> bool:
+        return self.shared_cache is not None and self.shared_cache.is_shareable(cache_key)
+
+
+class AsyncClient(Client):
+    """AsyncClient
+
+    asyncio variant of :class:`Client`. Generated ``Async<Api>Client`` classes
+    subclass this so that many requests can share a single event loop.
+
+    :param str api_token: API token to access TfL unified API
+    :param AsyncRestClient rest_client: Optional shared AsyncRestClient
+    :param ResponseCache cache: Optional in-memory cache for responses that
+        carry a ``max-age``
+    :param SharedResponseCache shared_cache: Optional on-disk cache shared
+        between processes for responses that carry an ``s-maxage``
+    """
+
+    _singleflight = AsyncSingleFlight()
+
+    def __init__(self, api_token: str = None, rest_client: AsyncRestClient = None,
+                 cache: ResponseCache = None, shared_cache: SharedResponseCache = None, raw: bool = False):
+        super().__init__(
+            api_token, rest_client if rest_client is not None else AsyncRestClient(api_token),
+            cache, shared_cache, raw
+        )
+
+    async def _send_request_and_deserialize(
+        self, endpoint_and_model: dict[str, str],
+        params: str | int | List[str | int] = None, endpoint_args: dict = None, raw: bool = None,
+        fields: Tuple[str, ...] = None
+    ) -> BaseModel | List[BaseModel] | ApiError:
+        endpoint, model_name = self._resolve_endpoint(endpoint_and_model, params)
+        raw = self.raw if raw is None else raw
+        if fields and not raw:
+            # build the projection up front so that unknown fields fail before a round-trip
+            model_name = projection_name(model_name, fields)
+            self._get_model(model_name)
+        cache_key = ResponseCache.make_key(endpoint, endpoint_args, raw, fields)
+        cached = self._get_cached(cache_key, raw)
+        if cached is not None:
+            return cached
+
+        return await self._singleflight.do(
+            self._singleflight_key(cache_key), lambda: self._fetch_and_deserialize(endpoint, model_name, cache_key, endpoint_args, raw))
+
+    async def _stream_request_and_deserialize(
+        self, endpoint_and_model: dict[str, str],
+        params: str | int | List[str | int] = None, endpoint_args: dict = None, fields: Tuple[str, ...] = None
+    ) -> ResponseModel | ApiError:
+        endpoint, model_name = self._resolve_endpoint(endpoint_and_model, params)
+        ItemModel = self._get_item_model(projection_name(model_name, fields))
+
+        response = await self.client.send_request(endpoint, endpoint_args, stream=True)
 
         if response.status_code != 200:
+            await response.aread()
+            await response.aclose()
             return self._deserialize_error(response)
-        return self._deserialize(model_name, response)
+        shared_expiry, result_expiry = self._get_result_expiry(response)
+        return ResponseModel(
+            content_expires=result_expiry, shared_expires=shared_expiry,
+            content=self._aiter_items(ItemModel, response),
+        )
+
+    @staticmethod
+    async def _aiter_items(ItemModel: type[BaseModel], response) -> AsyncIterator[BaseModel]:
+        try:
+            async for item in aiter_array_items(response.aiter_bytes(64 * 1024)):
+                yield ItemModel.model_validate_json(item)
+        finally:
+            await response.aclose()
+
+    async def _send_batched_request_and_deserialize(
+        self, endpoint_and_model: dict[str, str], ids: List[str], chunk_size: int,
+        params: List[str | int] = None, ids_index: int = 0, endpoint_args: dict = None
+    ) -> BatchResponseModel:
+        chunk_params = self._chunk_params(ids, chunk_size, params, ids_index)
+        results = await asyncio.gather(*[
+            self._send_request_and_deserialize(endpoint_and_model, chunk, endpoint_args, raw=False)
+            for chunk in chunk_params
+        ], return_exceptions=True)
+        for index, result in enumerate(results):
+            if isinstance(result, Exception):
+                results[index] = self._chunk_error(endpoint_and_model, chunk_params[index], result)
+            elif isinstance(result, BaseException):
+                raise result
+        return self._merge_batch(endpoint_and_model["model"], results)
+
+    async def _fetch_and_deserialize(
+        self, endpoint: str, model_name: str, cache_key: str, endpoint_args: dict = None, raw: bool = False
+    ) -> BaseModel | List[BaseModel] | ApiError:
+        leased = self._needs_fetch_lease(cache_key)
+        while leased and not self.shared_cache.acquire(cache_key):
+            await asyncio.sleep(self.shared_cache.poll_interval)
+            cached = self._get_cached(cache_key, raw)
+            if cached is not None:
+                return cached
+
+        try:
+            response = await self.client.send_request(
+                endpoint, endpoint_args, self._get_validator_headers(cache_key))
+            if response.status_code == 304:
+                stale = self._get_stale(cache_key, raw)
+                if stale is not None:
+                    return self._refresh_cached(cache_key, stale, response)
+                response = await self.client.send_request(endpoint, endpoint_args)
+            return self._cache_result(
+                cache_key, model_name, self._handle_response(model_name, response, raw), response)
+        finally:
+            if leased:
+                self.shared_cache.release(cache_key)
@@ -0,0 +1,114 @@
+from array import array
+from typing import Any, Iterable, NamedTuple, Optional, Union, get_args, get_origin
+from pydantic import BaseModel, RootModel
+from pydantic.fields import FieldInfo
+from pydantic_core import from_json
+
+try:
+    import numpy
+except ImportError:  # numpy is optional; columns fall back to the stdlib array module
+    numpy = None
+
+# array typecodes and numpy dtypes for the scalar field types; anything else
+# (strings, enums, nested models, lists) becomes an object column
+_TYPECODES = {int: "q", float: "d", bool: "b"}
+_NUMPY_DTYPES = {int: "int64", float: "float64", bool: "bool"}
+_FILL_VALUES = {int: 0, float: float("nan"), bool: False}
+
+
+class Column(NamedTuple):
+    """One field of an array response.
+
+    ``values`` is an ``array.array`` (or ``numpy.ndarray``) for int, float and
+    bool fields and a list (or object ndarray) otherwise. ``mask`` is set for
+    fields that may be missing (``Optional`` or not required) and is true where
+    the value is missing or null; masked scalar slots hold 0, NaN or False.
+    """
+    values: Any
+    mask: Any = None
+
+
+def _unwrap_optional(annotation: Any) -> tuple[Any, bool]:
+    if get_origin(annotation) is Union and type(None) in get_args(annotation):
+        non_none_args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return (non_none_args[0] if len(non_none_args) == 1 else Any), True
+    return annotation, False
+
+
+def _field_type(field: FieldInfo) -> tuple[Any, bool]:
+    # the generated models declare most fields as `x: float = Field(None)`, so a
+    # field is nullable when it can be left out, not only when it is Optional
+    field_type, optional = _unwrap_optional(field.annotation)
+    return field_type, optional or not field.is_required() or field.default is None
+
+
+def _item_model(Model: type[RootModel]) -> type[BaseModel]:
+    item_types = get_args(Model.model_fields["root"].annotation)
+    if len(item_types) != 1 or not issubclass(item_types[0], BaseModel):
+        raise ValueError(f"Model {Model.__name__} is not an array of models")
+    return item_types[0]
+
+
+def _build_column(values: Iterable[Any], field_type: Any, optional: bool, use_numpy: bool) -> Column:
+    typecode = _TYPECODES.get(field_type)
+    if typecode is None:
+        column_values = list(values)
+        mask = bytearray(value is None for value in column_values) if optional else None
+    elif optional:
+        fill_value = _FILL_VALUES[field_type]
+        column_values = array(typecode)
+        mask = bytearray()
+        for value in values:
+            mask.append(value is None)
+            column_values.append(fill_value if value is None else value)
+    else:
+        column_values = array(typecode, values)
+        mask = None
+
+    if not use_numpy:
+        return Column(column_values, mask)
+    if typecode is None:
+        # fromiter keeps nested lists as single objects instead of adding dimensions
+        column_values = numpy.fromiter(column_values, dtype=object, count=len(column_values))
+    else:
+        column_values = numpy.frombuffer(column_values, dtype=_NUMPY_DTYPES[field_type])
+    return Column(column_values, None if mask is None else numpy.frombuffer(mask, dtype=bool))
+
+
+def to_columns(
+    data: RootModel | bytes | str, Model: Optional[type[RootModel]] = None, use_numpy: Optional[bool] = None
+) -> dict[str, Column]:
+    """Turn an array response into a struct of typed columns keyed by field name.
+
+    ``data`` is either a validated ``*Array`` model or the raw JSON body of
+    one, in which case ``Model`` names the array model to take the field types
+    from. Raw JSON is read without building a model per row; its values are
+    used as they are, without validation.
+
+    NumPy arrays are returned when NumPy is installed, unless ``use_numpy`` is
+    false.
+    """
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    elif use_numpy and numpy is None:
+        raise ImportError("numpy is required for use_numpy=True")
+
+    if isinstance(data, RootModel):
+        ItemModel = _item_model(type(data))
+        rows = data.root
+        def column_values(name, field):
+            return (getattr(row, name) for row in rows)
+    else:
+        if Model is None:
+            raise ValueError("Model is required to build columns from raw JSON")
+        ItemModel = _item_model(Model)
+        rows = from_json(data)
+        def column_values(name, field):
+            key = field.alias or name
+            return (row.get(key) for row in rows)
+
+    columns = {}
+    for name, field in ItemModel.model_fields.items():
+        field_type, optional = _field_type(field)
+        columns[name] = _build_column(column_values(name, field), field_type, optional, use_numpy)
+    return columns
@@ -0,0 +1,106 @@
+import re
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List
+
+_STRUCTURAL = re.compile(rb'[\[\]{}",]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+
+
+class JsonArraySplitter():
+    """JsonArraySplitter.
+
+    Incrementally splits a JSON array into the raw bytes of its top-level
+    elements. Feed it the body chunk by chunk; it only buffers the element
+    currently being read, so memory is bounded by the largest element rather
+    than the whole payload. Call :meth:`close` after the last chunk to check
+    that the body was a complete array.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._item_start = None
+        self._opened = False
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        self._buffer += chunk
+        buffer = self._buffer
+        pos = self._pos
+        items = []
+        while True:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buffer, pos)
+                if match is None:
+                    pos = len(buffer)
+                    break
+                if match.group() == b'\\':
+                    if match.end() >= len(buffer):
+                        # the escaped character is in the next chunk
+                        pos = match.start()
+                        break
+                    pos = match.end() + 1
+                    continue
+                self._in_string = False
+                pos = match.end()
+                continue
+
+            match = _STRUCTURAL.search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+            char = match.group()
+            pos = match.end()
+            if char == b'"':
+                self._in_string = True
+            elif char in b'[{':
+                if self._depth == 0:
+                    if char != b'[' or self._opened:
+                        raise ValueError("Expected a JSON array")
+                    self._opened = True
+                    self._item_start = pos
+                self._depth += 1
+            elif char in b']}':
+                self._depth -= 1
+                if self._depth == 0:
+                    self._emit(items, pos - 1)
+                    self._item_start = None
+            elif self._depth == 1:
+                # a comma between two top-level elements
+                self._emit(items, pos - 1)
+                self._item_start = pos
+
+        # drop everything before the element currently being read
+        keep_from = self._item_start if self._item_start is not None else pos
+        del buffer[:keep_from]
+        self._pos = pos - keep_from
+        if self._item_start is not None:
+            self._item_start = 0
+        return items
+
+    def close(self) -> None:
+        """Raise ``ValueError`` unless the body fed so far was one complete JSON array."""
+        if not self._opened:
+            raise ValueError("Expected a JSON array")
+        if self._depth != 0 or self._in_string:
+            raise ValueError("Truncated JSON array")
+
+    def _emit(self, items: List[bytes], end: int) -> None:
+        item = bytes(self._buffer[self._item_start:end]).strip()
+        if item:
+            items.append(item)
+
+
+def iter_array_items(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    splitter = JsonArraySplitter()
+    for chunk in chunks:
+        yield from splitter.feed(chunk)
+    splitter.close()
+
+
+async def aiter_array_items(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    splitter = JsonArraySplitter()
+    async for chunk in chunks:
+        for item in splitter.feed(chunk):
+            yield item
+    splitter.close()
@@ -0,0 +1,53 @@
+import sys
+from importlib import import_module
+from types import ModuleType
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class LazyPackage(ModuleType):
+    """Module type for packages whose exports are imported on first access.
+
+    Importing a submodule binds it as an attribute of its package, and most
+    exports share their submodule's name (``models.Place`` lives in
+    ``models/Place.py``). Bind the export instead, so that the submodule
+    import does not shadow it.
+    """
+
+    def __setattr__(self, name: str, value) -> None:
+        target = self.__dict__.get("_lazy_imports", {}).get(name)
+        if isinstance(value, ModuleType) and target is not None and target[1] is not None:
+            if not hasattr(value, target[1]):
+                # partially initialised during a circular import: leave the
+                # name unbound so that __getattr__ resolves it later
+                return
+            value = getattr(value, target[1])
+        super().__setattr__(name, value)
+
+
+def lazy_package(
+    package_name: str, lazy_imports: Dict[str, Tuple[str, Optional[str]]]
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """Return PEP 562 ``__getattr__`` and ``__dir__`` functions for a package.
+
+    ``lazy_imports`` maps each exported name to the relative module it is
+    imported from and the attribute to take from it, or ``None`` to export
+    the module itself. Nothing is imported until a name is first accessed.
+    """
+    package = sys.modules[package_name]
+    package._lazy_imports = lazy_imports
+    package.__class__ = LazyPackage
+
+    def __getattr__(name: str):
+        target = lazy_imports.get(name)
+        if target is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        module_path, attribute = target
+        module = import_module(module_path, package_name)
+        value = module if attribute is None else getattr(module, attribute)
+        setattr(package, name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(package.__dict__) | set(lazy_imports))
+
+    return __getattr__, __dir__
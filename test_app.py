@@ -1,4 +1,45 @@
-from app import endpoints, models
+import pytest
+import asyncio
+import importlib
+import json
+import math
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+import requests
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+from pydantic import BaseModel
+from app import endpoints, models, records, RestClient, AsyncRestClient, ResponseCache, SharedResponseCache, to_columns
+from app.Client import AsyncClient, Client
+from app.package_models import ResponseModel
+from app.rest_client import TokenBucket
+
+def make_response(body, status_code=200, headers=None):
+    response = Response()
+    response.status_code = status_code
+    response._content = json.dumps(body).encode()
+    response.headers = CaseInsensitiveDict({
+        "Content-Type": "application/json",
+        "Date": format_datetime(datetime.now(timezone.utc), usegmt=True),
+        **(headers or {}),
+    })
+    return response
+
+class FakeRestClient:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def send_request(self, location, params=None, headers=None, stream=False):
+        self.requests.append((location, params, headers))
+        return self.responses.pop(0)
 
 def test_CrowdingClient_naptan():
     client = endpoints.CrowdingClient()
@@ -10,6 +51,412 @@ def test_Line_MetaModes():
     response = client.metamodes()
     assert isinstance(response.content, models.ModeArray)
 
+def test_clients_share_rest_client_pool():
+    rest_client = RestClient(pool_maxsize=4)
+    line_client = endpoints.LineClient(rest_client=rest_client)
+    stop_point_client = endpoints.StopPointClient(rest_client=rest_client)
+    assert line_client.client is stop_point_client.client
+    assert rest_client.session.get_adapter("https://api.tfl.gov.uk/")._pool_maxsize == 4
+
+def test_async_client_deserializes_response():
+    httpx = pytest.importorskip("httpx")
+
+    def handler(request):
+        return httpx.Response(200, json=[{"modeName": "tube", "isTflService": True}])
+
+    rest_client = AsyncRestClient()
+    rest_client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = endpoints.AsyncLineClient(rest_client=rest_client)
+    response = asyncio.run(client.metamodes())
+    assert isinstance(response.content, models.ModeArray)
+    assert response.content.root[0].modeName == "tube"
+
+def test_async_clients_mirror_sync_clients():
+    for name in endpoints.__all__:
+        if not name.startswith("Async"):
+            async_client = getattr(endpoints, f"Async{name}")
+            sync_methods = {attr for attr in vars(getattr(endpoints, name)) if not attr.startswith("_")}
+            assert sync_methods == {attr for attr in vars(async_client) if not attr.startswith("_")}
+            assert all(asyncio.iscoroutinefunction(getattr(async_client, attr)) for attr in sync_methods)
+
+def test_models_resolved_lazily_and_shared_between_clients():
+    Model = endpoints.LineClient()._get_model("LineArray")
+    assert Model is models.LineArray
+    assert Client._resolved_models["LineArray"] is Model
+    assert endpoints.StopPointClient()._get_model("LineArray") is Model
+
+def test_response_cache_serves_fresh_responses():
+    modes = [{"modeName": "tube"}]
+    rest_client = FakeRestClient(
+        make_response(modes, headers={"Cache-Control": "public, max-age=3600"}),
+        make_response(modes, headers={"Cache-Control": "no-cache"}),
+    )
+    client = endpoints.LineClient(rest_client=rest_client, cache=ResponseCache())
+    first = client.metamodes()
+    assert client.metamodes() is first
+    assert len(rest_client.requests) == 1
+
+def test_response_cache_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=2)
+    expires = datetime(2100, 1, 1, tzinfo=timezone.utc)
+    for key in ("a", "b", "c"):
+        cache.set(key, ResponseModel(content_expires=expires, shared_expires=None, content=None), 10)
+    assert cache.get("a") is None
+    assert cache.get("c") is not None
+    assert ResponseCache.make_key("/Line", {"b": 1, "a": 2}) == ResponseCache.make_key("/Line", {"a": 2, "b": 1})
+
+def test_shared_cache_serves_other_processes(tmp_path):
+    statuses = [{"id": "victoria"}]
+    path = str(tmp_path / "responses.sqlite")
+    first_worker = FakeRestClient(make_response(statuses, headers={"Cache-Control": "max-age=30, s-maxage=60"}))
+    second_worker = FakeRestClient()
+    endpoints.LineClient(rest_client=first_worker, shared_cache=SharedResponseCache(path)).getbypathids("victoria")
+    response = endpoints.LineClient(rest_client=second_worker, shared_cache=SharedResponseCache(path)).getbypathids("victoria")
+    assert response.content.root[0].id == "victoria"
+    assert second_worker.requests == []
+
+def test_shared_cache_fetch_lease_is_exclusive(tmp_path):
+    path = str(tmp_path / "responses.sqlite")
+    first, second = SharedResponseCache(path), SharedResponseCache(path)
+    assert first.acquire("/Line/Status?")
+    assert not second.acquire("/Line/Status?")
+    first.release("/Line/Status?")
+    assert second.acquire("/Line/Status?")
+
+def test_fetch_lease_only_taken_for_shareable_keys(tmp_path):
+    path = str(tmp_path / "responses.sqlite")
+    other_process = SharedResponseCache(path)
+    key = ResponseCache.make_key("/Line/victoria")
+    assert other_process.acquire(key)
+    rest_client = FakeRestClient(
+        make_response([{"id": "victoria"}], headers={"Cache-Control": "no-cache"}),
+        make_response([{"id": "victoria"}], headers={"Cache-Control": "s-maxage=60"}),
+    )
+    client = endpoints.LineClient(rest_client=rest_client, shared_cache=SharedResponseCache(path, lease_timeout=0.2))
+    # never answered with an s-maxage, so the held lease is ignored rather than polled on
+    start = time.monotonic()
+    client.getbypathids("victoria")
+    assert time.monotonic() - start < 0.1
+    assert not other_process.is_shareable(key)
+    client.getbypathids("victoria")
+    assert other_process.is_shareable(key)
+
+def test_shareable_keys_expire_and_are_capped(tmp_path):
+    cache = SharedResponseCache(str(tmp_path / "capped.sqlite"), max_shareable_keys=2)
+    shared_expires = datetime.now(timezone.utc) + timedelta(seconds=60)
+    for key in ("/Line/victoria?", "/Line/central?", "/Line/circle?"):
+        cache.set(key, "LineArray", b"[]", None, shared_expires)
+    assert [cache.is_shareable(key) for key in ("/Line/victoria?", "/Line/central?", "/Line/circle?")] == \
+        [False, True, True]
+    forgetful = SharedResponseCache(str(tmp_path / "forgetful.sqlite"), shareable_ttl=0)
+    forgetful.set("/Line/district?", "LineArray", b"[]", None, shared_expires)
+    assert not forgetful.is_shareable("/Line/district?")
+    # expired rows are pruned on the next write rather than kept forever
+    assert forgetful._connection().execute("SELECT COUNT(*) FROM shareable").fetchone()[0] == 0
+
+def test_shared_cache_get_skips_expired_entries(tmp_path):
+    cache = SharedResponseCache(str(tmp_path / "responses.sqlite"))
+    cache.set("/Line/victoria?", "LineArray", b"[]", None, datetime.now(timezone.utc) - timedelta(seconds=1), etag='"v1"')
+    assert cache.get("/Line/victoria?") is None
+    assert cache.get_stale("/Line/victoria?").etag == '"v1"'
+
+def test_expired_response_revalidated_with_etag():
+    modes = [{"modeName": "tube"}]
+    rest_client = FakeRestClient(
+        make_response(modes, headers={"Cache-Control": "max-age=0", "ETag": '"v1"'}),
+        make_response(None, status_code=304, headers={"Cache-Control": "max-age=3600"}),
+    )
+    client = endpoints.LineClient(rest_client=rest_client, cache=ResponseCache())
+    first = client.metamodes()
+    second = client.metamodes()
+    assert rest_client.requests[1][2] == {"If-None-Match": '"v1"'}
+    assert second.content is first.content
+    assert ResponseCache.is_fresh(second.content_expires)
+    assert client.metamodes() is second
+
+def test_not_modified_after_stale_entry_evicted_refetches_body():
+    modes = [{"modeName": "tube"}]
+    cache = ResponseCache()
+
+    class EvictingRestClient(FakeRestClient):
+        def send_request(self, location, params=None, headers=None, stream=False):
+            if headers is not None:
+                # another thread pushes the stale entry out while the revalidation is in flight
+                cache.clear()
+            return super().send_request(location, params, headers, stream)
+
+    rest_client = EvictingRestClient(
+        make_response(modes, headers={"Cache-Control": "max-age=0", "ETag": '"v1"'}),
+        make_response(None, status_code=304, headers={"Cache-Control": "max-age=3600"}),
+        make_response(modes, headers={"Cache-Control": "max-age=3600", "ETag": '"v1"'}),
+    )
+    client = endpoints.LineClient(rest_client=rest_client, cache=cache)
+    client.metamodes()
+    refetched = client.metamodes()
+    assert refetched.content.root[0].modeName == "tube"
+    assert [headers for _, _, headers in rest_client.requests] == [None, {"If-None-Match": '"v1"'}, None]
+
+def test_stale_shared_body_parsed_only_when_not_modified(tmp_path):
+    shared_cache = SharedResponseCache(str(tmp_path / "responses.sqlite"))
+    key = ResponseCache.make_key("/Line/Meta/Modes")
+    shared_cache.set(key, "ModeArray", b"not json", None, None, etag='"v1"')
+    rest_client = FakeRestClient(make_response([{"modeName": "tube"}]))
+    client = endpoints.LineClient(rest_client=rest_client, shared_cache=shared_cache)
+    # the stale body is never validated because the server sent a new one
+    assert client.metamodes().content.root[0].modeName == "tube"
+    assert rest_client.requests[0][2] == {"If-None-Match": '"v1"'}
+
+    shared_cache.set(key, "ModeArray", b'[{"modeName": "bus"}]', None, None, etag='"v2"')
+    rest_client.responses.append(make_response(None, status_code=304, headers={"Cache-Control": "max-age=60"}))
+    assert client.metamodes().content.root[0].modeName == "bus"
+
+def test_concurrent_identical_requests_are_coalesced():
+    started = threading.Event()
+
+    class SlowRestClient(FakeRestClient):
+        def send_request(self, location, params=None, headers=None):
+            started.set()
+            time.sleep(0.2)
+            return super().send_request(location, params, headers)
+
+    rest_client = SlowRestClient(make_response([{"id": "victoria"}]))
+    client = endpoints.LineClient(rest_client=rest_client)
+    with ThreadPoolExecutor(8) as executor:
+        first = executor.submit(client.getbypathids, "victoria")
+        started.wait()
+        others = [executor.submit(client.getbypathids, "victoria") for _ in range(7)]
+        results = [first.result()] + [future.result() for future in others]
+    assert len(rest_client.requests) == 1
+    assert all(result is results[0] for result in results)
+
+def test_requests_on_different_transports_are_not_coalesced():
+    started = threading.Barrier(2)
+
+    class SlowRestClient(FakeRestClient):
+        def send_request(self, location, params=None, headers=None):
+            started.wait(timeout=1)
+            return super().send_request(location, params, headers)
+
+    first = endpoints.LineClient(rest_client=SlowRestClient(make_response([{"id": "victoria", "name": "first"}])))
+    second = endpoints.LineClient(rest_client=SlowRestClient(make_response([{"id": "victoria", "name": "second"}])))
+    with ThreadPoolExecutor(2) as executor:
+        results = list(executor.map(lambda client: client.getbypathids("victoria"), [first, second]))
+    assert [result.content.root[0].name for result in results] == ["first", "second"]
+
+def test_async_concurrent_identical_requests_are_coalesced():
+    httpx = pytest.importorskip("httpx")
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=[{"modeName": "tube"}])
+
+    async def main():
+        rest_client = AsyncRestClient()
+        rest_client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = AsyncClient(rest_client=rest_client)
+        endpoint = {"uri": "/Line/Meta/Modes", "model": "ModeArray"}
+        return await asyncio.gather(*[client._send_request_and_deserialize(endpoint) for _ in range(20)])
+
+    results = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+def test_batched_request_merges_chunks_and_reports_errors():
+    class LineRestClient(FakeRestClient):
+        def send_request(self, location, params=None, headers=None):
+            self.requests.append(location)
+            ids = location.split("/")[-1].split(",")
+            if "bad" in ids:
+                return make_response(
+                    {"$type": "Tfl.Apps.Api.Rest.Models.ApiError, Tfl.Apps.Api.Rest",
+                     "timestampUtc": "2024-09-30T17:45:12.3456789Z", "exceptionType": "EntityNotFoundException",
+                     "httpStatusCode": 404, "httpStatus": "NotFound", "relativeUri": location,
+                     "message": "The following line ids are not recognised: bad"},
+                    status_code=404)
+            return make_response([{"id": id} for id in ids], headers={"Cache-Control": "max-age=60"})
+
+    rest_client = LineRestClient()
+    # batches are merged from validated chunks even on a raw client
+    client = endpoints.LineClient(rest_client=rest_client, raw=True)
+    response = client.getbypathidsbatch(["victoria", "central", "bad", "circle", "district"], chunk_size=2)
+    assert sorted(rest_client.requests) == ["/Line/bad,circle", "/Line/district", "/Line/victoria,central"]
+    assert [line.id for line in response.content.root] == ["victoria", "central", "district"]
+    assert isinstance(response.content, models.LineArray)
+    assert [error.http_status_code for error in response.errors] == [404]
+    assert response.errors[0].timestamp_utc == datetime(2024, 9, 30, 17, 45, 12, 345678, tzinfo=timezone.utc)
+
+def test_batched_request_keeps_chunks_when_another_fails_to_connect():
+    class FlakyRestClient(FakeRestClient):
+        def send_request(self, location, params=None, headers=None):
+            ids = location.split("/")[-1].split(",")
+            if "circle" in ids:
+                raise requests.ConnectionError("connection reset")
+            return make_response([{"id": id} for id in ids])
+
+    client = endpoints.LineClient(rest_client=FlakyRestClient())
+    response = client.getbypathidsbatch(["victoria", "central", "circle", "district"], chunk_size=2)
+    assert [line.id for line in response.content.root] == ["victoria", "central"]
+    assert [(error.exception_type, error.http_status_code) for error in response.errors] == [("ConnectionError", 0)]
+    assert response.errors[0].relative_uri == "/Line/circle,district"
+
+def test_async_batched_request_keeps_chunks_when_another_fails_to_connect():
+    httpx = pytest.importorskip("httpx")
+
+    def handler(request):
+        ids = request.url.path.split("/")[-1].split(",")
+        if "circle" in ids:
+            raise httpx.ConnectError("connection reset", request=request)
+        return httpx.Response(200, json=[{"id": id} for id in ids])
+
+    async def main():
+        rest_client = AsyncRestClient()
+        rest_client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = endpoints.AsyncLineClient(rest_client=rest_client)
+        return await client.getbypathidsbatch(["victoria", "central", "circle", "district"], chunk_size=2)
+
+    response = asyncio.run(main())
+    assert [line.id for line in response.content.root] == ["victoria", "central"]
+    assert [error.exception_type for error in response.errors] == ["ConnectError"]
+
+def test_raw_mode_returns_body_without_validation():
+    body = [{"modeName": "tube"}]
+    rest_client = FakeRestClient(
+        make_response(body, headers={"Cache-Control": "max-age=60"}),
+        make_response(body, headers={"Cache-Control": "max-age=60"}),
+    )
+    client = endpoints.LineClient(rest_client=rest_client, cache=ResponseCache(), raw=True)
+    client._get_model = None
+    endpoint = {"uri": "/Line/Meta/Modes", "model": "ModeArray"}
+    raw = client._send_request_and_deserialize(endpoint)
+    assert raw.content == json.dumps(body).encode()
+    assert ResponseCache.is_fresh(raw.content_expires)
+    assert client._send_request_and_deserialize(endpoint) is raw
+    # fields have nothing to project on a raw body
+    assert client._send_request_and_deserialize(endpoint, fields=("modeName",)) is raw
+    del client._get_model
+    validated = client.metamodes(raw=False)
+    assert isinstance(validated.content, models.ModeArray)
+    assert len(rest_client.requests) == 2
+
+def test_field_projection_keeps_only_requested_fields():
+    body = [{"naptanId": "940GZZLUBND", "timeToStation": 120, "lineId": "jubilee", "timing": {"countdownServerAdjustment": "00:00:01"}}]
+    rest_client = FakeRestClient(make_response(body), make_response(body))
+    client = endpoints.LineClient(rest_client=rest_client)
+    endpoint = {"uri": "/Line/jubilee/Arrivals", "model": "PredictionArray"}
+    projected = client._send_request_and_deserialize(endpoint, fields=("timeToStation", "naptanId"))
+    prediction = projected.content.root[0]
+    assert set(type(prediction).model_fields) == {"naptanId", "timeToStation"}
+    assert (prediction.naptanId, prediction.timeToStation) == ("940GZZLUBND", 120)
+    assert type(client._send_request_and_deserialize(endpoint, fields=("naptanId", "timeToStation")).content) \
+        is type(projected.content)
+    with pytest.raises(ValueError):
+        client._send_request_and_deserialize(endpoint, fields=("notAField",))
+
+def test_records_are_compact_copies_of_models():
+    predictions = models.PredictionArray.model_validate(
+        [{"naptanId": "940GZZLUBND", "timeToStation": 120, "timing": {"source": "arrivals"}}])
+    converted = records.to_record(predictions)
+    assert isinstance(converted, tuple)
+    assert isinstance(converted[0], records.Prediction)
+    assert (converted[0].naptanId, converted[0].timeToStation) == ("940GZZLUBND", 120)
+    assert converted[0].timing == records.PredictionTiming(source="arrivals")
+    assert not hasattr(converted[0], "__dict__")
+
+def test_columns_from_model_and_raw_json_agree():
+    body = [{"lineId": "victoria", "timeToStation": 120}, {"lineId": "central", "timeToStation": None}]
+    from_json_columns = to_columns(json.dumps(body).encode(), models.PredictionArray, use_numpy=False)
+    from_model_columns = to_columns(models.PredictionArray.model_validate(body), use_numpy=False)
+    for columns in (from_json_columns, from_model_columns):
+        assert columns["lineId"].values == ["victoria", "central"]
+        assert list(columns["timeToStation"].values) == [120, 0]
+        assert list(columns["timeToStation"].mask) == [0, 1]
+        assert columns["timeToStation"].values.typecode == "q"
+
+def test_columns_mask_missing_non_optional_fields():
+    body = [{"id": "BikePoints_1", "lat": 51.5, "lon": -0.1, "distance": 12.5}, {"id": "BikePoints_2", "lat": 51.6, "lon": -0.2}]
+    from_json_columns = to_columns(json.dumps(body).encode(), models.PlaceArray, use_numpy=False)
+    from_model_columns = to_columns(models.PlaceArray.model_validate(body), use_numpy=False)
+    for columns in (from_json_columns, from_model_columns):
+        assert columns["distance"].values[0] == 12.5 and math.isnan(columns["distance"].values[1])
+        assert list(columns["distance"].mask) == [0, 1]
+        assert list(columns["lat"].values) == [51.5, 51.6]
+
+def test_import_app_is_lazy():
+    check = "import app, sys; assert 'app.Client' not in sys.modules and 'app.models.Line' not in sys.modules"
+    subprocess.run([sys.executable, "-c", check], check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+
+def test_sync_client_does_not_import_httpx():
+    check = "import sys; from app import BikePointClient; BikePointClient(); assert 'httpx' not in sys.modules"
+    subprocess.run([sys.executable, "-c", check], check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+
+def test_lazy_models_package_binds_classes_not_submodules():
+    importlib.import_module("app.models.Bay")
+    assert isinstance(models.Bay, type) and models.Bay.__name__ == "Bay"
+    assert "Bay" in dir(models)
+
+def test_warm_up_builds_deferred_models():
+    class Deferred(BaseModel):
+        modeName: Optional[str] = None
+        model_config = {"defer_build": True}
+
+    assert not Deferred.__pydantic_complete__
+    assert Client.warm_up([Deferred, "ModeArray"]) == [Deferred, models.ModeArray]
+    assert Deferred.__pydantic_complete__
+
+def test_streamed_array_response_yields_items_incrementally():
+    response = make_response([{"modeName": "tube"}, {"modeName": "bus"}], headers={"Cache-Control": "max-age=60"})
+    response._content_consumed = True
+    client = endpoints.LineClient(rest_client=FakeRestClient(response))
+    streamed = client.metamodesstream()
+    assert ResponseCache.is_fresh(streamed.content_expires)
+    assert [mode.modeName for mode in streamed.content] == ["tube", "bus"]
+
+@pytest.mark.parametrize("body", [b'[{"modeName": "tube"}, {"modeName"', b"null", b""])
+def test_streamed_response_rejects_incomplete_arrays(body):
+    response = make_response(None)
+    response._content, response._content_consumed = body, True
+    client = endpoints.LineClient(rest_client=FakeRestClient(response))
+    streamed = client._stream_request_and_deserialize({"uri": "/Line/Meta/Modes", "model": "ModeArray"})
+    with pytest.raises(ValueError):
+        list(streamed.content)
+
+def test_async_streamed_array_response_yields_items():
+    httpx = pytest.importorskip("httpx")
+
+    def handler(request):
+        return httpx.Response(200, content=b'[{"modeName": "tube"}, {"modeName": "bus"}]')
+
+    async def main():
+        rest_client = AsyncRestClient()
+        rest_client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = endpoints.AsyncLineClient(rest_client=rest_client)
+        streamed = await client.metamodesstream(fields=("modeName",))
+        return [mode.modeName async for mode in streamed.content]
+
+    assert asyncio.run(main()) == ["tube", "bus"]
+
+def test_token_bucket_spaces_requests_after_burst():
+    bucket = TokenBucket(rate=50, capacity=2)
+    start = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+    assert 0.07 <= time.monotonic() - start < 0.5
+
+def test_rate_limited_rest_client_pauses_on_retry_after():
+    class ThrottledSession:
+        def get(self, url, headers=None, stream=False):
+            return make_response(None, status_code=429, headers={"Retry-After": "0.2"})
+
+    rest_client = RestClient("throttled-test-key", requests_per_minute=6000)
+    assert RestClient("throttled-test-key", requests_per_minute=6000).rate_limiter is rest_client.rate_limiter
+    rest_client.session = ThrottledSession()
+    rest_client.send_request("/Line/Meta/Modes")
+    start = time.monotonic()
+    rest_client.send_request("/Line/Meta/Modes")
+    assert time.monotonic() - start >= 0.19
+
 if __name__ == "__main__":
     test_CrowdingClient_naptan()
     # test_Line_MetaModes()
\ No newline at end of file
@@ -0,0 +1,73 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import pytest
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+pytestmark = pytest.mark.skipif(sys.version_info < (3, 12), reason="build_models.py needs Python 3.12")
+
+
+def schema_ref(name):
+    return {"$ref": f"#/components/schemas/Cycle.{name}"}
+
+
+# Alpha -> Beta -> List[Gamma] -> Alpha, with Delta and AlphaArray depending on the cycle from outside
+CYCLE_SPEC = {
+    "openapi": "3.0.1",
+    "info": {"title": "Cycle", "version": "1.0"},
+    "servers": [{"url": "https://api.tfl.gov.uk/Cycle"}],
+    "paths": {
+        "/Alpha": {
+            "get": {
+                "operationId": "Cycle_Alphas",
+                "responses": {"200": {"content": {"application/json": {
+                    "schema": {"type": "array", "items": schema_ref("Alpha")}
+                }}}},
+            }
+        }
+    },
+    "components": {"schemas": {
+        "Cycle.Alpha": {"type": "object", "properties": {"beta": schema_ref("Beta"), "name": {"type": "string"}}},
+        "Cycle.Beta": {"type": "object", "properties": {"gammas": {"type": "array", "items": schema_ref("Gamma")}}},
+        "Cycle.Gamma": {"type": "object", "properties": {"alpha": schema_ref("Alpha")}},
+        "Cycle.Delta": {"type": "object", "properties": {"alpha": schema_ref("Alpha"), "label": {"type": "string"}}},
+    }},
+}
+
+ALPHA = {"name": "outer", "beta": {"gammas": [{"alpha": {"name": "inner"}}]}}
+
+
+@pytest.fixture(scope="module", params=[[], ["--defer-build"]], ids=["eager", "deferred"])
+def cycle_package(tmp_path_factory, request):
+    base = tmp_path_factory.mktemp("generated")
+    specs = base / "specs"
+    specs.mkdir()
+    (specs / "Cycle.json").write_text(json.dumps(CYCLE_SPEC))
+    subprocess.run(
+        [sys.executable, os.path.join(ROOT, "build_models.py"), str(specs), str(base / "cycle"), *request.param],
+        check=True, cwd=ROOT,
+    )
+    shutil.copy(os.path.join(ROOT, "model_files", "lazy.py"), base / "cycle")
+    return base, bool(request.param)
+
+
+@pytest.mark.parametrize("first", ["Alpha", "Beta", "Gamma", "Delta", "AlphaArray"])
+def test_cycle_models_complete_whichever_is_imported_first(cycle_package, first):
+    base, deferred = cycle_package
+    # a fresh interpreter per entry point, so that import order is not shared between cases
+    check = "\n".join([
+        f"from cycle.models.{first} import {first}",
+        "from cycle.models import Alpha, AlphaArray, Beta, Delta, Gamma",
+        # with --defer-build even the cyclic models are left for first use
+        f"assert not any(model.__pydantic_complete__ for model in (Alpha, Beta, Gamma)) is {deferred}",
+        f"alpha = Alpha.model_validate({ALPHA!r})",
+        "assert alpha.beta.gammas[0].alpha.name == 'inner'",
+        f"assert Delta.model_validate({{'alpha': {ALPHA!r}}}).alpha == alpha",
+        f"assert AlphaArray.model_validate([{ALPHA!r}]).root == [alpha]",
+        "for model in (Alpha, Beta, Gamma, Delta, AlphaArray): model.model_rebuild()",
+        "assert all(model.__pydantic_complete__ for model in (Alpha, Beta, Gamma, Delta, AlphaArray))",
+    ])
+    subprocess.run([sys.executable, "-c", check], check=True, cwd=base)